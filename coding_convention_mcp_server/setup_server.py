@@ -5,20 +5,71 @@ Designed to be run by an AI agent to automate server setup.
 """
 
 import argparse
+import contextlib
+import functools
+import io
 import os
-import platform
-import shutil
-import subprocess
 import sys
+import threading
 from pathlib import Path
 
+_ENV_CONFIG_TEMPLATE = """# Coding Convention MCP Server Configuration
 
-def run_command(cmd, cwd=None, check=True):
-    """Run a shell command and return result."""
-    print(f"Running: {cmd}")
+# Storage settings
+CODING_CONVENTION_STORAGE_PATH=~/.local/share/coding_convention_mcp_server
+CODING_CONVENTION_STORAGE_TYPE=sqlite  # sqlite or json
+CODING_CONVENTION_ANALYSIS_DEPTH=100
+"""
+
+_OPENCODE_TEMPLATE = """{{
+  "$schema": "https://opencode.ai/config.json",
+  "mcp": {{
+    "coding-convention": {{
+      "type": "local",
+      "command": [
+        "{server_path}"
+      ],
+      "environment": {{
+        "CODING_CONVENTION_STORAGE_PATH": "~/.local/share/coding_convention_mcp_server",
+        "CODING_CONVENTION_STORAGE_TYPE": "sqlite",
+        "CODING_CONVENTION_ANALYSIS_DEPTH": "100"
+      }},
+      "enabled": true
+    }}
+  }}
+}}
+"""
+
+_BAR = "=" * 60
+
+
+def _banner(title):
+    """Print a section banner."""
+    print()
+    print(_BAR)
+    print(title)
+    print(_BAR)
+
+
+def run_command(cmd, cwd=None, check=True, stream=False):
+    """Run a command given as an argv list and return result.
+
+    With stream=True the child writes straight to the terminal instead of
+    having its output captured and printed afterwards.
+    """
+    import subprocess
+
+    print(f"Running: {' '.join(str(arg) for arg in cmd)}")
+    if stream:
+        result = subprocess.run(cmd, cwd=cwd, stdout=None, stderr=None)
+        if check and result.returncode != 0:
+            print(f"Error: command exited with status {result.returncode}")
+            return False
+        return result.returncode == 0
+    
     result = subprocess.run(
         cmd,
-        shell=True,
+        shell=False,
         cwd=cwd,
         capture_output=True,
         text=True
@@ -36,6 +87,103 @@ def run_command(cmd, cwd=None, check=True):
     return result.returncode == 0
 
 
+class _ThreadOutput(io.TextIOBase):
+    """Stdout stand-in that keeps each worker thread's output separate."""
+
+    def __init__(self, fallback):
+        self._fallback = fallback
+        self._local = threading.local()
+
+    def write(self, text):
+        buffer = getattr(self._local, "buffer", None)
+        return (self._fallback if buffer is None else buffer).write(text)
+
+    def capture(self, fn, *args):
+        """Run fn(*args), returning its result and everything it printed."""
+        self._local.buffer = io.StringIO()
+        try:
+            return fn(*args), self._local.buffer.getvalue()
+        finally:
+            self._local.buffer = None
+
+    @contextlib.contextmanager
+    def discard(self):
+        """Drop output written by the current thread inside the block."""
+        saved = getattr(self._local, "buffer", None)
+        self._local.buffer = io.StringIO()
+        try:
+            yield
+        finally:
+            self._local.buffer = saved
+
+
+def run_parallel_steps(steps):
+    """Run independent (title, fn, enabled, args) steps concurrently.
+
+    Each step's output is buffered and printed under its banner in order once
+    all steps have finished. Returns True only if every step succeeded.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    steps = [step for step in steps if step[2]]
+    output = _ThreadOutput(sys.stdout)
+    with contextlib.redirect_stdout(output), ThreadPoolExecutor(max_workers=3) as executor:
+        results = list(executor.map(lambda step: output.capture(step[1], *step[3]), steps))
+    
+    success = True
+    for (title, _, _, _), (result, text) in zip(steps, results):
+        _banner(title)
+        print(text, end="")
+        success = success and result
+    return success
+
+
+@functools.cache
+def _exists(path):
+    """Return whether a path exists, caching the result for the setup run."""
+    return Path(path).exists()
+
+
+def _create_private_file(path, content):
+    """Create path with mode 0600 and write content to it.
+
+    Returns False without touching the file if it already exists.
+    """
+    try:
+        fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+    except FileExistsError:
+        return False
+    with os.fdopen(fd, "w") as f:
+        f.write(content)
+    return True
+
+
+@functools.lru_cache(maxsize=1)
+def _opencode_dir():
+    """Return the OpenCode config directory, looked up on first use."""
+    return Path.home() / ".config" / "opencode"
+
+
+@functools.lru_cache(maxsize=1)
+def _is_windows():
+    """Return whether we are running on Windows (computed once)."""
+    import platform
+
+    return platform.system() == "Windows"
+
+
+def _venv_bin(venv_path, name):
+    """Return the path of an executable inside the virtual environment."""
+    if _is_windows():
+        return venv_path / "Scripts" / f"{name}.exe"
+    return venv_path / "bin" / name
+
+
+def _server_exe(venv_path):
+    """Return the path of the installed server executable."""
+    return _venv_bin(venv_path, "coding-convention-mcp-server")
+
+
 def check_python_version():
     """Check Python version >= 3.10."""
     version = sys.version_info
@@ -48,21 +196,24 @@ def check_python_version():
 
 def create_venv(venv_path=".venv"):
     """Create virtual environment."""
-    if venv_path.exists():
+    if _exists(venv_path):
         print(f"Virtual environment already exists at {venv_path}")
         return True
     
+    import venv
+
     print(f"Creating virtual environment at {venv_path}")
-    if not run_command(f"python3 -m venv {venv_path}"):
+    try:
+        venv.EnvBuilder(with_pip=True).create(venv_path)
+    except Exception as e:
+        print(f"Error: {e}")
         return False
+    _exists.cache_clear()
     
     # Verify venv creation
-    if platform.system() == "Windows":
-        python_exe = venv_path / "Scripts" / "python.exe"
-    else:
-        python_exe = venv_path / "bin" / "python"
+    python_exe = _venv_bin(venv_path, "python")
     
-    if not python_exe.exists():
+    if not _exists(python_exe):
         print(f"Error: Python executable not found at {python_exe}")
         return False
     
@@ -72,22 +223,17 @@ def create_venv(venv_path=".venv"):
 
 def install_package(venv_path=".venv"):
     """Install the package in development mode."""
-    if platform.system() == "Windows":
-        pip = venv_path / "Scripts" / "pip.exe"
-    else:
-        pip = venv_path / "bin" / "pip"
+    python_exe = _venv_bin(venv_path, "python")
     
     print("Installing package in development mode...")
-    if not run_command(f"{pip} install -e ."):
+    if not run_command([str(python_exe), "-m", "pip", "install", "-e", "."], stream=True):
         return False
+    _exists.cache_clear()
     
     # Verify installation
-    if platform.system() == "Windows":
-        server = venv_path / "Scripts" / "coding-convention-mcp-server.exe"
-    else:
-        server = venv_path / "bin" / "coding-convention-mcp-server"
+    server = _server_exe(venv_path)
     
-    if not server.exists():
+    if not _exists(server):
         print(f"Error: Server executable not found at {server}")
         return False
     
@@ -97,48 +243,86 @@ def install_package(venv_path=".venv"):
 
 def create_config_files(repo_path):
     """Create configuration files."""
-    config_dir = Path.home() / ".config" / "opencode"
+    config_dir = _opencode_dir()
     config_dir.mkdir(parents=True, exist_ok=True)
     
     # Create environment config
     env_config = config_dir / ".coding_convention_env"
-    if not env_config.exists():
-        env_content = """# Coding Convention MCP Server Configuration
-
-# Storage settings
-CODING_CONVENTION_STORAGE_PATH=~/.local/share/coding_convention_mcp_server
-CODING_CONVENTION_STORAGE_TYPE=sqlite  # sqlite or json
-CODING_CONVENTION_ANALYSIS_DEPTH=100
-"""
-        env_config.write_text(env_content)
-        env_config.chmod(0o600)
+    if _create_private_file(env_config, _ENV_CONFIG_TEMPLATE):
         print(f"Created environment config: {env_config}")
     else:
         print(f"Environment config already exists: {env_config}")
     
     # Create OpenCode config example
     example_config = repo_path / "opencode.jsonc.example"
-    if example_config.exists():
+    if _exists(example_config):
         print(f"OpenCode config example: {example_config}")
     
     # Create Claude Desktop config example
     claude_config = repo_path / "claude_desktop_config.json"
-    if claude_config.exists():
+    if _exists(claude_config):
         print(f"Claude Desktop config: {claude_config}")
     
     return True
 
 
-def test_server(venv_path=".venv"):
-    """Test that the server starts correctly."""
-    if platform.system() == "Windows":
-        server = venv_path / "Scripts" / "coding-convention-mcp-server.exe"
+def _run_help_in_process(server):
+    """Run the server's --help path in this interpreter.
+
+    Returns None unless this interpreter runs from the virtual environment the
+    server executable belongs to and can import its entry point, so the caller
+    can fall back to spawning the executable.
+    """
+    venv_path = Path(server).resolve().parent.parent
+    if Path(sys.prefix).resolve() != venv_path:
+        return None
+
+    try:
+        from importlib.metadata import entry_points
+
+        (entry_point,) = entry_points(
+            group="console_scripts", name="coding-convention-mcp-server"
+        )
+        server_main = entry_point.load()
+    except Exception:
+        return None
+
+    if isinstance(sys.stdout, _ThreadOutput):
+        quiet = sys.stdout.discard()
     else:
-        server = venv_path / "bin" / "coding-convention-mcp-server"
+        quiet = contextlib.redirect_stdout(io.StringIO())
+    
+    saved_argv = sys.argv
+    sys.argv = ["coding-convention-mcp-server", "--help"]
+    try:
+        with quiet:
+            server_main()
+    except SystemExit as e:
+        return e.code in (0, None)
+    except Exception as e:
+        print(f"Server test error: {e}")
+        return False
+    finally:
+        sys.argv = saved_argv
+    return True
+
+
+def test_server(server):
+    """Test that the server executable at the given path starts correctly."""
+    import subprocess
+
+    if not _exists(server):
+        print(f"Error: Server executable not found at {server}")
+        return False
     
     print("Testing server startup...")
     
-    # Try to run server with short timeout
+    in_process = _run_help_in_process(server)
+    if in_process is not None:
+        print("Server test successful" if in_process else "Server test failed")
+        return in_process
+    
+    # Fall back to running server with short timeout
     try:
         result = subprocess.run(
             [str(server), "--help"],
@@ -162,47 +346,20 @@ def test_server(venv_path=".venv"):
         return False
 
 
-def setup_openode_config(repo_path, venv_path=".venv"):
-    """Setup OpenCode configuration with correct paths."""
-    config_path = Path.home() / ".config" / "opencode" / "opencode.jsonc"
-    
-    # Determine server path
-    if platform.system() == "Windows":
-        server_exe = venv_path / "Scripts" / "coding-convention-mcp-server.exe"
-    else:
-        server_exe = venv_path / "bin" / "coding-convention-mcp-server"
-    
-    server_path = server_exe.resolve()
+def setup_openode_config(repo_path, server_path):
+    """Setup OpenCode configuration pointing at the resolved server path."""
+    config_path = _opencode_dir() / "opencode.jsonc"
     
     # Create or update config
-    config_content = f"""{{
-  "$schema": "https://opencode.ai/config.json",
-  "mcp": {{
-    "coding-convention": {{
-      "type": "local",
-      "command": [
-        "{server_path}"
-      ],
-      "environment": {{
-        "CODING_CONVENTION_STORAGE_PATH": "~/.local/share/coding_convention_mcp_server",
-        "CODING_CONVENTION_STORAGE_TYPE": "sqlite",
-        "CODING_CONVENTION_ANALYSIS_DEPTH": "100"
-      }},
-      "enabled": true
-    }}
-  }}
-}}
-"""
+    config_content = _OPENCODE_TEMPLATE.format(server_path=server_path)
     
-    if config_path.exists():
+    config_path.parent.mkdir(parents=True, exist_ok=True)
+    if _create_private_file(config_path, config_content):
+        print(f"Created OpenCode config at {config_path}")
+    else:
         print(f"OpenCode config already exists at {config_path}")
         print("You may need to merge the 'coding-convention' section manually")
         print(f"Server path: {server_path}")
-    else:
-        config_path.parent.mkdir(parents=True, exist_ok=True)
-        config_path.write_text(config_content)
-        config_path.chmod(0o600)
-        print(f"Created OpenCode config at {config_path}")
     
     return True
 
@@ -224,61 +381,38 @@ def main():
     
     # Change to repo directory
     os.chdir(repo_path)
-    
-    # Step 1: Check Python version
-    print("\n" + "="*60)
-    print("Step 1: Checking Python version")
-    print("="*60)
-    if not check_python_version():
-        return 1
-    
-    # Step 2: Create virtual environment
-    if not args.skip_venv:
-        print("\n" + "="*60)
-        print("Step 2: Creating virtual environment")
-        print("="*60)
-        venv_path = Path(args.venv_path)
-        if not create_venv(venv_path):
-            return 1
-    
-    # Step 3: Install package
-    if not args.skip_install:
-        print("\n" + "="*60)
-        print("Step 3: Installing package")
-        print("="*60)
-        venv_path = Path(args.venv_path)
-        if not install_package(venv_path):
+    venv_path = Path(args.venv_path)
+    
+    setup_steps = [
+        ("Step 1: Checking Python version", check_python_version, True, ()),
+        ("Step 2: Creating virtual environment", create_venv, not args.skip_venv, (venv_path,)),
+        ("Step 3: Installing package", install_package, not args.skip_install, (venv_path,)),
+    ]
+    for title, fn, enabled, fargs in setup_steps:
+        if not enabled:
+            continue
+        _banner(title)
+        if not fn(*fargs):
             return 1
     
-    # Step 4: Create configuration files
-    if not args.skip_config:
-        print("\n" + "="*60)
-        print("Step 4: Creating configuration files")
-        print("="*60)
-        if not create_config_files(repo_path):
-            return 1
-    
-    # Step 5: Setup OpenCode config (optional)
-    if args.setup_opencode:
-        print("\n" + "="*60)
-        print("Step 5: Setting up OpenCode configuration")
-        print("="*60)
-        venv_path = Path(args.venv_path)
-        if not setup_openode_config(repo_path, venv_path):
-            return 1
-    
-    # Step 6: Test server
-    if not args.skip_test:
-        print("\n" + "="*60)
-        print("Step 6: Testing server")
-        print("="*60)
-        venv_path = Path(args.venv_path)
-        if not test_server(venv_path):
-            return 1
+    # Resolve the server executable once for the steps that need it
+    try:
+        server_exe = _server_exe(venv_path).resolve(strict=True)
+    except FileNotFoundError:
+        server_exe = _server_exe(venv_path).resolve()
+    
+    # Steps 4-6 are independent once the package is installed
+    post_install_steps = [
+        ("Step 4: Creating configuration files", create_config_files,
+         not args.skip_config, (repo_path,)),
+        ("Step 5: Setting up OpenCode configuration", setup_openode_config,
+         args.setup_opencode, (repo_path, server_exe)),
+        ("Step 6: Testing server", test_server, not args.skip_test, (server_exe,)),
+    ]
+    if not run_parallel_steps(post_install_steps):
+        return 1
     
-    print("\n" + "="*60)
-    print("Setup completed successfully!")
-    print("="*60)
+    _banner("Setup completed successfully!")
     print("\nNext steps:")
     print("1. Restart OpenCode to load the MCP server")
     print("2. Test with: track_coding_convention(...)")
@@ -0,0 +1,124 @@
+"""Persistent per-file analysis cache keyed by content hash."""
+
+import dataclasses
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+from .config import get_settings
+from .models import (
+    CodeConventionLite,
+    ConventionCategory,
+    ConventionSeverity,
+    ProgrammingLanguage,
+)
+
+logger = logging.getLogger(__name__)
+
+# Bump whenever analyzer rules change so stale results are not reused
+CACHE_VERSION = b"5"
+
+# Oldest entries beyond this many are evicted after each write
+MAX_ENTRIES = 50_000
+
+# One connection per process, tagged with the pid that opened it: forked pool
+# workers inherit the parent's module state and must not reuse its handle
+_connection: sqlite3.Connection | None = None
+_connection_pid: int | None = None
+_lock = threading.RLock()
+
+
+def _get_connection() -> sqlite3.Connection:
+    """Open (once per process) the cache database."""
+    global _connection, _connection_pid
+    with _lock:
+        if _connection is None or _connection_pid != os.getpid():
+            storage_dir = Path(get_settings().storage_path).expanduser()
+            storage_dir.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(str(storage_dir / "analysis_cache.db"), check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS file_conv "
+                "(hash BLOB PRIMARY KEY, conv_json TEXT NOT NULL)"
+            )
+            conn.commit()
+            _connection = conn
+            _connection_pid = os.getpid()
+        return _connection
+
+
+def file_key(language: ProgrammingLanguage, data: bytes) -> bytes:
+    """Return the cache key for a file's language and raw content.
+
+    The path is left out so that fresh clones of a repository, which land in a
+    new temp directory each time, still hit; callers fill in the source path.
+    """
+    digest = hashlib.sha256(CACHE_VERSION)
+    digest.update(language.value.encode())
+    digest.update(b"\0")
+    digest.update(data)
+    return digest.digest()
+
+
+def _from_dict(item: dict[str, Any]) -> CodeConventionLite:
+    """Rebuild a cached convention from its JSON form."""
+    item["language"] = ProgrammingLanguage(item["language"])
+    item["category"] = ConventionCategory(item["category"])
+    item["severity"] = ConventionSeverity(item["severity"])
+    item["created_at"] = datetime.fromisoformat(item["created_at"])
+    item["updated_at"] = datetime.fromisoformat(item["updated_at"])
+    return CodeConventionLite(**item)
+
+
+def get(key: bytes) -> list[CodeConventionLite] | None:
+    """Return cached conventions for key, or None on a miss."""
+    try:
+        # The connection is shared with put_many on other threads
+        with _lock:
+            row = (
+                _get_connection()
+                .execute("SELECT conv_json FROM file_conv WHERE hash = ?", (key,))
+                .fetchone()
+            )
+    except sqlite3.Error as e:
+        logger.debug(f"Analysis cache lookup failed: {e}")
+        return None
+
+    if row is None:
+        return None
+    return [_from_dict(item) for item in json.loads(row[0])]
+
+
+def put_many(entries: list[tuple[bytes, list[CodeConventionLite]]]) -> None:
+    """Store conventions for each key in one transaction, ignoring write failures."""
+    if not entries:
+        return
+    rows = [
+        (
+            key,
+            json.dumps(
+                [dataclasses.asdict(conv) for conv in conventions], default=datetime.isoformat
+            ),
+        )
+        for key, conventions in entries
+    ]
+    try:
+        with _lock:
+            conn = _get_connection()
+            with conn:
+                conn.executemany(
+                    "INSERT OR REPLACE INTO file_conv (hash, conv_json) VALUES (?, ?)", rows
+                )
+                # REPLACE re-inserts, so rowid order is write order
+                conn.execute(
+                    "DELETE FROM file_conv WHERE rowid <= (SELECT MAX(rowid) FROM file_conv) - ?",
+                    (MAX_ENTRIES,),
+                )
+    except sqlite3.Error as e:
+        logger.debug(f"Analysis cache write failed: {e}")
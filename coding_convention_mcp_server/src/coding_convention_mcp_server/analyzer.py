@@ -1,18 +1,470 @@
 """Repository analysis for extracting coding conventions."""
 
 import ast
+import hashlib
 import logging
+import os
 import re
 import subprocess
 import tempfile
+import threading
+from collections import Counter
+from collections.abc import Iterator
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
-from typing import Any
-
-from .models import CodeConvention, ConventionCategory, ConventionSeverity, ProgrammingLanguage
+from typing import Any, AnyStr
+
+from . import _cache
+from .models import (
+    CodeConvention,
+    CodeConventionLite,
+    ConventionCategory,
+    ConventionSeverity,
+    ProgrammingLanguage,
+    make_convention_id,
+)
 from .storage import get_storage
 
 logger = logging.getLogger(__name__)
 
+# Below this many files the process pool costs more than it saves
+_PARALLEL_MIN_FILES = 16
+
+# Serializes convention writes across analyzers running on different threads
+_STORAGE_LOCK = threading.Lock()
+
+# Larger files are almost always generated or minified; skip them
+MAX_FILE_BYTES = 1024 * 1024
+
+# File extensions for each language
+LANGUAGE_EXTENSIONS: dict[ProgrammingLanguage, tuple[str, ...]] = {
+    ProgrammingLanguage.PYTHON: (".py",),
+    ProgrammingLanguage.JAVASCRIPT: (".js", ".jsx"),
+    ProgrammingLanguage.TYPESCRIPT: (".ts", ".tsx"),
+    ProgrammingLanguage.JAVA: (".java",),
+    ProgrammingLanguage.GO: (".go",),
+    ProgrammingLanguage.RUST: (".rs",),
+    ProgrammingLanguage.CPP: (".cpp", ".cc", ".cxx", ".h", ".hpp"),
+    ProgrammingLanguage.CSHARP: (".cs",),
+    ProgrammingLanguage.RUBY: (".rb",),
+    ProgrammingLanguage.PHP: (".php",),
+    ProgrammingLanguage.SWIFT: (".swift",),
+    ProgrammingLanguage.KOTLIN: (".kt", ".kts"),
+    ProgrammingLanguage.SCALA: (".scala",),
+    ProgrammingLanguage.DART: (".dart",),
+}
+
+EXT_TO_LANG: dict[str, ProgrammingLanguage] = {
+    ext: lang for lang, exts in LANGUAGE_EXTENSIONS.items() for ext in exts
+}
+
+# Convention detection patterns, compiled once
+_PY_TYPE_HINT = re.compile(r"def \w+\([^)]*\) -> [^:]+:")
+_PY_SNAKE = re.compile(r"def ([a-z][a-z0-9_]*)\(")
+_JS_CAMEL = re.compile(r"function ([a-z][a-zA-Z0-9]*)\(")
+_JAVA_CLASS = re.compile(r"class ([A-Z][a-zA-Z0-9]*)")
+_GO_FUNC = re.compile(r"func ([a-z][a-zA-Z0-9]*)")
+
+# Every JavaScript marker in one zero-width alternation so a single pass over
+# the source finds them all; lookahead keeps overlapping markers visible
+_JS_TOKENS = re.compile(
+    rb"(?=(?P<var>var )|(?P<const_let>const |let )|(?P<strict_eq> === )|(?P<loose_eq> == )"
+    rb"|(?P<camel_func>function [a-z][a-zA-Z0-9]*\())"
+)
+
+# Line classification by last non-blank byte, so the semicolon-style check runs
+# inside the regex engine instead of a Python loop over lines. Kept separate
+# from _JS_TOKENS because bare_line and var/let/const can start at one offset.
+_JS_LINE_STYLE = re.compile(
+    rb"(?=(?P<semicolon_line>;[ \t\r\x0b\x0c]*$)"
+    rb"|(?P<bare_line>^(?![ \t\r\x0b\x0c]*(?://|/\*|\*|\#))[^\n]*[^;\s][ \t\r\x0b\x0c]*$))",
+    re.MULTILINE,
+)
+
+
+def _scan_tokens(pattern: re.Pattern[AnyStr], content: AnyStr) -> set[str]:
+    """Return the names of the pattern's groups that match anywhere in content."""
+    found: set[str] = set()
+    wanted = len(pattern.groupindex)
+    for match in pattern.finditer(content):
+        found.add(match.lastgroup)
+        if len(found) == wanted:
+            break
+    return found
+
+
+# Weight of each severity in the compliance score
+_SEVERITY_WEIGHTS: dict[ConventionSeverity, float] = {
+    ConventionSeverity.REQUIRED: 1.0,
+    ConventionSeverity.RECOMMENDED: 0.7,
+    ConventionSeverity.SUGGESTED: 0.4,
+    ConventionSeverity.OPTIONAL: 0.1,
+}
+
+# Sparse-checkout patterns covering every analyzable extension
+_SPARSE_PATTERNS = tuple(f"*{ext}" for ext in EXT_TO_LANG)
+
+
+def _ext_of(name: str) -> str:
+    """Return the lowercased extension of a file name, dot included."""
+    i = name.rfind(".")
+    return name[i:].lower() if i >= 0 else ""
+
+
+# Vendored, generated and tool directories, pruned without descending into them
+_SKIP_DIRS = frozenset(
+    {
+        ".git",
+        ".mypy_cache",
+        ".pytest_cache",
+        ".tox",
+        ".venv",
+        "__pycache__",
+        "build",
+        "dist",
+        "node_modules",
+        "target",
+        "vendor",
+        "venv",
+    }
+)
+
+
+def _walk_source_files(dir_path: str) -> Iterator[tuple[str, ProgrammingLanguage]]:
+    """Walk dir_path once, yielding source files and their language."""
+    try:
+        entries = list(os.scandir(dir_path))
+    except OSError as e:
+        logger.warning(f"Cannot read directory {dir_path}: {e}")
+        return
+
+    for entry in entries:
+        if entry.is_dir(follow_symlinks=False):
+            if entry.name not in _SKIP_DIRS:
+                yield from _walk_source_files(entry.path)
+            continue
+
+        lang = EXT_TO_LANG.get(_ext_of(entry.name))
+        if lang is not None and entry.is_file():
+            yield entry.path, lang
+
+
+def _run_git(*args: str) -> subprocess.CompletedProcess[str]:
+    """Run a git command, capturing its output."""
+    return subprocess.run(["git", *args], capture_output=True, text=True)
+
+
+def _decode(data: bytes) -> str:
+    """Decode file content, dropping undecodable bytes."""
+    return data.decode("utf-8", errors="ignore")
+
+
+def _read_source(file_path: Path) -> bytes | None:
+    """Read a source file, or return None if it is too large, empty or binary."""
+    if file_path.stat().st_size > MAX_FILE_BYTES:
+        logger.debug(f"Skipping large file {file_path}")
+        return None
+
+    with file_path.open("rb") as f:
+        data = f.read()
+    # Nothing to learn from empty files, and NUL bytes mean binary content
+    if b"\x00" in data or not data.strip():
+        return None
+    return data
+
+
+def _analyze_source(
+    data: bytes, path_str: str, language: ProgrammingLanguage
+) -> list[CodeConventionLite]:
+    """Analyze a single file's content for coding conventions."""
+    conventions = []
+    # Only decode for analyzers that need text; the JavaScript one scans bytes
+    if language == ProgrammingLanguage.PYTHON:
+        conventions.extend(_analyze_python(_decode(data), path_str))
+    elif language in [ProgrammingLanguage.JAVASCRIPT, ProgrammingLanguage.TYPESCRIPT]:
+        conventions.extend(_analyze_javascript(data, path_str))
+    elif language == ProgrammingLanguage.JAVA:
+        conventions.extend(_analyze_java(_decode(data), path_str))
+    elif language == ProgrammingLanguage.GO:
+        conventions.extend(_analyze_go(_decode(data), path_str))
+    # Add more language analyzers as needed
+    return conventions
+
+
+def _iter_declarations(tree: ast.Module) -> Iterator[ast.AST]:
+    """Yield the module, its top-level defs and class members.
+
+    Function bodies are never entered; none of the Python rules look inside them.
+    """
+    yield tree
+    for node in ast.iter_child_nodes(tree):
+        if isinstance(node, ast.ClassDef):
+            yield node
+            yield from ast.iter_child_nodes(node)
+        elif isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            yield node
+
+
+def _analyze_python(content: str, file_path: str) -> list[CodeConventionLite]:
+    """Analyze Python code for conventions."""
+    conventions = []
+
+    try:
+        tree = ast.parse(content, type_comments=False)
+    except SyntaxError:
+        # Skip files with syntax errors
+        return conventions
+
+    # Gather every rule's evidence in one pass over the declarations
+    has_docstring = False
+    has_type_hint = False
+    has_snake_case = False
+    for node in _iter_declarations(tree):
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef, ast.Module)):
+            if not has_docstring and ast.get_docstring(node) is not None:
+                has_docstring = True
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            if node.returns is not None:
+                has_type_hint = True
+            if node.name[:1].islower() and node.name.islower():
+                has_snake_case = True
+
+    # Imports after any other top-level statement (the docstring aside)
+    late_import = False
+    seen_code = False
+    for index, stmt in enumerate(tree.body):
+        if isinstance(stmt, (ast.Import, ast.ImportFrom)):
+            late_import = late_import or seen_code
+        elif not (
+            index == 0
+            and isinstance(stmt, ast.Expr)
+            and isinstance(stmt.value, ast.Constant)
+            and isinstance(stmt.value.value, str)
+        ):
+            seen_code = True
+
+    # Check for docstrings
+    if has_docstring:
+        conventions.append(
+            _create_convention(
+                language=ProgrammingLanguage.PYTHON,
+                category=ConventionCategory.DOCUMENTATION,
+                description="Functions and classes should have docstrings",
+                pattern=r'""".*?"""|\'\'\'.*?\'\'\'',
+                severity=ConventionSeverity.RECOMMENDED,
+                source_repository=file_path,
+            )
+        )
+
+    # Check for type hints
+    if has_type_hint:
+        conventions.append(
+            _create_convention(
+                language=ProgrammingLanguage.PYTHON,
+                category=ConventionCategory.DOCUMENTATION,
+                description="Functions should have return type hints",
+                pattern=_PY_TYPE_HINT.pattern,
+                severity=ConventionSeverity.RECOMMENDED,
+                source_repository=file_path,
+            )
+        )
+
+    # Check for snake_case naming
+    if has_snake_case:
+        conventions.append(
+            _create_convention(
+                language=ProgrammingLanguage.PYTHON,
+                category=ConventionCategory.NAMING,
+                description="Function names should use snake_case",
+                pattern=_PY_SNAKE.pattern,
+                severity=ConventionSeverity.REQUIRED,
+                source_repository=file_path,
+            )
+        )
+
+    # Check for imports at top
+    if late_import:
+        conventions.append(
+            _create_convention(
+                language=ProgrammingLanguage.PYTHON,
+                category=ConventionCategory.STRUCTURE,
+                description="Imports should be at the top of the file",
+                severity=ConventionSeverity.REQUIRED,
+                source_repository=file_path,
+            )
+        )
+
+    return conventions
+
+
+def _analyze_javascript(content: bytes, file_path: str) -> list[CodeConventionLite]:
+    """Analyze JavaScript/TypeScript source bytes for conventions."""
+    conventions = []
+
+    tokens = _scan_tokens(_JS_TOKENS, content) | _scan_tokens(_JS_LINE_STYLE, content)
+
+    # Check for const/let vs var
+    if "var" in tokens and "const_let" in tokens:
+        conventions.append(
+            _create_convention(
+                language=ProgrammingLanguage.JAVASCRIPT,
+                category=ConventionCategory.STRUCTURE,
+                description="Use const/let instead of var",
+                pattern=r"\bvar\b",
+                severity=ConventionSeverity.RECOMMENDED,
+                source_repository=file_path,
+            )
+        )
+
+    # Check for === vs ==
+    if "loose_eq" in tokens and "strict_eq" in tokens:
+        conventions.append(
+            _create_convention(
+                language=ProgrammingLanguage.JAVASCRIPT,
+                category=ConventionCategory.STRUCTURE,
+                description="Use strict equality (===) instead of loose equality (==)",
+                pattern=r"==",
+                severity=ConventionSeverity.RECOMMENDED,
+                source_repository=file_path,
+            )
+        )
+
+    # Check for camelCase naming
+    if "camel_func" in tokens:
+        conventions.append(
+            _create_convention(
+                language=ProgrammingLanguage.JAVASCRIPT,
+                category=ConventionCategory.NAMING,
+                description="Function names should use camelCase",
+                pattern=_JS_CAMEL.pattern,
+                severity=ConventionSeverity.REQUIRED,
+                source_repository=file_path,
+            )
+        )
+
+    # Check for semicolons
+    if "semicolon_line" in tokens and "bare_line" in tokens:
+        conventions.append(
+            _create_convention(
+                language=ProgrammingLanguage.JAVASCRIPT,
+                category=ConventionCategory.FORMATTING,
+                description="Be consistent with semicolon usage",
+                severity=ConventionSeverity.RECOMMENDED,
+                source_repository=file_path,
+            )
+        )
+
+    return conventions
+
+
+def _analyze_java(content: str, file_path: str) -> list[CodeConventionLite]:
+    """Analyze Java code for conventions."""
+    conventions = []
+
+    # Check for CamelCase class names
+    if _JAVA_CLASS.search(content):
+        conventions.append(
+            _create_convention(
+                language=ProgrammingLanguage.JAVA,
+                category=ConventionCategory.NAMING,
+                description="Class names should use PascalCase",
+                pattern=_JAVA_CLASS.pattern,
+                severity=ConventionSeverity.REQUIRED,
+                source_repository=file_path,
+            )
+        )
+
+    # Check for Javadoc comments
+    if "/**" in content:
+        conventions.append(
+            _create_convention(
+                language=ProgrammingLanguage.JAVA,
+                category=ConventionCategory.DOCUMENTATION,
+                description="Public methods should have Javadoc comments",
+                pattern=r"/\*\*.*?\*/",
+                severity=ConventionSeverity.RECOMMENDED,
+                source_repository=file_path,
+            )
+        )
+
+    return conventions
+
+
+def _analyze_go(content: str, file_path: str) -> list[CodeConventionLite]:
+    """Analyze Go code for conventions."""
+    conventions = []
+
+    # Check for error handling
+    if "err != nil" in content or "err == nil" in content:
+        conventions.append(
+            _create_convention(
+                language=ProgrammingLanguage.GO,
+                category=ConventionCategory.ERROR_HANDLING,
+                description="Check errors explicitly",
+                severity=ConventionSeverity.REQUIRED,
+                source_repository=file_path,
+            )
+        )
+
+    # Check for camelCase naming
+    if _GO_FUNC.search(content):
+        conventions.append(
+            _create_convention(
+                language=ProgrammingLanguage.GO,
+                category=ConventionCategory.NAMING,
+                description="Function names should use camelCase",
+                pattern=_GO_FUNC.pattern,
+                severity=ConventionSeverity.REQUIRED,
+                source_repository=file_path,
+            )
+        )
+
+    return conventions
+
+
+def _create_convention(
+    language: ProgrammingLanguage,
+    category: ConventionCategory,
+    description: str,
+    pattern: str | None = None,
+    severity: ConventionSeverity = ConventionSeverity.RECOMMENDED,
+    source_repository: str | None = None,
+) -> CodeConventionLite:
+    """Create a CodeConventionLite object with generated ID."""
+    return CodeConventionLite(
+        id=make_convention_id(language, category, description),
+        language=language,
+        category=category,
+        severity=severity,
+        pattern=pattern,
+        description=description,
+        source_repository=source_repository,
+        confidence=0.7,  # Initial confidence
+    )
+
+
+def _similarity_key(convention: CodeConvention | CodeConventionLite) -> tuple[str, str, str]:
+    """Key under which two conventions count as the same rule."""
+    return (
+        convention.language.value,
+        convention.category.value,
+        convention.description.lower(),
+    )
+
+
+def _analyze_source_worker(task: tuple[str, str, bytes]) -> list[CodeConventionLite] | None:
+    """Process-pool entry point: analyze ``(path, language value, content)``.
+
+    Returns None if the analysis failed. Workers never touch the analysis
+    cache: the pool can fork while another thread holds its lock.
+    """
+    path_str, lang_value, data = task
+    try:
+        return _analyze_source(data, path_str, ProgrammingLanguage(lang_value))
+    except Exception as e:
+        logger.warning(f"Error analyzing file {path_str}: {e}")
+        return None
+
 
 class RepositoryAnalyzer:
     """Analyze repositories to extract coding conventions."""
@@ -31,20 +483,59 @@ class RepositoryAnalyzer:
         else:
             return self._analyze_local_dir(repository_path)
 
+    def fingerprint(self, repository_path: str) -> str | None:
+        """Cheaply identify the repository state an analysis would see.
+
+        Git URLs use the remote HEAD commit; local directories hash the path,
+        size and mtime of every source file. Returns None when unknown.
+        """
+        digest = hashlib.blake2b(f"{repository_path}\0{self.max_files}".encode(), digest_size=16)
+
+        if self._is_git_url(repository_path):
+            result = _run_git("ls-remote", repository_path, "HEAD")
+            if result.returncode != 0 or not result.stdout:
+                return None
+            digest.update(result.stdout.split(maxsplit=1)[0].encode())
+            return digest.hexdigest()
+
+        if not os.path.isdir(repository_path):
+            return None
+        try:
+            for path, _ in sorted(_walk_source_files(repository_path)):
+                stat = os.stat(path)
+                digest.update(f"{path}\0{stat.st_size}\0{stat.st_mtime_ns}\n".encode())
+        except OSError:
+            return None
+        return digest.hexdigest()
+
     def _is_git_url(self, path: str) -> bool:
         """Check if path looks like a Git URL."""
         return path.startswith(("http://", "https://", "git://", "git@"))
 
+    def analyze_many(self, repository_paths: list[str]) -> list[dict[str, Any]]:
+        """Analyze several repositories concurrently, returning results in order.
+
+        Work is dominated by git clones and the per-file process pool, so a small
+        thread pool is enough to overlap them.
+        """
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            return list(executor.map(self.analyze, repository_paths))
+
     def _analyze_git_repo(self, git_url: str) -> dict[str, Any]:
         """Clone and analyze a Git repository."""
         with tempfile.TemporaryDirectory() as temp_dir:
             try:
-                # Clone repository
+                # Clone without blobs, then check out only files we can analyze
                 logger.info(f"Cloning repository: {git_url}")
-                result = subprocess.run(
-                    ["git", "clone", "--depth", "1", git_url, temp_dir],
-                    capture_output=True,
-                    text=True,
+                result = _run_git(
+                    "clone",
+                    "--depth",
+                    "1",
+                    "--filter=blob:none",
+                    "--no-checkout",
+                    "--single-branch",
+                    git_url,
+                    temp_dir,
                 )
 
                 if result.returncode != 0:
@@ -55,6 +546,22 @@ class RepositoryAnalyzer:
                         "file_count": 0,
                     }
 
+                result = _run_git(
+                    "-C", temp_dir, "sparse-checkout", "set", "--no-cone", *_SPARSE_PATTERNS
+                )
+                if result.returncode != 0:
+                    # Older git without --no-cone: fall back to a full checkout
+                    logger.debug(f"Sparse checkout unavailable: {result.stderr}")
+
+                result = _run_git("-C", temp_dir, "checkout")
+                if result.returncode != 0:
+                    return {
+                        "error": f"Failed to check out repository: {result.stderr}",
+                        "conventions": [],
+                        "languages": [],
+                        "file_count": 0,
+                    }
+
                 return self._analyze_local_dir(temp_dir, original_url=git_url)
 
             except Exception as e:
@@ -84,49 +591,93 @@ class RepositoryAnalyzer:
                 "file_count": 0,
             }
 
-        # Analyze files
-        conventions = []
+        # Analyze files. Reads and cache lookups happen here; only cache misses
+        # are handed to the analyzers, in file order
         detected_languages: set[ProgrammingLanguage] = set()
+        file_results: list[list[CodeConventionLite]] = []
+        misses: list[tuple[int, bytes]] = []
+        tasks: list[tuple[str, str, bytes]] = []
 
-        for file_path in source_files[: self.max_files]:
-            lang = self._detect_language(file_path)
-            if lang == ProgrammingLanguage.UNKNOWN:
+        for file_path, lang in source_files[: self.max_files]:
+            detected_languages.add(lang)
+            try:
+                data = _read_source(Path(file_path))
+            except OSError as e:
+                logger.warning(f"Error reading file {file_path}: {e}")
+                continue
+            if data is None:
                 continue
 
-            detected_languages.add(lang)
-            file_conventions = self._analyze_file(file_path, lang)
-            conventions.extend(file_conventions)
+            cache_key = _cache.file_key(lang, data)
+            cached = _cache.get(cache_key)
+            if cached is not None:
+                for conv in cached:
+                    conv.source_repository = file_path
+                file_results.append(cached)
+                continue
+            misses.append((len(file_results), cache_key))
+            tasks.append((file_path, lang.value, data))
+            file_results.append([])
+
+        if len(tasks) < _PARALLEL_MIN_FILES:
+            results = list(map(_analyze_source_worker, tasks))
+        else:
+            with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+                results = list(executor.map(_analyze_source_worker, tasks, chunksize=8))
+
+        cache_entries: list[tuple[bytes, list[CodeConventionLite]]] = []
+        for (index, cache_key), file_conventions in zip(misses, results):
+            if file_conventions is not None:
+                file_results[index] = file_conventions
+                cache_entries.append((cache_key, file_conventions))
+        # Only this process writes the cache, in a single transaction
+        _cache.put_many(cache_entries)
+        conventions = [conv for file_conventions in file_results for conv in file_conventions]
 
         # Deduplicate and score conventions
         unique_conventions = self._deduplicate_conventions(conventions)
 
-        # Store conventions
+        # Store conventions (serialized: analyses may run on several threads)
         convention_ids = []
-        for conv in unique_conventions:
-            if original_url:
-                conv.source_repository = original_url
-
-            # Check if similar convention already exists
-            existing = self._find_similar_convention(conv)
-            if existing:
-                # Update confidence
-                updates = {
-                    "confidence": min(1.0, existing.confidence + 0.1),
-                    "source_repository": original_url or existing.source_repository,
-                }
-                self.storage.update_convention(existing.id, updates)
-                convention_ids.append(existing.id)
-            else:
-                self.storage.save_convention(conv)
-                convention_ids.append(conv.id)
+        new_conventions: list[CodeConvention] = []
+        with _STORAGE_LOCK, self.storage.write_batch():
+            # Index stored conventions once instead of querying per convention
+            index = {
+                _similarity_key(existing): existing
+                for existing in self.storage.get_conventions(limit=None)
+            }
+
+            for conv in unique_conventions:
+                if original_url:
+                    conv.source_repository = original_url
+
+                # Check if similar convention already exists
+                key = _similarity_key(conv)
+                existing = index.get(key)
+                if existing:
+                    # Update confidence
+                    updates = {
+                        "confidence": min(1.0, existing.confidence + 0.1),
+                        "source_repository": original_url or existing.source_repository,
+                    }
+                    self.storage.update_convention(existing.id, updates)
+                    index[key] = existing.model_copy(update=updates)
+                    convention_ids.append(existing.id)
+                else:
+                    model = conv.to_model()
+                    new_conventions.append(model)
+                    index[key] = model
+                    convention_ids.append(conv.id)
+
+            self.storage.save_conventions(new_conventions)
 
         # Calculate compliance score (simplified)
         compliance_score = self._calculate_compliance_score(unique_conventions)
 
         # Group conventions by category
-        category_summary: dict[ConventionCategory, int] = {}
-        for conv in unique_conventions:
-            category_summary[conv.category] = category_summary.get(conv.category, 0) + 1
+        category_summary: dict[ConventionCategory, int] = dict(
+            Counter(conv.category for conv in unique_conventions)
+        )
 
         return {
             "conventions": unique_conventions,
@@ -138,341 +689,17 @@ class RepositoryAnalyzer:
             "error": None,
         }
 
-    def _find_source_files(self, dir_path: Path) -> list[Path]:
-        """Find source code files in directory."""
-        source_files = []
-
-        # Define file extensions for each language
-        extensions = {
-            ProgrammingLanguage.PYTHON: [".py"],
-            ProgrammingLanguage.JAVASCRIPT: [".js", ".jsx"],
-            ProgrammingLanguage.TYPESCRIPT: [".ts", ".tsx"],
-            ProgrammingLanguage.JAVA: [".java"],
-            ProgrammingLanguage.GO: [".go"],
-            ProgrammingLanguage.RUST: [".rs"],
-            ProgrammingLanguage.CPP: [".cpp", ".cc", ".cxx", ".h", ".hpp"],
-            ProgrammingLanguage.CSHARP: [".cs"],
-            ProgrammingLanguage.RUBY: [".rb"],
-            ProgrammingLanguage.PHP: [".php"],
-            ProgrammingLanguage.SWIFT: [".swift"],
-            ProgrammingLanguage.KOTLIN: [".kt", ".kts"],
-            ProgrammingLanguage.SCALA: [".scala"],
-            ProgrammingLanguage.DART: [".dart"],
-        }
-
-        # Collect all extensions
-        all_extensions = []
-        for exts in extensions.values():
-            all_extensions.extend(exts)
-
-        # Walk directory
-        for ext in all_extensions:
-            for file in dir_path.rglob(f"*{ext}"):
-                if file.is_file():
-                    source_files.append(file)
-
-        return source_files
+    def _find_source_files(self, dir_path: Path) -> list[tuple[str, ProgrammingLanguage]]:
+        """Find source code files in directory, paired with their language."""
+        return list(_walk_source_files(str(dir_path)))
 
     def _detect_language(self, file_path: Path) -> ProgrammingLanguage:
         """Detect programming language from file extension."""
-        ext = file_path.suffix.lower()
-
-        language_map = {
-            ".py": ProgrammingLanguage.PYTHON,
-            ".js": ProgrammingLanguage.JAVASCRIPT,
-            ".jsx": ProgrammingLanguage.JAVASCRIPT,
-            ".ts": ProgrammingLanguage.TYPESCRIPT,
-            ".tsx": ProgrammingLanguage.TYPESCRIPT,
-            ".java": ProgrammingLanguage.JAVA,
-            ".go": ProgrammingLanguage.GO,
-            ".rs": ProgrammingLanguage.RUST,
-            ".cpp": ProgrammingLanguage.CPP,
-            ".cc": ProgrammingLanguage.CPP,
-            ".cxx": ProgrammingLanguage.CPP,
-            ".h": ProgrammingLanguage.CPP,
-            ".hpp": ProgrammingLanguage.CPP,
-            ".cs": ProgrammingLanguage.CSHARP,
-            ".rb": ProgrammingLanguage.RUBY,
-            ".php": ProgrammingLanguage.PHP,
-            ".swift": ProgrammingLanguage.SWIFT,
-            ".kt": ProgrammingLanguage.KOTLIN,
-            ".kts": ProgrammingLanguage.KOTLIN,
-            ".scala": ProgrammingLanguage.SCALA,
-            ".dart": ProgrammingLanguage.DART,
-        }
-
-        return language_map.get(ext, ProgrammingLanguage.UNKNOWN)
-
-    def _analyze_file(self, file_path: Path, language: ProgrammingLanguage) -> list[CodeConvention]:
-        """Analyze a single file for coding conventions."""
-        conventions = []
-
-        try:
-            content = file_path.read_text(encoding="utf-8", errors="ignore")
-
-            if language == ProgrammingLanguage.PYTHON:
-                conventions.extend(self._analyze_python(content, str(file_path)))
-            elif language in [ProgrammingLanguage.JAVASCRIPT, ProgrammingLanguage.TYPESCRIPT]:
-                conventions.extend(self._analyze_javascript(content, str(file_path)))
-            elif language == ProgrammingLanguage.JAVA:
-                conventions.extend(self._analyze_java(content, str(file_path)))
-            elif language == ProgrammingLanguage.GO:
-                conventions.extend(self._analyze_go(content, str(file_path)))
-            # Add more language analyzers as needed
-
-        except Exception as e:
-            logger.warning(f"Error analyzing file {file_path}: {e}")
-
-        return conventions
-
-    def _analyze_python(self, content: str, file_path: str) -> list[CodeConvention]:
-        """Analyze Python code for conventions."""
-        conventions = []
-
-        try:
-            tree = ast.parse(content)
-
-            # Check for docstrings
-            for node in ast.walk(tree):
-                if isinstance(node, (ast.FunctionDef, ast.ClassDef, ast.Module)):
-                    if ast.get_docstring(node) is not None:
-                        conventions.append(
-                            self._create_convention(
-                                language=ProgrammingLanguage.PYTHON,
-                                category=ConventionCategory.DOCUMENTATION,
-                                description="Functions and classes should have docstrings",
-                                pattern=r'""".*?"""|\'\'\'.*?\'\'\'',
-                                severity=ConventionSeverity.RECOMMENDED,
-                                source_repository=file_path,
-                            )
-                        )
-
-            # Check for type hints
-            type_hint_pattern = r"def \w+\([^)]*\) -> [^:]+:"
-            if re.search(type_hint_pattern, content):
-                conventions.append(
-                    self._create_convention(
-                        language=ProgrammingLanguage.PYTHON,
-                        category=ConventionCategory.DOCUMENTATION,
-                        description="Functions should have return type hints",
-                        pattern=type_hint_pattern,
-                        severity=ConventionSeverity.RECOMMENDED,
-                        source_repository=file_path,
-                    )
-                )
-
-            # Check for snake_case naming
-            snake_case_pattern = r"def ([a-z][a-z0-9_]*)\("
-            for match in re.finditer(snake_case_pattern, content):
-                conventions.append(
-                    self._create_convention(
-                        language=ProgrammingLanguage.PYTHON,
-                        category=ConventionCategory.NAMING,
-                        description="Function names should use snake_case",
-                        pattern=snake_case_pattern,
-                        severity=ConventionSeverity.REQUIRED,
-                        source_repository=file_path,
-                    )
-                )
-                break  # Only need one example
-
-            # Check for imports at top
-            import_lines = [
-                i
-                for i, line in enumerate(content.split("\n"))
-                if line.strip().startswith(("import ", "from "))
-            ]
-            if import_lines:
-                first_non_import = next(
-                    (
-                        i
-                        for i, line in enumerate(content.split("\n"))
-                        if line.strip()
-                        and not line.strip().startswith(("import ", "from ", "#", '"""'))
-                    ),
-                    0,
-                )
-                if first_non_import > 0 and any(i > first_non_import for i in import_lines):
-                    conventions.append(
-                        self._create_convention(
-                            language=ProgrammingLanguage.PYTHON,
-                            category=ConventionCategory.STRUCTURE,
-                            description="Imports should be at the top of the file",
-                            severity=ConventionSeverity.REQUIRED,
-                            source_repository=file_path,
-                        )
-                    )
-
-        except SyntaxError:
-            # Skip files with syntax errors
-            pass
-
-        return conventions
-
-    def _analyze_javascript(self, content: str, file_path: str) -> list[CodeConvention]:
-        """Analyze JavaScript/TypeScript code for conventions."""
-        conventions = []
-
-        # Check for const/let vs var
-        if "var " in content and ("const " in content or "let " in content):
-            conventions.append(
-                self._create_convention(
-                    language=ProgrammingLanguage.JAVASCRIPT,
-                    category=ConventionCategory.STRUCTURE,
-                    description="Use const/let instead of var",
-                    pattern=r"\bvar\b",
-                    severity=ConventionSeverity.RECOMMENDED,
-                    source_repository=file_path,
-                )
-            )
-
-        # Check for === vs ==
-        if " == " in content and " === " in content:
-            conventions.append(
-                self._create_convention(
-                    language=ProgrammingLanguage.JAVASCRIPT,
-                    category=ConventionCategory.STRUCTURE,
-                    description="Use strict equality (===) instead of loose equality (==)",
-                    pattern=r"==",
-                    severity=ConventionSeverity.RECOMMENDED,
-                    source_repository=file_path,
-                )
-            )
-
-        # Check for camelCase naming
-        camel_case_pattern = r"function ([a-z][a-zA-Z0-9]*)\("
-        for match in re.finditer(camel_case_pattern, content):
-            conventions.append(
-                self._create_convention(
-                    language=ProgrammingLanguage.JAVASCRIPT,
-                    category=ConventionCategory.NAMING,
-                    description="Function names should use camelCase",
-                    pattern=camel_case_pattern,
-                    severity=ConventionSeverity.REQUIRED,
-                    source_repository=file_path,
-                )
-            )
-            break
-
-        # Check for semicolons
-        lines = content.split("\n")
-        semicolon_lines = sum(1 for line in lines if line.strip().endswith(";"))
-        no_semicolon_lines = sum(
-            1
-            for line in lines
-            if line.strip()
-            and not line.strip().endswith(";")
-            and not line.strip().startswith(("//", "/*", "*", "#"))
-        )
-
-        if semicolon_lines > 0 and no_semicolon_lines > 0:
-            conventions.append(
-                self._create_convention(
-                    language=ProgrammingLanguage.JAVASCRIPT,
-                    category=ConventionCategory.FORMATTING,
-                    description="Be consistent with semicolon usage",
-                    severity=ConventionSeverity.RECOMMENDED,
-                    source_repository=file_path,
-                )
-            )
-
-        return conventions
-
-    def _analyze_java(self, content: str, file_path: str) -> list[CodeConvention]:
-        """Analyze Java code for conventions."""
-        conventions = []
-
-        # Check for CamelCase class names
-        class_pattern = r"class ([A-Z][a-zA-Z0-9]*)"
-        for match in re.finditer(class_pattern, content):
-            conventions.append(
-                self._create_convention(
-                    language=ProgrammingLanguage.JAVA,
-                    category=ConventionCategory.NAMING,
-                    description="Class names should use PascalCase",
-                    pattern=class_pattern,
-                    severity=ConventionSeverity.REQUIRED,
-                    source_repository=file_path,
-                )
-            )
-            break
-
-        # Check for Javadoc comments
-        if "/**" in content:
-            conventions.append(
-                self._create_convention(
-                    language=ProgrammingLanguage.JAVA,
-                    category=ConventionCategory.DOCUMENTATION,
-                    description="Public methods should have Javadoc comments",
-                    pattern=r"/\*\*.*?\*/",
-                    severity=ConventionSeverity.RECOMMENDED,
-                    source_repository=file_path,
-                )
-            )
-
-        return conventions
-
-    def _analyze_go(self, content: str, file_path: str) -> list[CodeConvention]:
-        """Analyze Go code for conventions."""
-        conventions = []
-
-        # Check for error handling
-        if "err != nil" in content or "err == nil" in content:
-            conventions.append(
-                self._create_convention(
-                    language=ProgrammingLanguage.GO,
-                    category=ConventionCategory.ERROR_HANDLING,
-                    description="Check errors explicitly",
-                    severity=ConventionSeverity.REQUIRED,
-                    source_repository=file_path,
-                )
-            )
-
-        # Check for camelCase naming
-        func_pattern = r"func ([a-z][a-zA-Z0-9]*)"
-        for match in re.finditer(func_pattern, content):
-            conventions.append(
-                self._create_convention(
-                    language=ProgrammingLanguage.GO,
-                    category=ConventionCategory.NAMING,
-                    description="Function names should use camelCase",
-                    pattern=func_pattern,
-                    severity=ConventionSeverity.REQUIRED,
-                    source_repository=file_path,
-                )
-            )
-            break
+        return EXT_TO_LANG.get(_ext_of(file_path.name), ProgrammingLanguage.UNKNOWN)
 
-        return conventions
-
-    def _create_convention(
-        self,
-        language: ProgrammingLanguage,
-        category: ConventionCategory,
-        description: str,
-        pattern: str | None = None,
-        severity: ConventionSeverity = ConventionSeverity.RECOMMENDED,
-        source_repository: str | None = None,
-    ) -> CodeConvention:
-        """Create a CodeConvention object with generated ID."""
-        import hashlib
-
-        # Generate ID from language, category, and description
-        id_base = f"{language.value}_{category.value}_{description}"
-        convention_id = hashlib.md5(id_base.encode()).hexdigest()[:16]
-
-        return CodeConvention(
-            id=convention_id,
-            language=language,
-            category=category,
-            severity=severity,
-            pattern=pattern,
-            description=description,
-            source_repository=source_repository,
-            confidence=0.7,  # Initial confidence
-        )
-
-    def _deduplicate_conventions(self, conventions: list[CodeConvention]) -> list[CodeConvention]:
+    def _deduplicate_conventions(
+        self, conventions: list[CodeConventionLite]
+    ) -> list[CodeConventionLite]:
         """Deduplicate conventions based on ID."""
         seen = set()
         unique = []
@@ -484,35 +711,14 @@ class RepositoryAnalyzer:
 
         return unique
 
-    def _find_similar_convention(self, convention: CodeConvention) -> CodeConvention | None:
-        """Find a similar convention in storage."""
-        # Look for conventions with same language and similar description
-        existing = self.storage.get_conventions(language=convention.language)
-
-        for existing_conv in existing:
-            # Simple similarity check: same language and category
-            if (
-                existing_conv.language == convention.language
-                and existing_conv.category == convention.category
-                and existing_conv.description.lower() == convention.description.lower()
-            ):
-                return existing_conv
-
-        return None
-
-    def _calculate_compliance_score(self, conventions: list[CodeConvention]) -> float:
+    def _calculate_compliance_score(self, conventions: list[CodeConventionLite]) -> float:
         """Calculate a compliance score based on convention severity."""
-        if not conventions:
-            return 0.0
-
-        severity_weights = {
-            ConventionSeverity.REQUIRED: 1.0,
-            ConventionSeverity.RECOMMENDED: 0.7,
-            ConventionSeverity.SUGGESTED: 0.4,
-            ConventionSeverity.OPTIONAL: 0.1,
-        }
-
-        total_weight = sum(severity_weights.get(conv.severity, 0.5) for conv in conventions)
-        max_weight = len(conventions) * 1.0
+        total_weight = 0.0
+        count = 0
+        for conv in conventions:
+            total_weight += _SEVERITY_WEIGHTS.get(conv.severity, 0.5)
+            count += 1
 
-        return total_weight / max_weight if max_weight > 0 else 0.0
+        if count == 0:
+            return 0.0
+        return total_weight / count
@@ -1,5 +1,6 @@
 """Configuration management for Coding Convention MCP Server."""
 
+import functools
 import os
 
 from pydantic import Field
@@ -27,19 +28,24 @@ class Settings(BaseSettings):
         env_file_encoding = "utf-8"
         env_prefix = "CODING_CONVENTION_"
 
-    def __init__(self, **kwargs):
-        # Load .env from the project root if not specified
-        if not os.path.exists(self.__class__.Config.env_file):
-            # Try to find .env in parent directories
-            current_dir = os.path.dirname(os.path.abspath(__file__))
-            # Go up: coding_convention_mcp_server/ -> src/ -> coding_convention_mcp_server/ (root)
-            project_root = os.path.abspath(os.path.join(current_dir, "../.."))
-            env_path = os.path.join(project_root, ".env")
-            if os.path.exists(env_path):
-                self.__class__.Config.env_file = env_path
-        super().__init__(**kwargs)
 
+def _resolve_env_file() -> str:
+    """Locate the .env file, preferring the working directory over the project root."""
+    if os.path.exists(".env"):
+        return ".env"
+    # Go up: coding_convention_mcp_server/ -> src/ -> coding_convention_mcp_server/ (root)
+    current_dir = os.path.dirname(os.path.abspath(__file__))
+    env_path = os.path.join(current_dir, "..", "..", ".env")
+    if os.path.exists(env_path):
+        return os.path.abspath(env_path)
+    return ".env"
 
+
+# Resolved once at import time
+_ENV_FILE = _resolve_env_file()
+
+
+@functools.lru_cache(maxsize=1)
 def get_settings() -> Settings:
-    """Get application settings, loading from environment."""
-    return Settings()
+    """Get application settings, loading from environment once per process."""
+    return Settings(_env_file=_ENV_FILE)
@@ -1,7 +1,11 @@
 """Data models for coding convention storage."""
 
+import dataclasses
+import hashlib
+import re
 from datetime import datetime
 from enum import Enum
+from functools import lru_cache
 from typing import Any
 
 from pydantic import BaseModel, Field
@@ -50,6 +54,41 @@ class ConventionSeverity(str, Enum):
     OPTIONAL = "optional"
 
 
+# Rank of each severity; higher is stricter
+SEVERITY_RANK: dict[ConventionSeverity, int] = {
+    ConventionSeverity.REQUIRED: 3,
+    ConventionSeverity.RECOMMENDED: 2,
+    ConventionSeverity.SUGGESTED: 1,
+    ConventionSeverity.OPTIONAL: 0,
+}
+
+
+@lru_cache(maxsize=4096)
+def make_convention_id(
+    language: ProgrammingLanguage, category: ConventionCategory, description: str
+) -> str:
+    """Derive the stable convention ID from language, category and description."""
+    id_base = f"{language.value}_{category.value}_{description}"
+    return hashlib.blake2b(id_base.encode("utf-8"), digest_size=8).hexdigest()
+
+
+def legacy_convention_id(
+    language: ProgrammingLanguage, category: ConventionCategory, description: str
+) -> str:
+    """Return the MD5-based ID that stores written before BLAKE2b IDs still use."""
+    id_base = f"{language.value}_{category.value}_{description}"
+    return hashlib.md5(id_base.encode("utf-8"), usedforsecurity=False).hexdigest()[:16]
+
+
+@lru_cache(maxsize=4096)
+def compile_pattern(pattern: str) -> re.Pattern[str] | None:
+    """Compile a convention pattern for validation, or None if it is invalid."""
+    try:
+        return re.compile(pattern, re.MULTILINE | re.DOTALL)
+    except re.error:
+        return None
+
+
 class CodeConvention(BaseModel):
     """A single coding convention rule."""
 
@@ -74,6 +113,37 @@ class CodeConvention(BaseModel):
     metadata: dict[str, Any] = Field(default_factory=dict, description="Additional metadata")
 
 
+@dataclasses.dataclass(slots=True)
+class CodeConventionLite:
+    """Unvalidated, slotted counterpart of CodeConvention.
+
+    Used on the analyzer's per-file hot path; convert with to_model() before
+    handing a convention to storage or the API.
+    """
+
+    id: str
+    language: ProgrammingLanguage
+    category: ConventionCategory
+    description: str
+    severity: ConventionSeverity = ConventionSeverity.RECOMMENDED
+    pattern: str | None = None
+    example: str | None = None
+    counter_example: str | None = None
+    source_repository: str | None = None
+    created_at: datetime = dataclasses.field(default_factory=datetime.now)
+    updated_at: datetime = dataclasses.field(default_factory=datetime.now)
+    confidence: float = 1.0
+    metadata: dict[str, Any] = dataclasses.field(default_factory=dict)
+
+    def to_model(self) -> CodeConvention:
+        """Validate into a CodeConvention."""
+        # A shallow field mapping; dataclasses.asdict deep-copies every value
+        return CodeConvention.model_validate({name: getattr(self, name) for name in _LITE_FIELDS})
+
+
+_LITE_FIELDS = tuple(field.name for field in dataclasses.fields(CodeConventionLite))
+
+
 class RepositoryAnalysis(BaseModel):
     """Analysis results for a repository."""
 
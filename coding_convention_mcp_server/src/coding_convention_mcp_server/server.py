@@ -1,16 +1,21 @@
 """MCP Server for tracking, comparing, and validating coding conventions."""
 
 import argparse
+import asyncio
 import logging
+import re
 import sys
-import uuid
+from collections import OrderedDict
 from datetime import datetime
+from functools import lru_cache
+from itertools import islice
 from pathlib import Path
+from secrets import token_hex
+from typing import Any
 
 from mcp.server.fastmcp import FastMCP
 from mcp.types import ToolAnnotations
 
-from .analyzer import RepositoryAnalyzer
 from .models import (
     CodeConvention,
     ComparisonResult,
@@ -18,8 +23,11 @@ from .models import (
     ConventionSeverity,
     ProgrammingLanguage,
     RepositoryAnalysis,
+    compile_pattern,
+    legacy_convention_id,
+    make_convention_id,
 )
-from .storage import get_storage
+from .storage import CachedStorage, ConventionStorage, get_storage
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -33,10 +41,226 @@ def get_storage_instance():
     """Get the storage instance, creating if needed."""
     global _storage
     if _storage is None:
-        _storage = get_storage()
+        _storage = CachedStorage(get_storage())
     return _storage
 
 
+# String-to-enum lookups for tool arguments, with the valid options formatted once
+_LANG_MAP = {e.value: e for e in ProgrammingLanguage}
+_CAT_MAP = {e.value: e for e in ConventionCategory}
+_SEV_MAP = {e.value: e for e in ConventionSeverity}
+_VALID_LANGS = str(list(_LANG_MAP))
+_VALID_CATS = str(list(_CAT_MAP))
+_VALID_SEVS = str(list(_SEV_MAP))
+
+# Backreferences would point at the wrong group once patterns are fused
+_BACKREF = re.compile(r"\\[1-9]|\(\?P=")
+# A global flag group such as (?i) would apply to every fused alternative; 3.10
+# only warns about one that is not at the start, so it has to be caught here
+_GLOBAL_FLAGS = re.compile(r"\(\?[aiLmsux]+\)")
+
+
+@lru_cache(maxsize=4096)
+def _is_fusable(pattern: str) -> bool:
+    """Whether pattern can be embedded in a combined alternation unchanged."""
+    # A malformed pattern such as "a)|(b" can still compile once wrapped, with
+    # its matches landing outside the _c<index> group
+    if (
+        _BACKREF.search(pattern)
+        or _GLOBAL_FLAGS.search(pattern)
+        or compile_pattern(pattern) is None
+    ):
+        return False
+    try:
+        re.compile(f"(?P<_c0>{pattern})")
+    except re.error:
+        return False
+    return True
+
+
+@lru_cache(maxsize=256)
+def _fused_pattern(patterns: tuple[str, ...]) -> re.Pattern[str] | None:
+    """Join patterns into one alternation with a ``_c<index>`` group per pattern."""
+    try:
+        return re.compile(
+            "|".join(f"(?P<_c{i}>{pattern})" for i, pattern in enumerate(patterns)),
+            re.MULTILINE | re.DOTALL,
+        )
+    except re.error:
+        return None
+
+
+def _matching_patterns(patterns: list[str], code: str) -> set[str]:
+    """Return the patterns that match somewhere in code.
+
+    Fusable patterns are scanned together in one pass. A pattern can be shadowed
+    where an earlier alternative matches first, so matched patterns are dropped
+    and the rest rescanned until a pass finds nothing new.
+    """
+    matched: set[str] = set()
+    single = [pattern for pattern in patterns if not _is_fusable(pattern)]
+    remaining = tuple(dict.fromkeys(pattern for pattern in patterns if _is_fusable(pattern)))
+
+    while remaining:
+        fused = _fused_pattern(remaining)
+        if fused is None:
+            # e.g. two patterns defining the same group name
+            single.extend(remaining)
+            break
+        hits = {remaining[int(m.lastgroup[2:])] for m in fused.finditer(code)}
+        if not hits:
+            break
+        matched |= hits
+        remaining = tuple(pattern for pattern in remaining if pattern not in hits)
+
+    for pattern in single:
+        compiled = compile_pattern(pattern)
+        if compiled is not None and compiled.search(code):
+            matched.add(pattern)
+    return matched
+
+
+# Concurrent track_coding_convention writes are applied in one storage batch
+_TRACK_MAX_BATCH = 64
+_TRACK_MAX_WAIT = 0.01  # seconds
+
+_track_queue: asyncio.Queue[tuple[dict[str, Any], asyncio.Future[str]]] | None = None
+_track_loop: asyncio.AbstractEventLoop | None = None
+_track_writer: asyncio.Task[None] | None = None
+
+
+def _get_track_queue() -> asyncio.Queue[tuple[dict[str, Any], asyncio.Future[str]]]:
+    """Get the track queue for the running loop, starting its writer if needed."""
+    global _track_queue, _track_loop, _track_writer
+    loop = asyncio.get_running_loop()
+    if _track_loop is not loop or _track_writer is None or _track_writer.done():
+        _track_queue = asyncio.Queue()
+        _track_loop = loop
+        _track_writer = loop.create_task(_write_tracks(_track_queue))
+    return _track_queue
+
+
+def _apply_track(storage: ConventionStorage, fields: dict[str, Any], now: datetime) -> str:
+    """Save a tracked convention, or bump the confidence of an existing one."""
+    # Check if convention already exists
+    convention_id = fields["id"]
+    existing = storage.get_convention(convention_id)
+    if existing is None:
+        # Stores written before the switch to BLAKE2b hold the MD5-derived ID
+        existing = storage.get_convention(
+            legacy_convention_id(fields["language"], fields["category"], fields["description"])
+        )
+
+    if existing:
+        convention_id = existing.id
+        # Update confidence if this is from a new source
+        updates = {
+            "confidence": min(1.0, existing.confidence + 0.1),
+            "updated_at": now,
+        }
+        source_repository = fields["source_repository"]
+        if source_repository and source_repository != existing.source_repository:
+            updates["source_repository"] = source_repository
+
+        storage.update_convention(convention_id, updates)
+        return f"Updated existing convention: {convention_id}"
+
+    # Create new convention
+    storage.save_convention(CodeConvention(**fields, created_at=now, updated_at=now))
+    return f"Tracked new convention: {convention_id}"
+
+
+async def _write_tracks(
+    queue: asyncio.Queue[tuple[dict[str, Any], asyncio.Future[str]]],
+) -> None:
+    """Drain queued tracks in batches of up to _TRACK_MAX_BATCH or _TRACK_MAX_WAIT."""
+    loop = asyncio.get_running_loop()
+    while True:
+        batch = [await queue.get()]
+        deadline = loop.time() + _TRACK_MAX_WAIT
+        while len(batch) < _TRACK_MAX_BATCH:
+            timeout = deadline - loop.time()
+            if timeout <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(queue.get(), timeout))
+            except asyncio.TimeoutError:
+                break
+
+        # Results are only handed out once the whole batch is committed
+        outcomes: list[str | BaseException] = []
+        storage = get_storage_instance()
+        now = datetime.now()  # one timestamp for the whole batch
+        try:
+            with storage.write_batch():
+                for fields, _ in batch:
+                    try:
+                        outcomes.append(_apply_track(storage, fields, now))
+                    except Exception as e:
+                        outcomes.append(e)
+        except Exception as e:
+            outcomes = [e] * len(batch)
+
+        for (_, future), outcome in zip(batch, outcomes, strict=True):
+            if future.done():
+                continue
+            if isinstance(outcome, BaseException):
+                future.set_exception(outcome)
+            else:
+                future.set_result(outcome)
+
+
+def _merged_alternatives(pattern: str) -> list[str]:
+    """Split a ``(?:a)|(?:b)`` pattern built by merge_conventions into its parts.
+
+    Anything else, including splits that leave an invalid part, is one alternative.
+    """
+    if pattern.startswith("(?:") and pattern.endswith(")"):
+        parts = pattern[3:-1].split(")|(?:")
+        if len(parts) > 1 and all(compile_pattern(part) is not None for part in parts):
+            return parts
+    return [pattern]
+
+
+# f-string expressions cannot contain a backslash before Python 3.12
+_NL = "\n"
+
+# Repository fingerprint -> ID of the analysis made from that state, least
+# recently used first
+_analysis_cache: OrderedDict[str, str] = OrderedDict()
+_ANALYSIS_CACHE_SIZE = 256
+
+
+def _format_analysis(analysis: RepositoryAnalysis) -> str:
+    """Render an analysis record as the analyze_repository summary."""
+    conventions_found = len(analysis.conventions_found)
+    languages = ", ".join([lang.value for lang in analysis.languages_used]) or "None detected"
+
+    parts = [
+        f"""Analysis Results:
+Repository: {analysis.repository_name}
+Analysis ID: {analysis.id}
+
+Languages detected: {languages}
+Conventions found: {conventions_found}
+Files analyzed: {analysis.file_count}
+Compliance score: {analysis.compliance_score:.1%}
+
+Conventions by category:"""
+    ]
+
+    for category, count in analysis.convention_summary.items():
+        parts.append(f"\n  - {category.value}: {count}")
+
+    if conventions_found == 0:
+        parts.append("\n\nNo coding conventions detected. This could be because:")
+        parts.append("\n- The repository doesn't contain source code in supported languages")
+        parts.append("\n- The analyzer couldn't extract patterns from the code")
+        parts.append("\n- The repository is empty or contains only non-source files")
+
+    return "".join(parts)
+
+
 # Create the MCP server with FastMCP
 mcp = FastMCP("coding-convention-mcp-server")
 
@@ -75,59 +299,41 @@ async def track_coding_convention(
     """
     try:
         # Convert string enums to enum values
-        try:
-            lang_enum = ProgrammingLanguage(language.lower())
-        except ValueError:
-            return f"Invalid language: {language}. Valid options: {[e.value for e in ProgrammingLanguage]}"
-
-        try:
-            cat_enum = ConventionCategory(category.lower())
-        except ValueError:
-            return f"Invalid category: {category}. Valid options: {[e.value for e in ConventionCategory]}"
-
-        try:
-            sev_enum = ConventionSeverity(severity.lower())
-        except ValueError:
-            return f"Invalid severity: {severity}. Valid options: {[e.value for e in ConventionSeverity]}"
-
-        # Generate ID based on language, category, and description hash
-        import hashlib
-
-        id_base = f"{lang_enum.value}_{cat_enum.value}_{description}"
-        convention_id = hashlib.md5(id_base.encode()).hexdigest()[:16]
-
-        # Check if convention already exists
-        storage = get_storage_instance()
-        existing = storage.get_convention(convention_id)
-
-        if existing:
-            # Update confidence if this is from a new source
-            updates = {
-                "confidence": min(1.0, existing.confidence + 0.1),
-                "updated_at": datetime.now(),
-            }
-            if source_repository and source_repository != existing.source_repository:
-                updates["source_repository"] = source_repository
-
-            storage.update_convention(convention_id, updates)
-            return f"Updated existing convention: {convention_id}"
-
-        # Create new convention
-        convention = CodeConvention(
-            id=convention_id,
-            language=lang_enum,
-            category=cat_enum,
-            severity=sev_enum,
-            pattern=pattern,
-            description=description,
-            example=example,
-            counter_example=counter_example,
-            source_repository=source_repository,
-            confidence=confidence,
+        lang_enum = _LANG_MAP.get(language.lower())
+        if lang_enum is None:
+            return f"Invalid language: {language}. Valid options: {_VALID_LANGS}"
+
+        cat_enum = _CAT_MAP.get(category.lower())
+        if cat_enum is None:
+            return f"Invalid category: {category}. Valid options: {_VALID_CATS}"
+
+        sev_enum = _SEV_MAP.get(severity.lower())
+        if sev_enum is None:
+            return f"Invalid severity: {severity}. Valid options: {_VALID_SEVS}"
+
+        # Generate ID from a BLAKE2b hash of language, category, and description
+        convention_id = make_convention_id(lang_enum, cat_enum, description)
+
+        # Concurrent calls are coalesced into one storage batch by the track writer
+        future = asyncio.get_running_loop().create_future()
+        await _get_track_queue().put(
+            (
+                {
+                    "id": convention_id,
+                    "language": lang_enum,
+                    "category": cat_enum,
+                    "severity": sev_enum,
+                    "pattern": pattern,
+                    "description": description,
+                    "example": example,
+                    "counter_example": counter_example,
+                    "source_repository": source_repository,
+                    "confidence": confidence,
+                },
+                future,
+            )
         )
-
-        storage.save_convention(convention)
-        return f"Tracked new convention: {convention_id}"
+        return await future
 
     except Exception as e:
         logger.error(f"Error tracking convention: {e}")
@@ -146,25 +352,45 @@ async def analyze_repository(repository_path: str, max_files: int = 100) -> str:
 
     Returns:
         Analysis results summary.
+
+    Re-analyzing a repository that has not changed since an earlier analysis
+    returns that analysis again; the conventions it found are not reinforced
+    a second time.
     """
     try:
         storage = get_storage_instance()
 
         # Generate analysis ID
-        analysis_id = str(uuid.uuid4())[:8]
+        analysis_id = token_hex(4)
         repo_name = (
             Path(repository_path).name
             if "/" in repository_path or "\\" in repository_path
             else repository_path
         )
 
-        # Use analyzer to extract conventions
+        # Imported here so server startup does not pay for the analyzer stack
+        from .analyzer import RepositoryAnalyzer
+
+        # Reuse the last analysis if the repository has not changed since
         analyzer = RepositoryAnalyzer(max_files=max_files)
-        analysis_result = analyzer.analyze(repository_path)
+        fingerprint = await asyncio.to_thread(analyzer.fingerprint, repository_path)
+        if fingerprint is not None and fingerprint in _analysis_cache:
+            cached = storage.get_analysis(_analysis_cache[fingerprint])
+            if cached is not None:
+                _analysis_cache.move_to_end(fingerprint)
+                return _format_analysis(cached)
+
+        # Use analyzer to extract conventions, off the event loop so other
+        # tool calls keep being served while files are cloned and parsed
+        analysis_result = await asyncio.to_thread(analyzer.analyze, repository_path)
 
         if analysis_result.get("error"):
             return f"Analysis error: {analysis_result['error']}"
 
+        # The analyzer writes to the shared backend directly, behind this read
+        # cache; forget the conventions it may have changed
+        storage.invalidate(analysis_result["convention_ids"])
+
         # Create analysis record
         analysis = RepositoryAnalysis(
             id=analysis_id,
@@ -184,33 +410,12 @@ async def analyze_repository(repository_path: str, max_files: int = 100) -> str:
 
         storage.save_analysis(analysis)
 
-        # Format results
-        conventions_found = len(analysis_result["conventions"])
-        languages = (
-            ", ".join([lang.value for lang in analysis_result["languages"]]) or "None detected"
-        )
-
-        result = f"""Analysis Results:
-Repository: {repo_name}
-Analysis ID: {analysis_id}
-
-Languages detected: {languages}
-Conventions found: {conventions_found}
-Files analyzed: {analysis_result["file_count"]}
-Compliance score: {analysis_result["compliance_score"]:.1%}
-
-Conventions by category:"""
-
-        for category, count in analysis_result["category_summary"].items():
-            result += f"\n  - {category.value}: {count}"
+        if fingerprint is not None:
+            _analysis_cache[fingerprint] = analysis_id
+            if len(_analysis_cache) > _ANALYSIS_CACHE_SIZE:
+                _analysis_cache.popitem(last=False)
 
-        if conventions_found == 0:
-            result += "\n\nNo coding conventions detected. This could be because:"
-            result += "\n- The repository doesn't contain source code in supported languages"
-            result += "\n- The analyzer couldn't extract patterns from the code"
-            result += "\n- The repository is empty or contains only non-source files"
-
-        return result
+        return _format_analysis(analysis)
 
     except Exception as e:
         logger.error(f"Error analyzing repository: {e}")
@@ -233,9 +438,11 @@ async def compare_repositories(repository_a: str, repository_b: str) -> str:
     try:
         storage = get_storage_instance()
 
-        # Get analyses for repositories
-        analyses_a = storage.get_repository_analyses(repository_a)
-        analyses_b = storage.get_repository_analyses(repository_b)
+        # Get analyses for both repositories concurrently
+        analyses_a, analyses_b = await asyncio.gather(
+            asyncio.to_thread(storage.get_repository_analyses, repository_a),
+            asyncio.to_thread(storage.get_repository_analyses, repository_b),
+        )
 
         if not analyses_a:
             return f"No analysis found for repository: {repository_a}"
@@ -246,29 +453,19 @@ async def compare_repositories(repository_a: str, repository_b: str) -> str:
         analysis_a = analyses_a[0]
         analysis_b = analyses_b[0]
 
-        # Get conventions for each
-        conventions_a = []
-        for conv_id in analysis_a.conventions_found:
-            conv = storage.get_convention(conv_id)
-            if conv:
-                conventions_a.append(conv)
-
-        conventions_b = []
-        for conv_id in analysis_b.conventions_found:
-            conv = storage.get_convention(conv_id)
-            if conv:
-                conventions_b.append(conv)
-
-        # Compare conventions
-        conv_ids_a = set([c.id for c in conventions_a])
-        conv_ids_b = set([c.id for c in conventions_b])
+        # Compare conventions; the analyses already carry the IDs
+        conv_ids_a = set(analysis_a.conventions_found)
+        conv_ids_b = set(analysis_b.conventions_found)
 
-        common = conv_ids_a.intersection(conv_ids_b)
-        unique_a = conv_ids_a - conv_ids_b
-        unique_b = conv_ids_b - conv_ids_a
+        # Partition A against B in one pass; B's leftovers are what A lacks
+        common: set[str] = set()
+        unique_a: set[str] = set()
+        for conv_id in conv_ids_a:
+            (common if conv_id in conv_ids_b else unique_a).add(conv_id)
+        unique_b = conv_ids_b - common
 
         # Calculate similarity score
-        total = len(conv_ids_a.union(conv_ids_b))
+        total = len(conv_ids_a) + len(unique_b)
         similarity = len(common) / total if total > 0 else 0.0
 
         # Generate recommendations
@@ -286,7 +483,7 @@ async def compare_repositories(repository_a: str, repository_b: str) -> str:
 
         # Save comparison
         comparison = ComparisonResult(
-            id=str(uuid.uuid4())[:8],
+            id=token_hex(4),
             repository_a=analysis_a.repository_name,
             repository_b=analysis_b.repository_name,
             common_conventions=list(common),
@@ -300,25 +497,25 @@ async def compare_repositories(repository_a: str, repository_b: str) -> str:
 
         # Format results
         result = f"""Comparison Results:
-Repository A: {analysis_a.repository_name} ({len(conventions_a)} conventions)
-Repository B: {analysis_b.repository_name} ({len(conventions_b)} conventions)
+Repository A: {analysis_a.repository_name} ({len(conv_ids_a)} conventions)
+Repository B: {analysis_b.repository_name} ({len(conv_ids_b)} conventions)
 
 Similarity Score: {similarity:.1%}
 
 Common Conventions ({len(common)}):
-{chr(10).join(f"  - {cid}" for cid in list(common)[:5])}
+{_NL.join(f"  - {cid}" for cid in islice(common, 5))}
 {"  ..." if len(common) > 5 else ""}
 
 Unique to A ({len(unique_a)}):
-{chr(10).join(f"  - {cid}" for cid in list(unique_a)[:5])}
+{_NL.join(f"  - {cid}" for cid in islice(unique_a, 5))}
 {"  ..." if len(unique_a) > 5 else ""}
 
 Unique to B ({len(unique_b)}):
-{chr(10).join(f"  - {cid}" for cid in list(unique_b)[:5])}
+{_NL.join(f"  - {cid}" for cid in islice(unique_b, 5))}
 {"  ..." if len(unique_b) > 5 else ""}
 
 Recommendations:
-{chr(10).join(f"  - {rec}" for rec in recommendations) if recommendations else "  None"}
+{_NL.join(f"  - {rec}" for rec in recommendations) if recommendations else "  None"}
 
 Comparison ID: {comparison.id}
 """
@@ -347,75 +544,59 @@ async def validate_code(code: str, language: str, check_severity: str = "require
     """
     try:
         # Convert string enums
-        try:
-            lang_enum = ProgrammingLanguage(language.lower())
-        except ValueError:
-            return f"Invalid language: {language}. Valid options: {[e.value for e in ProgrammingLanguage]}"
+        lang_enum = _LANG_MAP.get(language.lower())
+        if lang_enum is None:
+            return f"Invalid language: {language}. Valid options: {_VALID_LANGS}"
 
-        try:
-            severity_enum = ConventionSeverity(check_severity.lower())
-        except ValueError:
-            return f"Invalid severity: {check_severity}. Valid options: {[e.value for e in ConventionSeverity]}"
+        severity_enum = _SEV_MAP.get(check_severity.lower())
+        if severity_enum is None:
+            return f"Invalid severity: {check_severity}. Valid options: {_VALID_SEVS}"
 
-        # Get conventions for this language
+        # Get conventions for this language at or above the requested severity
         storage = get_storage_instance()
-        conventions = storage.get_conventions(language=lang_enum)
+        relevant_conventions = storage.get_conventions(
+            language=lang_enum, min_severity=severity_enum
+        )
 
-        if not conventions:
+        if not relevant_conventions:
             return f"No conventions found for language: {language}"
 
-        # Filter by severity
-        severity_order = {
-            ConventionSeverity.REQUIRED: 3,
-            ConventionSeverity.RECOMMENDED: 2,
-            ConventionSeverity.SUGGESTED: 1,
-            ConventionSeverity.OPTIONAL: 0,
-        }
-
-        relevant_conventions = [
-            conv
-            for conv in conventions
-            if severity_order.get(conv.severity, 0) >= severity_order.get(severity_enum, 0)
-        ]
-
-        # Check each convention (simplified - would use pattern matching in real implementation)
+        # Check every convention that has a pattern in a single scan of the code
+        matched = _matching_patterns(
+            [conv.pattern for conv in relevant_conventions if conv.pattern], code
+        )
         violations = []
-        for conv in relevant_conventions[:10]:  # Limit checks for demo
-            # Simple check based on pattern if available
-            if conv.pattern:
-                import re
-
-                try:
-                    if re.search(conv.pattern, code, re.MULTILINE | re.DOTALL):
-                        # Pattern found - could be violation or compliance depending on context
-                        # For demo, we'll just note it
-                        violations.append(
-                            {
-                                "convention_id": conv.id,
-                                "description": conv.description,
-                                "severity": conv.severity.value,
-                                "found": True,
-                            }
-                        )
-                except re.error:
-                    pass
+        for conv in relevant_conventions:
+            if conv.pattern in matched:
+                # Pattern found - could be violation or compliance depending on context
+                # For demo, we'll just note it
+                violations.append(
+                    {
+                        "convention_id": conv.id,
+                        "description": conv.description,
+                        "severity": conv.severity.value,
+                        "found": True,
+                    }
+                )
 
         # Format results
         if not violations:
             return f"Code validated successfully against {len(relevant_conventions)} conventions."
 
-        result = f"""Validation Results:
+        parts = [
+            f"""Validation Results:
 Checked against {len(relevant_conventions)} conventions ({check_severity}+ severity)
 
 Violations found ({len(violations)}):
 """
+        ]
         for i, violation in enumerate(violations[:5], 1):
-            result += f"{i}. [{violation['severity'].upper()}] {violation['description']}\n"
+            parts.append(f"{i}. [{violation['severity'].upper()}] {violation['description']}\n")
 
         if len(violations) > 5:
-            result += f"... and {len(violations) - 5} more violations\n"
+            parts.append(f"... and {len(violations) - 5} more violations\n")
 
-        return result
+        return "".join(parts)
 
     except Exception as e:
         logger.error(f"Error validating code: {e}")
@@ -444,17 +625,15 @@ async def list_conventions(
         # Convert string filters to enums if provided
         lang_enum = None
         if language:
-            try:
-                lang_enum = ProgrammingLanguage(language.lower())
-            except ValueError:
-                return f"Invalid language: {language}. Valid options: {[e.value for e in ProgrammingLanguage]}"
+            lang_enum = _LANG_MAP.get(language.lower())
+            if lang_enum is None:
+                return f"Invalid language: {language}. Valid options: {_VALID_LANGS}"
 
         cat_enum = None
         if category:
-            try:
-                cat_enum = ConventionCategory(category.lower())
-            except ValueError:
-                return f"Invalid category: {category}. Valid options: {[e.value for e in ConventionCategory]}"
+            cat_enum = _CAT_MAP.get(category.lower())
+            if cat_enum is None:
+                return f"Invalid category: {category}. Valid options: {_VALID_CATS}"
 
         # Get conventions
         conventions = storage.get_conventions(language=lang_enum, category=cat_enum, limit=limit)
@@ -463,16 +642,18 @@ async def list_conventions(
             return "No conventions found matching the criteria."
 
         # Format results
-        result = f"Found {len(conventions)} conventions:\n\n"
+        parts = [f"Found {len(conventions)} conventions:\n\n"]
 
         for i, conv in enumerate(conventions, 1):
-            result += f"{i}. [{conv.language.value.upper()}] {conv.description}\n"
-            result += f"   Category: {conv.category.value} | Severity: {conv.severity.value} | Confidence: {conv.confidence:.0%}\n"
+            parts.append(f"{i}. [{conv.language.value.upper()}] {conv.description}\n")
+            parts.append(
+                f"   Category: {conv.category.value} | Severity: {conv.severity.value} | Confidence: {conv.confidence:.0%}\n"
+            )
             if conv.source_repository:
-                result += f"   Source: {conv.source_repository}\n"
-            result += "\n"
+                parts.append(f"   Source: {conv.source_repository}\n")
+            parts.append("\n")
 
-        return result
+        return "".join(parts)
 
     except Exception as e:
         logger.error(f"Error listing conventions: {e}")
@@ -501,7 +682,8 @@ async def get_convention_details(convention_id: str) -> str:
             return f"No convention found with ID: {convention_id}"
 
         # Format detailed information
-        result = f"""Convention Details:
+        parts = [
+            f"""Convention Details:
 ID: {convention.id}
 Language: {convention.language.value}
 Category: {convention.category.value}
@@ -512,22 +694,23 @@ Description:
 {convention.description}
 
 """
+        ]
         if convention.pattern:
-            result += f"Pattern: {convention.pattern}\n\n"
+            parts.append(f"Pattern: {convention.pattern}\n\n")
 
         if convention.example:
-            result += f"Example (compliant):\n{convention.example}\n\n"
+            parts.append(f"Example (compliant):\n{convention.example}\n\n")
 
         if convention.counter_example:
-            result += f"Counter Example (non-compliant):\n{convention.counter_example}\n\n"
+            parts.append(f"Counter Example (non-compliant):\n{convention.counter_example}\n\n")
 
         if convention.source_repository:
-            result += f"Source Repository: {convention.source_repository}\n"
+            parts.append(f"Source Repository: {convention.source_repository}\n")
 
-        result += f"Created: {convention.created_at.strftime('%Y-%m-%d %H:%M:%S')}\n"
-        result += f"Updated: {convention.updated_at.strftime('%Y-%m-%d %H:%M:%S')}\n"
+        parts.append(f"Created: {convention.created_at.strftime('%Y-%m-%d %H:%M:%S')}\n")
+        parts.append(f"Updated: {convention.updated_at.strftime('%Y-%m-%d %H:%M:%S')}\n")
 
-        return result
+        return "".join(parts)
 
     except Exception as e:
         logger.error(f"Error getting convention details: {e}")
@@ -550,8 +733,10 @@ async def merge_conventions(source_convention_id: str, target_convention_id: str
     try:
         storage = get_storage_instance()
 
-        source = storage.get_convention(source_convention_id)
-        target = storage.get_convention(target_convention_id)
+        # Fetch both sides in one lookup
+        found = storage.get_conventions_by_ids([source_convention_id, target_convention_id])
+        source = found.get(source_convention_id)
+        target = found.get(target_convention_id)
 
         if not source:
             return f"Source convention not found: {source_convention_id}"
@@ -572,7 +757,12 @@ async def merge_conventions(source_convention_id: str, target_convention_id: str
         if source.pattern and not target.pattern:
             updates["pattern"] = source.pattern
         elif source.pattern and target.pattern and source.pattern != target.pattern:
-            updates["pattern"] = f"(?:{target.pattern})|(?:{source.pattern})"
+            # Flatten earlier merges so repeated merges do not nest or repeat patterns
+            alternatives = dict.fromkeys(_merged_alternatives(target.pattern))
+            alternatives.update(dict.fromkeys(_merged_alternatives(source.pattern)))
+            pattern = "(?:" + ")|(?:".join(alternatives) + ")"
+            if pattern != target.pattern:
+                updates["pattern"] = pattern
 
         # Update target
         storage.update_convention(target_convention_id, updates)
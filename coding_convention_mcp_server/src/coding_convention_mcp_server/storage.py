@@ -2,26 +2,147 @@
 
 import json
 import logging
+import os
 import sqlite3
-from collections.abc import Generator
+import threading
+import weakref
+import zlib
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from collections.abc import Generator, Iterable
 from contextlib import contextmanager
 from datetime import datetime
 from enum import Enum
+from functools import lru_cache, wraps
 from pathlib import Path
 from typing import Any
 
 from .config import get_settings
 from .models import (
+    SEVERITY_RANK,
     CodeConvention,
     ComparisonResult,
     ConventionCategory,
     ConventionSeverity,
     ProgrammingLanguage,
     RepositoryAnalysis,
+    compile_pattern,
 )
 
 logger = logging.getLogger(__name__)
 
+# IDs per "IN (...)" query, well under SQLite's bound-parameter limit
+_ID_CHUNK_SIZE = 500
+
+# Log entries tolerated before JSONStorage folds its log back into the snapshot
+_COMPACT_MIN_ENTRIES = 1000
+
+# Serialized JSON columns at least this long are stored zlib-compressed
+_COMPRESS_MIN_BYTES = 1024
+
+# Upsert statements behind the save_* methods
+_INSERT_CONVENTION_SQL = """
+    INSERT OR REPLACE INTO conventions
+    (id, language, category, severity, pattern, description, example,
+    counter_example, source_repository, created_at, updated_at,
+    confidence, metadata)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+_INSERT_ANALYSIS_SQL = """
+    INSERT OR REPLACE INTO repository_analyses
+    (id, repository_url, repository_name, analyzed_at, languages_used,
+    conventions_found, convention_summary, compliance_score, file_count, analysis_metadata)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+_INSERT_COMPARISON_SQL = """
+    INSERT OR REPLACE INTO comparisons
+    (id, repository_a, repository_b, compared_at, common_conventions,
+    unique_to_a, unique_to_b, similarity_score, recommendations)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+
+def _severities_at_least(min_severity: ConventionSeverity) -> tuple[str, ...]:
+    """Return the severity values ranked at or above min_severity."""
+    threshold = SEVERITY_RANK[min_severity]
+    return tuple(sev.value for sev, rank in SEVERITY_RANK.items() if rank >= threshold)
+
+
+def _enum_lookup(enum_cls: type[Enum]) -> dict[Any, Any]:
+    """Map each member of enum_cls, and each member's value, to the member.
+
+    JSONStorage dicts hold plain values until a read converts them in place, so
+    lookups see both forms. Members hash by name, so the two keys never clash.
+    """
+    lookup: dict[Any, Any] = {member: member for member in enum_cls}
+    lookup.update((member.value, member) for member in enum_cls)
+    return lookup
+
+
+_LANGUAGES = _enum_lookup(ProgrammingLanguage)
+_CATEGORIES = _enum_lookup(ConventionCategory)
+_SEVERITIES = _enum_lookup(ConventionSeverity)
+
+# Conventions tracked together share one timestamp for created_at and updated_at,
+# so convention rows repeat the same few strings
+_parse_timestamp = lru_cache(maxsize=1024)(datetime.fromisoformat)
+
+
+@lru_cache(maxsize=2048)
+def _convention_from_row(columns: tuple[str, ...], values: tuple[Any, ...]) -> CodeConvention:
+    """Build a CodeConvention from a conventions row.
+
+    Keyed on the row's full contents, so any write to the row misses the
+    cache. The returned object is shared between callers and must not be
+    mutated; ``_row_to_convention`` hands out copies of it.
+    """
+    row = dict(zip(columns, values))
+    return CodeConvention(
+        id=row["id"],
+        language=_LANGUAGES[row["language"]],
+        category=_CATEGORIES[row["category"]],
+        severity=_SEVERITIES[row["severity"]],
+        pattern=row["pattern"],
+        description=row["description"],
+        example=row["example"],
+        counter_example=row["counter_example"],
+        source_repository=row["source_repository"],
+        created_at=_parse_timestamp(row["created_at"]),
+        updated_at=_parse_timestamp(row["updated_at"]),
+        confidence=row["confidence"],
+        metadata=json.loads(row["metadata"]),
+    )
+
+
+def _dump_blob(value: Any) -> str | bytes:
+    """Serialize a potentially large JSON column, compressing it when worthwhile.
+
+    Compressed values are stored as BLOBs; SQLite keeps them as-is in TEXT
+    columns, so rows written before compression was added still read back.
+    """
+    text = json.dumps(value)
+    if len(text) < _COMPRESS_MIN_BYTES:
+        return text
+    return zlib.compress(text.encode("utf-8"), 1)
+
+
+def _load_blob(value: str | bytes) -> Any:
+    """Parse a JSON column written by _dump_blob."""
+    if isinstance(value, bytes):
+        value = zlib.decompress(value)
+    return json.loads(value)
+
+
+def _synchronized(method):
+    """Run a JSONStorage method while holding the instance lock."""
+
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with self._lock:
+            return method(self, *args, **kwargs)
+
+    return wrapper
+
 
 class StorageError(Exception):
     """Base exception for storage errors."""
@@ -29,59 +150,102 @@ class StorageError(Exception):
     pass
 
 
-class ConventionStorage:
+class ConventionStorage(ABC):
     """Abstract base class for convention storage."""
 
     def __init__(self):
         self.settings = get_settings()
 
+    @contextmanager
+    def write_batch(self) -> Generator[None, None, None]:
+        """Group several writes so they are persisted together."""
+        yield
+
+    @abstractmethod
     def save_convention(self, convention: CodeConvention) -> str:
         """Save a coding convention."""
         raise NotImplementedError
 
+    def save_conventions(self, conventions: list[CodeConvention]) -> list[str]:
+        """Save several coding conventions together."""
+        with self.write_batch():
+            return [self.save_convention(convention) for convention in conventions]
+
+    @abstractmethod
     def get_convention(self, convention_id: str) -> CodeConvention | None:
         """Get a coding convention by ID."""
         raise NotImplementedError
 
+    @abstractmethod
+    def get_conventions_by_ids(self, convention_ids: list[str]) -> dict[str, CodeConvention]:
+        """Get the conventions with the given IDs, keyed by ID; unknown IDs are omitted."""
+        raise NotImplementedError
+
+    @abstractmethod
     def get_conventions(
         self,
         language: ProgrammingLanguage | None = None,
         category: ConventionCategory | None = None,
         severity: ConventionSeverity | None = None,
-        limit: int = 100,
+        limit: int | None = 100,
+        min_severity: ConventionSeverity | None = None,
     ) -> list[CodeConvention]:
-        """Get conventions with optional filters."""
+        """Get conventions with optional filters; ``limit=None`` returns all.
+
+        ``min_severity`` keeps conventions at least as strict as the given level.
+        """
         raise NotImplementedError
 
+    @abstractmethod
     def update_convention(self, convention_id: str, updates: dict[str, Any]) -> bool:
         """Update a convention."""
         raise NotImplementedError
 
+    @abstractmethod
     def delete_convention(self, convention_id: str) -> bool:
         """Delete a convention."""
         raise NotImplementedError
 
+    @abstractmethod
     def save_analysis(self, analysis: RepositoryAnalysis) -> str:
         """Save repository analysis."""
         raise NotImplementedError
 
+    def save_analyses(self, analyses: list[RepositoryAnalysis]) -> list[str]:
+        """Save several repository analyses together."""
+        with self.write_batch():
+            return [self.save_analysis(analysis) for analysis in analyses]
+
+    @abstractmethod
     def get_analysis(self, analysis_id: str) -> RepositoryAnalysis | None:
         """Get analysis by ID."""
         raise NotImplementedError
 
+    @abstractmethod
     def get_repository_analyses(self, repository_url: str) -> list[RepositoryAnalysis]:
         """Get all analyses for a repository."""
         raise NotImplementedError
 
+    @abstractmethod
     def save_comparison(self, comparison: ComparisonResult) -> str:
         """Save comparison result."""
         raise NotImplementedError
 
+    def save_comparisons(self, comparisons: list[ComparisonResult]) -> list[str]:
+        """Save several comparison results together."""
+        with self.write_batch():
+            return [self.save_comparison(comparison) for comparison in comparisons]
+
+    @abstractmethod
     def get_comparison(self, comparison_id: str) -> ComparisonResult | None:
         """Get comparison by ID."""
         raise NotImplementedError
 
 
+class _ConnectionCloser:
+    """Per-thread marker whose collection closes that thread's connection."""
+
+
 class SQLiteStorage(ConventionStorage):
     """SQLite implementation of convention storage."""
 
@@ -99,25 +263,99 @@ class SQLiteStorage(ConventionStorage):
             final_path = db_path  # db_path is already a Path
 
         self.db_path: Path = final_path
+        # One long-lived connection per thread, plus that thread's batch depth
+        self._local = threading.local()
+        self._connections: list[sqlite3.Connection] = []
+        self._connections_lock = threading.Lock()
         self._init_db()
 
+    def _connect(self) -> sqlite3.Connection:
+        """Open a database connection with proper settings."""
+        conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        conn.execute("PRAGMA cache_size=-64000")
+        return conn
+
+    def _thread_connection(self) -> sqlite3.Connection:
+        """Get this thread's connection, opening it on first use."""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = self._connect()
+            self._local.conn = conn
+            with self._connections_lock:
+                self._connections.append(conn)
+            # Thread-local values are dropped when their thread exits, so this
+            # closes the connections of finished pool threads
+            self._local.closer = _ConnectionCloser()
+            weakref.finalize(self._local.closer, self._forget_connection, conn)
+        return conn
+
+    def _forget_connection(self, conn: sqlite3.Connection):
+        """Close a connection whose thread has exited."""
+        with self._connections_lock:
+            if conn in self._connections:
+                self._connections.remove(conn)
+        conn.close()
+
+    def _in_batch(self) -> bool:
+        """Whether this thread has an open write_batch()."""
+        return getattr(self._local, "batch_depth", 0) > 0
+
     @contextmanager
     def _get_connection(self) -> Generator[sqlite3.Connection, None, None]:
-        """Get a database connection with proper settings."""
-        conn = sqlite3.connect(str(self.db_path))
-        conn.row_factory = sqlite3.Row
+        """Get this thread's connection, rolling back a failed write outside a batch."""
+        conn = self._thread_connection()
         try:
             yield conn
+        except BaseException:
+            if not self._in_batch():
+                conn.rollback()
+            raise
+
+    def _commit(self, conn: sqlite3.Connection):
+        """Commit unless an open write batch will commit later."""
+        if not self._in_batch():
+            conn.commit()
+
+    @contextmanager
+    def write_batch(self) -> Generator[None, None, None]:
+        """Run the enclosed writes in a single transaction."""
+        if self._in_batch():
+            self._local.batch_depth += 1
+            try:
+                yield
+            finally:
+                self._local.batch_depth -= 1
+            return
+
+        conn = self._thread_connection()
+        self._local.batch_depth = 1
+        try:
+            conn.execute("BEGIN")
+            yield
+            conn.commit()
+        except BaseException:
+            conn.rollback()
+            raise
         finally:
+            self._local.batch_depth = 0
+
+    def close(self):
+        """Close every connection this storage has opened."""
+        with self._connections_lock:
+            connections, self._connections = self._connections, []
+        for conn in connections:
             conn.close()
+        self._local = threading.local()
 
     def _init_db(self):
         """Initialize database tables."""
         with self._get_connection() as conn:
-            cursor = conn.cursor()
-
             # Conventions table
-            cursor.execute("""
+            conn.execute("""
                 CREATE TABLE IF NOT EXISTS conventions (
                     id TEXT PRIMARY KEY,
                     language TEXT NOT NULL,
@@ -136,7 +374,7 @@ class SQLiteStorage(ConventionStorage):
             """)
 
             # Repository analyses table
-            cursor.execute("""
+            conn.execute("""
                 CREATE TABLE IF NOT EXISTS repository_analyses (
                     id TEXT PRIMARY KEY,
                     repository_url TEXT NOT NULL,
@@ -152,7 +390,7 @@ class SQLiteStorage(ConventionStorage):
             """)
 
             # Comparisons table
-            cursor.execute("""
+            conn.execute("""
                 CREATE TABLE IF NOT EXISTS comparisons (
                     id TEXT PRIMARY KEY,
                     repository_a TEXT NOT NULL,
@@ -166,68 +404,100 @@ class SQLiteStorage(ConventionStorage):
                 )
             """)
 
+            # Filtered listings narrow by language, category and severity, newest first;
+            # this covers the older (language, category) index, so drop that one
+            conn.execute("DROP INDEX IF EXISTS idx_conventions_language_category")
+            conn.execute("""
+                CREATE INDEX IF NOT EXISTS idx_conv_filter
+                ON conventions (language, category, severity, updated_at DESC)
+            """)
+
+            # Repository history is looked up by URL, newest first
+            conn.execute("""
+                CREATE INDEX IF NOT EXISTS idx_analyses_repo
+                ON repository_analyses (repository_url, analyzed_at DESC)
+            """)
+
             conn.commit()
 
     def save_convention(self, convention: CodeConvention) -> str:
         """Save a coding convention."""
+        return self.save_conventions([convention])[0]
+
+    def save_conventions(self, conventions: list[CodeConvention]) -> list[str]:
+        """Save several coding conventions in one statement and transaction."""
+        for convention in conventions:
+            if convention.pattern:
+                # Warm the pattern cache so validation does not pay for compilation
+                compile_pattern(convention.pattern)
+
         with self._get_connection() as conn:
-            cursor = conn.cursor()
-
-            # Convert datetime to ISO format string for SQLite
-            created_at = convention.created_at.isoformat()
-            updated_at = convention.updated_at.isoformat()
-
-            cursor.execute(
-                """
-                INSERT OR REPLACE INTO conventions 
-                (id, language, category, severity, pattern, description, example, 
-                 counter_example, source_repository, created_at, updated_at, 
-                 confidence, metadata)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """,
+            # Datetimes are stored as ISO format strings
+            conn.executemany(
+                _INSERT_CONVENTION_SQL,
                 (
-                    convention.id,
-                    convention.language.value,
-                    convention.category.value,
-                    convention.severity.value,
-                    convention.pattern,
-                    convention.description,
-                    convention.example,
-                    convention.counter_example,
-                    convention.source_repository,
-                    created_at,
-                    updated_at,
-                    convention.confidence,
-                    json.dumps(convention.metadata),
+                    (
+                        convention.id,
+                        convention.language.value,
+                        convention.category.value,
+                        convention.severity.value,
+                        convention.pattern,
+                        convention.description,
+                        convention.example,
+                        convention.counter_example,
+                        convention.source_repository,
+                        convention.created_at.isoformat(),
+                        convention.updated_at.isoformat(),
+                        convention.confidence,
+                        json.dumps(convention.metadata),
+                    )
+                    for convention in conventions
                 ),
             )
 
-            conn.commit()
-            return convention.id
+            self._commit(conn)
+            return [convention.id for convention in conventions]
 
     def get_convention(self, convention_id: str) -> CodeConvention | None:
         """Get a coding convention by ID."""
         with self._get_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute("SELECT * FROM conventions WHERE id = ?", (convention_id,))
-            row = cursor.fetchone()
+            row = conn.execute(
+                "SELECT * FROM conventions WHERE id = ?", (convention_id,)
+            ).fetchone()
 
             if not row:
                 return None
 
             return self._row_to_convention(row)
 
+    def get_conventions_by_ids(self, convention_ids: list[str]) -> dict[str, CodeConvention]:
+        """Get the conventions with the given IDs, keyed by ID; unknown IDs are omitted."""
+        ids = list(dict.fromkeys(convention_ids))
+        conventions: dict[str, CodeConvention] = {}
+        with self._get_connection() as conn:
+            for start in range(0, len(ids), _ID_CHUNK_SIZE):
+                chunk = ids[start : start + _ID_CHUNK_SIZE]
+                placeholders = ",".join("?" * len(chunk))
+                for row in conn.execute(
+                    f"SELECT * FROM conventions WHERE id IN ({placeholders})", chunk
+                ):
+                    conventions[row["id"]] = self._row_to_convention(row)
+
+        return conventions
+
     def get_conventions(
         self,
         language: ProgrammingLanguage | None = None,
         category: ConventionCategory | None = None,
         severity: ConventionSeverity | None = None,
-        limit: int = 100,
+        limit: int | None = 100,
+        min_severity: ConventionSeverity | None = None,
     ) -> list[CodeConvention]:
-        """Get conventions with optional filters."""
-        with self._get_connection() as conn:
-            cursor = conn.cursor()
+        """Get conventions with optional filters; ``limit=None`` returns all.
 
+        ``min_severity`` keeps conventions at least as strict as the given level.
+        """
+        with self._get_connection() as conn:
             query = "SELECT * FROM conventions WHERE 1=1"
             params = []
 
@@ -243,25 +513,22 @@ class SQLiteStorage(ConventionStorage):
                 query += " AND severity = ?"
                 params.append(severity.value)
 
-            query += " ORDER BY updated_at DESC LIMIT ?"
-            params.append(limit)
+            if min_severity:
+                allowed = _severities_at_least(min_severity)
+                query += f" AND severity IN ({','.join('?' * len(allowed))})"
+                params.extend(allowed)
 
-            cursor.execute(query, params)
-            rows = cursor.fetchall()
+            query += " ORDER BY updated_at DESC"
+            if limit is not None:
+                query += " LIMIT ?"
+                params.append(limit)
 
-            return [self._row_to_convention(row) for row in rows]
+            return [self._row_to_convention(row) for row in conn.execute(query, params)]
 
     def update_convention(self, convention_id: str, updates: dict[str, Any]) -> bool:
         """Update a convention."""
         with self._get_connection() as conn:
-            cursor = conn.cursor()
-
-            # Check if convention exists
-            cursor.execute("SELECT id FROM conventions WHERE id = ?", (convention_id,))
-            if not cursor.fetchone():
-                return False
-
-            # Build update query
+            # Build update query; a missing convention shows up as no affected rows
             set_clauses = []
             params = []
 
@@ -288,80 +555,59 @@ class SQLiteStorage(ConventionStorage):
             params.append(convention_id)
 
             query = f"UPDATE conventions SET {', '.join(set_clauses)} WHERE id = ?"
-            cursor.execute(query, params)
-            conn.commit()
+            cursor = conn.execute(query, params)
+            self._commit(conn)
 
             return cursor.rowcount > 0
 
     def delete_convention(self, convention_id: str) -> bool:
         """Delete a convention."""
         with self._get_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute("DELETE FROM conventions WHERE id = ?", (convention_id,))
-            conn.commit()
+            cursor = conn.execute("DELETE FROM conventions WHERE id = ?", (convention_id,))
+            self._commit(conn)
             return cursor.rowcount > 0
 
     def _row_to_convention(self, row: sqlite3.Row) -> CodeConvention:
         """Convert SQLite row to CodeConvention object."""
-        return CodeConvention(
-            id=row["id"],
-            language=ProgrammingLanguage(row["language"]),
-            category=ConventionCategory(row["category"]),
-            severity=ConventionSeverity(row["severity"]),
-            pattern=row["pattern"],
-            description=row["description"],
-            example=row["example"],
-            counter_example=row["counter_example"],
-            source_repository=row["source_repository"],
-            created_at=datetime.fromisoformat(row["created_at"]),
-            updated_at=datetime.fromisoformat(row["updated_at"]),
-            confidence=row["confidence"],
-            metadata=json.loads(row["metadata"]),
-        )
+        # Deep, so callers changing metadata do not reach the cached instance
+        return _convention_from_row(tuple(row.keys()), tuple(row)).model_copy(deep=True)
 
     def save_analysis(self, analysis: RepositoryAnalysis) -> str:
         """Save repository analysis."""
-        with self._get_connection() as conn:
-            cursor = conn.cursor()
+        return self.save_analyses([analysis])[0]
 
-            analyzed_at = analysis.analyzed_at.isoformat()
-            languages_used = json.dumps([lang.value for lang in analysis.languages_used])
-            conventions_found = json.dumps(analysis.conventions_found)
-            convention_summary = json.dumps(
-                {k.value: v for k, v in analysis.convention_summary.items()}
-            )
-            analysis_metadata = json.dumps(analysis.analysis_metadata)
-
-            cursor.execute(
-                """
-                INSERT OR REPLACE INTO repository_analyses 
-                (id, repository_url, repository_name, analyzed_at, languages_used,
-                 conventions_found, convention_summary, compliance_score, file_count, analysis_metadata)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """,
+    def save_analyses(self, analyses: list[RepositoryAnalysis]) -> list[str]:
+        """Save several repository analyses in one statement and transaction."""
+        with self._get_connection() as conn:
+            conn.executemany(
+                _INSERT_ANALYSIS_SQL,
                 (
-                    analysis.id,
-                    analysis.repository_url,
-                    analysis.repository_name,
-                    analyzed_at,
-                    languages_used,
-                    conventions_found,
-                    convention_summary,
-                    analysis.compliance_score,
-                    analysis.file_count,
-                    analysis_metadata,
+                    (
+                        analysis.id,
+                        analysis.repository_url,
+                        analysis.repository_name,
+                        analysis.analyzed_at.isoformat(),
+                        # str-based enums serialize as their values, keys included
+                        json.dumps(analysis.languages_used),
+                        _dump_blob(analysis.conventions_found),
+                        json.dumps(analysis.convention_summary),
+                        analysis.compliance_score,
+                        analysis.file_count,
+                        _dump_blob(analysis.analysis_metadata),
+                    )
+                    for analysis in analyses
                 ),
             )
 
-            conn.commit()
-            return analysis.id
+            self._commit(conn)
+            return [analysis.id for analysis in analyses]
 
     def get_analysis(self, analysis_id: str) -> RepositoryAnalysis | None:
         """Get analysis by ID."""
         with self._get_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute("SELECT * FROM repository_analyses WHERE id = ?", (analysis_id,))
-            row = cursor.fetchone()
+            row = conn.execute(
+                "SELECT * FROM repository_analyses WHERE id = ?", (analysis_id,)
+            ).fetchone()
 
             if not row:
                 return None
@@ -371,13 +617,10 @@ class SQLiteStorage(ConventionStorage):
     def get_repository_analyses(self, repository_url: str) -> list[RepositoryAnalysis]:
         """Get all analyses for a repository."""
         with self._get_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute(
+            rows = conn.execute(
                 "SELECT * FROM repository_analyses WHERE repository_url = ? ORDER BY analyzed_at DESC",
                 (repository_url,),
             )
-            rows = cursor.fetchall()
-
             return [self._row_to_analysis(row) for row in rows]
 
     def _row_to_analysis(self, row: sqlite3.Row) -> RepositoryAnalysis:
@@ -387,58 +630,50 @@ class SQLiteStorage(ConventionStorage):
             repository_url=row["repository_url"],
             repository_name=row["repository_name"],
             analyzed_at=datetime.fromisoformat(row["analyzed_at"]),
-            languages_used=[
-                ProgrammingLanguage(lang) for lang in json.loads(row["languages_used"])
-            ],
-            conventions_found=json.loads(row["conventions_found"]),
+            languages_used=[_LANGUAGES[lang] for lang in json.loads(row["languages_used"])],
+            conventions_found=_load_blob(row["conventions_found"]),
             convention_summary={
-                ConventionCategory(k): v for k, v in json.loads(row["convention_summary"]).items()
+                _CATEGORIES[k]: v for k, v in json.loads(row["convention_summary"]).items()
             },
             compliance_score=row["compliance_score"],
             file_count=row["file_count"],
-            analysis_metadata=json.loads(row["analysis_metadata"]),
+            analysis_metadata=_load_blob(row["analysis_metadata"]),
         )
 
     def save_comparison(self, comparison: ComparisonResult) -> str:
         """Save comparison result."""
+        return self.save_comparisons([comparison])[0]
+
+    def save_comparisons(self, comparisons: list[ComparisonResult]) -> list[str]:
+        """Save several comparison results in one statement and transaction."""
         with self._get_connection() as conn:
-            cursor = conn.cursor()
-
-            compared_at = comparison.compared_at.isoformat()
-            common_conventions = json.dumps(comparison.common_conventions)
-            unique_to_a = json.dumps(comparison.unique_to_a)
-            unique_to_b = json.dumps(comparison.unique_to_b)
-            recommendations = json.dumps(comparison.recommendations)
-
-            cursor.execute(
-                """
-                INSERT OR REPLACE INTO comparisons 
-                (id, repository_a, repository_b, compared_at, common_conventions,
-                 unique_to_a, unique_to_b, similarity_score, recommendations)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """,
+            conn.executemany(
+                _INSERT_COMPARISON_SQL,
                 (
-                    comparison.id,
-                    comparison.repository_a,
-                    comparison.repository_b,
-                    compared_at,
-                    common_conventions,
-                    unique_to_a,
-                    unique_to_b,
-                    comparison.similarity_score,
-                    recommendations,
+                    (
+                        comparison.id,
+                        comparison.repository_a,
+                        comparison.repository_b,
+                        comparison.compared_at.isoformat(),
+                        _dump_blob(comparison.common_conventions),
+                        _dump_blob(comparison.unique_to_a),
+                        _dump_blob(comparison.unique_to_b),
+                        comparison.similarity_score,
+                        json.dumps(comparison.recommendations),
+                    )
+                    for comparison in comparisons
                 ),
             )
 
-            conn.commit()
-            return comparison.id
+            self._commit(conn)
+            return [comparison.id for comparison in comparisons]
 
     def get_comparison(self, comparison_id: str) -> ComparisonResult | None:
         """Get comparison by ID."""
         with self._get_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute("SELECT * FROM comparisons WHERE id = ?", (comparison_id,))
-            row = cursor.fetchone()
+            row = conn.execute(
+                "SELECT * FROM comparisons WHERE id = ?", (comparison_id,)
+            ).fetchone()
 
             if not row:
                 return None
@@ -448,16 +683,21 @@ class SQLiteStorage(ConventionStorage):
                 repository_a=row["repository_a"],
                 repository_b=row["repository_b"],
                 compared_at=datetime.fromisoformat(row["compared_at"]),
-                common_conventions=json.loads(row["common_conventions"]),
-                unique_to_a=json.loads(row["unique_to_a"]),
-                unique_to_b=json.loads(row["unique_to_b"]),
+                common_conventions=_load_blob(row["common_conventions"]),
+                unique_to_a=_load_blob(row["unique_to_a"]),
+                unique_to_b=_load_blob(row["unique_to_b"]),
                 similarity_score=row["similarity_score"],
                 recommendations=json.loads(row["recommendations"]),
             )
 
 
 class JSONStorage(ConventionStorage):
-    """JSON file implementation of convention storage."""
+    """JSON file implementation of convention storage.
+
+    State is a snapshot file plus an append-only JSONL log next to it. Each write
+    appends one line to the log; once the log outgrows the stored records it is
+    compacted into a fresh snapshot.
+    """
 
     def __init__(self, json_path: str | Path | None = None):
         super().__init__()
@@ -474,66 +714,275 @@ class JSONStorage(ConventionStorage):
 
         # At this point, json_path is definitely a Path
         self.json_path: Path = json_path
+        self.log_path: Path = json_path.with_suffix(".jsonl")
+        # The analyzer's worker threads share this instance with the server
+        self._lock = threading.RLock()
         self._data = self._load_data()
+        self._batch_depth = 0
+        self._pending: list[str] = []
+        self._log_entries = 0
+        self._log_file = None
+
+        # Secondary indices over the convention dicts in self._data
+        self._by_language: dict[str, dict[str, dict[str, Any]]] = {}
+        self._by_language_category: dict[tuple[str, str], dict[str, dict[str, Any]]] = {}
+        # Insertion position, so indexed results keep table order on ties
+        self._order: dict[str, int] = {}
+        self._next_order = 0
+        for convention_dict in self._data["conventions"].values():
+            self._append_order(convention_dict["id"])
+            self._index_convention(convention_dict)
+
+        self._replay_log()
+        # A long log would otherwise be replayed again on every start
+        if self._log_too_long():
+            self.compact()
+
+    def _load_data(self) -> dict[str, dict[str, dict[str, Any]]]:
+        """Load the snapshot, keying each table's records by ID in file order."""
+        data: dict[str, Any] = {"conventions": [], "analyses": [], "comparisons": []}
+        if self.json_path.exists():
+            try:
+                with open(self.json_path, encoding="utf-8") as f:
+                    data = json.load(f)
+            except (json.JSONDecodeError, FileNotFoundError):
+                pass
+
+        return {
+            table: {record["id"]: record for record in data.get(table, [])}
+            for table in ("conventions", "analyses", "comparisons")
+        }
 
-    def _load_data(self) -> dict[str, Any]:
-        """Load data from JSON file."""
-        if not self.json_path.exists():
-            return {"conventions": [], "analyses": [], "comparisons": []}
+    @staticmethod
+    def _index_keys(convention_dict: dict[str, Any]) -> tuple[str, str]:
+        """Return the language and category values a convention is indexed under."""
+        language = convention_dict["language"]
+        category = convention_dict["category"]
+        # Enum members hash by name, so index on the plain values
+        return (
+            language.value if isinstance(language, Enum) else language,
+            category.value if isinstance(category, Enum) else category,
+        )
 
-        try:
-            with open(self.json_path, encoding="utf-8") as f:
-                return json.load(f)
-        except (json.JSONDecodeError, FileNotFoundError):
-            return {"conventions": [], "analyses": [], "comparisons": []}
+    def _append_order(self, convention_id: str):
+        """Record a convention appended to the end of the conventions table."""
+        self._order[convention_id] = self._next_order
+        self._next_order += 1
+
+    def _index_convention(self, convention_dict: dict[str, Any]):
+        """Add a convention to the secondary indices."""
+        convention_id = convention_dict["id"]
+        language, category = self._index_keys(convention_dict)
+        self._by_language.setdefault(language, {})[convention_id] = convention_dict
+        self._by_language_category.setdefault((language, category), {})[convention_id] = (
+            convention_dict
+        )
+
+    def _unindex_convention(self, convention_dict: dict[str, Any]):
+        """Remove a convention from the secondary indices."""
+        convention_id = convention_dict["id"]
+        language, category = self._index_keys(convention_dict)
+        self._by_language.get(language, {}).pop(convention_id, None)
+        self._by_language_category.get((language, category), {}).pop(convention_id, None)
+
+    def _replay_log(self):
+        """Apply the log entries written since the snapshot was taken."""
+        if not self.log_path.exists():
+            return
+
+        with open(self.log_path, encoding="utf-8") as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    # A torn final line from an interrupted append
+                    logger.warning(f"Skipping unreadable entry in {self.log_path}")
+                    continue
+                self._apply_entry(entry)
+                self._log_entries += 1
+
+    def _apply_entry(self, entry: dict[str, Any]):
+        """Apply one log entry to the in-memory state."""
+        table = entry["table"]
+        if "delete" in entry:
+            if table == "conventions":
+                self._remove_convention(entry["delete"])
+        elif table == "conventions":
+            self._put_convention(entry["record"])
+        else:
+            self._put_record(table, entry["record"])
+
+    def _put_convention(self, convention_dict: dict[str, Any]) -> dict[str, Any]:
+        """Insert or replace a convention dict, keeping the position of an existing one."""
+        existing = self._data["conventions"].get(convention_dict["id"])
+        if existing is None:
+            self._data["conventions"][convention_dict["id"]] = convention_dict
+            self._append_order(convention_dict["id"])
+            self._index_convention(convention_dict)
+            return convention_dict
+
+        self._unindex_convention(existing)
+        existing.clear()
+        existing.update(convention_dict)
+        self._index_convention(existing)
+        return existing
+
+    def _remove_convention(self, convention_id: str) -> bool:
+        """Drop a convention from the in-memory state."""
+        convention_dict = self._data["conventions"].pop(convention_id, None)
+        if convention_dict is None:
+            return False
+
+        self._unindex_convention(convention_dict)
+        del self._order[convention_id]
+        return True
+
+    def _put_record(self, table: str, record: dict[str, Any]):
+        """Insert or replace an analysis or comparison dict by ID."""
+        self._data[table][record["id"]] = record
+
+    def _log(self, entry: dict[str, Any]):
+        """Append an entry to the log, or hold it until the open batch ends."""
+        self._pending.append(json.dumps(entry, default=str) + "\n")
+        if not self._batch_depth:
+            self._flush_log()
+
+    def _flush_log(self):
+        """Write held entries to the log in one append, compacting when it grows large."""
+        if not self._pending:
+            return
+        if self._log_file is None:
+            self._log_file = open(self.log_path, "a", encoding="utf-8")
+        self._log_file.write("".join(self._pending))
+        self._log_file.flush()
+        self._log_entries += len(self._pending)
+        self._pending.clear()
+
+        if self._log_too_long():
+            self.compact()
+
+    def _log_too_long(self) -> bool:
+        """Whether the log holds more entries than the records it describes."""
+        record_count = sum(len(records) for records in self._data.values())
+        return self._log_entries > max(_COMPACT_MIN_ENTRIES, record_count)
 
     def _save_data(self):
-        """Save data to JSON file."""
-        with open(self.json_path, "w", encoding="utf-8") as f:
-            json.dump(self._data, f, indent=2, default=str)
+        """Write the in-memory state out as a new snapshot."""
+        # One-shot compact dumps runs on the C encoder; json.dump or indent= fall back
+        # to the pure-Python one, which is several times slower on large stores
+        snapshot = {table: list(records.values()) for table, records in self._data.items()}
+        payload = json.dumps(snapshot, default=str, separators=(",", ":"))
+        tmp_path = self.json_path.with_suffix(".json.tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(payload)
+        os.replace(tmp_path, self.json_path)
+
+    @_synchronized
+    def compact(self):
+        """Fold the log into a fresh snapshot and truncate it.
+
+        Log entries are idempotent, so a crash between the two steps only means the
+        old entries are replayed onto the new snapshot at the next load.
+        """
+        self._save_data()
+        if self._log_file is not None:
+            self._log_file.close()
+        self._log_file = open(self.log_path, "w", encoding="utf-8")
+        self._log_entries = 0
+
+    @_synchronized
+    def close(self):
+        """Close the log file."""
+        self._flush_log()
+        if self._log_file is not None:
+            self._log_file.close()
+            self._log_file = None
 
+    @contextmanager
+    def write_batch(self) -> Generator[None, None, None]:
+        """Coalesce the enclosed writes into a single log append."""
+        with self._lock:
+            self._batch_depth += 1
+            try:
+                yield
+            finally:
+                self._batch_depth -= 1
+                if not self._batch_depth:
+                    self._flush_log()
+
+    @_synchronized
     def save_convention(self, convention: CodeConvention) -> str:
         """Save a coding convention."""
+        if convention.pattern:
+            # Warm the pattern cache so validation does not pay for compilation
+            compile_pattern(convention.pattern)
+
         # Convert to dict
         convention_dict = convention.dict()
         convention_dict["created_at"] = convention.created_at.isoformat()
         convention_dict["updated_at"] = convention.updated_at.isoformat()
 
-        # Check if convention exists
-        for i, existing in enumerate(self._data["conventions"]):
-            if existing["id"] == convention.id:
-                self._data["conventions"][i] = convention_dict
-                break
-        else:
-            self._data["conventions"].append(convention_dict)
-
-        self._save_data()
+        self._put_convention(convention_dict)
+        self._log({"table": "conventions", "record": convention_dict})
         return convention.id
 
+    @_synchronized
     def get_convention(self, convention_id: str) -> CodeConvention | None:
         """Get a coding convention by ID."""
-        for convention_dict in self._data["conventions"]:
-            if convention_dict["id"] == convention_id:
-                return self._dict_to_convention(convention_dict)
-        return None
+        convention_dict = self._data["conventions"].get(convention_id)
+        if convention_dict is None:
+            return None
+        return self._dict_to_convention(convention_dict)
+
+    @_synchronized
+    def get_conventions_by_ids(self, convention_ids: list[str]) -> dict[str, CodeConvention]:
+        """Get the conventions with the given IDs, keyed by ID; unknown IDs are omitted."""
+        conventions = self._data["conventions"]
+        return {
+            convention_id: self._dict_to_convention(conventions[convention_id])
+            for convention_id in convention_ids
+            if convention_id in conventions
+        }
 
+    @_synchronized
     def get_conventions(
         self,
         language: ProgrammingLanguage | None = None,
         category: ConventionCategory | None = None,
         severity: ConventionSeverity | None = None,
-        limit: int = 100,
+        limit: int | None = 100,
+        min_severity: ConventionSeverity | None = None,
     ) -> list[CodeConvention]:
-        """Get conventions with optional filters."""
-        filtered = []
+        """Get conventions with optional filters; ``limit=None`` returns all.
+
+        ``min_severity`` keeps conventions at least as strict as the given level.
+        """
+        # Start from the narrowest index the filters allow
+        if language and category:
+            candidates = self._by_language_category.get((language.value, category.value), {})
+        elif language:
+            candidates = self._by_language.get(language.value, {})
+        else:
+            candidates = None
+
+        if candidates is None:
+            candidate_dicts = self._data["conventions"].values()
+        else:
+            candidate_dicts = sorted(candidates.values(), key=lambda c: self._order[c["id"]])
+
+        allowed = _severities_at_least(min_severity) if min_severity else ()
 
-        for convention_dict in self._data["conventions"]:
+        filtered = []
+        for convention_dict in candidate_dicts:
             if language and convention_dict["language"] != language.value:
                 continue
             if category and convention_dict["category"] != category.value:
                 continue
             if severity and convention_dict["severity"] != severity.value:
                 continue
+            # A tuple, not a set: stored values may be enum members, which hash by name
+            if min_severity and convention_dict["severity"] not in allowed:
+                continue
             filtered.append(self._dict_to_convention(convention_dict))
 
         # Sort by updated_at descending
@@ -543,9 +992,9 @@ class JSONStorage(ConventionStorage):
     def _dict_to_convention(self, convention_dict: dict[str, Any]) -> CodeConvention:
         """Convert dict to CodeConvention object."""
         # Convert string enums back to enum values
-        convention_dict["language"] = ProgrammingLanguage(convention_dict["language"])
-        convention_dict["category"] = ConventionCategory(convention_dict["category"])
-        convention_dict["severity"] = ConventionSeverity(convention_dict["severity"])
+        convention_dict["language"] = _LANGUAGES[convention_dict["language"]]
+        convention_dict["category"] = _CATEGORIES[convention_dict["category"]]
+        convention_dict["severity"] = _SEVERITIES[convention_dict["severity"]]
 
         # Convert ISO strings back to datetime
         if isinstance(convention_dict["created_at"], str):
@@ -555,42 +1004,44 @@ class JSONStorage(ConventionStorage):
 
         return CodeConvention(**convention_dict)
 
+    @_synchronized
     def update_convention(self, convention_id: str, updates: dict[str, Any]) -> bool:
         """Update a convention."""
-        for i, convention_dict in enumerate(self._data["conventions"]):
-            if convention_dict["id"] == convention_id:
-                # Apply updates
-                for key, value in updates.items():
-                    if key in ("language", "category", "severity") and isinstance(value, Enum):
-                        value = value.value
-                    elif key in ("created_at", "updated_at") and isinstance(value, datetime):
-                        value = value.isoformat()
-                    elif key == "metadata" and isinstance(value, dict):
-                        value = value
+        convention_dict = self._data["conventions"].get(convention_id)
+        if convention_dict is None:
+            return False
 
-                    convention_dict[key] = value
+        self._unindex_convention(convention_dict)
 
-                # Always update updated_at
-                if "updated_at" not in updates:
-                    convention_dict["updated_at"] = datetime.now().isoformat()
+        # Apply updates
+        for key, value in updates.items():
+            if key in ("language", "category", "severity") and isinstance(value, Enum):
+                value = value.value
+            elif key in ("created_at", "updated_at") and isinstance(value, datetime):
+                value = value.isoformat()
+            elif key == "metadata" and isinstance(value, dict):
+                value = value
 
-                self._save_data()
-                return True
+            convention_dict[key] = value
 
-        return False
+        # Always update updated_at
+        if "updated_at" not in updates:
+            convention_dict["updated_at"] = datetime.now().isoformat()
 
+        self._index_convention(convention_dict)
+        self._log({"table": "conventions", "record": convention_dict})
+        return True
+
+    @_synchronized
     def delete_convention(self, convention_id: str) -> bool:
         """Delete a convention."""
-        initial_length = len(self._data["conventions"])
-        self._data["conventions"] = [
-            c for c in self._data["conventions"] if c["id"] != convention_id
-        ]
+        if not self._remove_convention(convention_id):
+            return False
 
-        if len(self._data["conventions"]) < initial_length:
-            self._save_data()
-            return True
-        return False
+        self._log({"table": "conventions", "delete": convention_id})
+        return True
 
+    @_synchronized
     def save_analysis(self, analysis: RepositoryAnalysis) -> str:
         """Save repository analysis."""
         analysis_dict = analysis.dict()
@@ -600,28 +1051,23 @@ class JSONStorage(ConventionStorage):
             k.value: v for k, v in analysis.convention_summary.items()
         }
 
-        # Check if analysis exists
-        for i, existing in enumerate(self._data["analyses"]):
-            if existing["id"] == analysis.id:
-                self._data["analyses"][i] = analysis_dict
-                break
-        else:
-            self._data["analyses"].append(analysis_dict)
-
-        self._save_data()
+        self._put_record("analyses", analysis_dict)
+        self._log({"table": "analyses", "record": analysis_dict})
         return analysis.id
 
+    @_synchronized
     def get_analysis(self, analysis_id: str) -> RepositoryAnalysis | None:
         """Get analysis by ID."""
-        for analysis_dict in self._data["analyses"]:
-            if analysis_dict["id"] == analysis_id:
-                return self._dict_to_analysis(analysis_dict)
-        return None
+        analysis_dict = self._data["analyses"].get(analysis_id)
+        if analysis_dict is None:
+            return None
+        return self._dict_to_analysis(analysis_dict)
 
+    @_synchronized
     def get_repository_analyses(self, repository_url: str) -> list[RepositoryAnalysis]:
         """Get all analyses for a repository."""
         analyses = []
-        for analysis_dict in self._data["analyses"]:
+        for analysis_dict in self._data["analyses"].values():
             if analysis_dict["repository_url"] == repository_url:
                 analyses.append(self._dict_to_analysis(analysis_dict))
 
@@ -632,10 +1078,10 @@ class JSONStorage(ConventionStorage):
         """Convert dict to RepositoryAnalysis object."""
         # Convert string enums back to enum values
         analysis_dict["languages_used"] = [
-            ProgrammingLanguage(lang) for lang in analysis_dict["languages_used"]
+            _LANGUAGES[lang] for lang in analysis_dict["languages_used"]
         ]
         analysis_dict["convention_summary"] = {
-            ConventionCategory(k): v for k, v in analysis_dict["convention_summary"].items()
+            _CATEGORIES[k]: v for k, v in analysis_dict["convention_summary"].items()
         }
 
         # Convert ISO string back to datetime
@@ -644,28 +1090,23 @@ class JSONStorage(ConventionStorage):
 
         return RepositoryAnalysis(**analysis_dict)
 
+    @_synchronized
     def save_comparison(self, comparison: ComparisonResult) -> str:
         """Save comparison result."""
         comparison_dict = comparison.dict()
         comparison_dict["compared_at"] = comparison.compared_at.isoformat()
 
-        # Check if comparison exists
-        for i, existing in enumerate(self._data["comparisons"]):
-            if existing["id"] == comparison.id:
-                self._data["comparisons"][i] = comparison_dict
-                break
-        else:
-            self._data["comparisons"].append(comparison_dict)
-
-        self._save_data()
+        self._put_record("comparisons", comparison_dict)
+        self._log({"table": "comparisons", "record": comparison_dict})
         return comparison.id
 
+    @_synchronized
     def get_comparison(self, comparison_id: str) -> ComparisonResult | None:
         """Get comparison by ID."""
-        for comparison_dict in self._data["comparisons"]:
-            if comparison_dict["id"] == comparison_id:
-                return self._dict_to_comparison(comparison_dict)
-        return None
+        comparison_dict = self._data["comparisons"].get(comparison_id)
+        if comparison_dict is None:
+            return None
+        return self._dict_to_comparison(comparison_dict)
 
     def _dict_to_comparison(self, comparison_dict: dict[str, Any]) -> ComparisonResult:
         """Convert dict to ComparisonResult object."""
@@ -676,8 +1117,118 @@ class JSONStorage(ConventionStorage):
         return ComparisonResult(**comparison_dict)
 
 
+class CachedStorage(ConventionStorage):
+    """Storage wrapper keeping recently read conventions in memory.
+
+    Writes made through the wrapper evict the affected IDs. Writes made through
+    another storage instance are not seen; callers evict those with ``invalidate``.
+    """
+
+    def __init__(self, backend: ConventionStorage, maxsize: int = 4096):
+        super().__init__()
+        self.backend = backend
+        self.maxsize = maxsize
+        self._conventions: OrderedDict[str, CodeConvention] = OrderedDict()
+
+    def invalidate(self, convention_ids: Iterable[str]):
+        """Drop the given conventions from the cache."""
+        for convention_id in convention_ids:
+            self._conventions.pop(convention_id, None)
+
+    @contextmanager
+    def write_batch(self) -> Generator[None, None, None]:
+        """Group several writes so they are persisted together."""
+        with self.backend.write_batch():
+            yield
+
+    def save_convention(self, convention: CodeConvention) -> str:
+        """Save a coding convention."""
+        convention_id = self.backend.save_convention(convention)
+        self._conventions.pop(convention.id, None)
+        return convention_id
+
+    def save_conventions(self, conventions: list[CodeConvention]) -> list[str]:
+        """Save several coding conventions together."""
+        convention_ids = self.backend.save_conventions(conventions)
+        self.invalidate(convention.id for convention in conventions)
+        return convention_ids
+
+    def get_convention(self, convention_id: str) -> CodeConvention | None:
+        """Get a coding convention by ID."""
+        convention = self._conventions.get(convention_id)
+        if convention is not None:
+            self._conventions.move_to_end(convention_id)
+            return convention
+
+        convention = self.backend.get_convention(convention_id)
+        if convention is not None:
+            self._conventions[convention_id] = convention
+            if len(self._conventions) > self.maxsize:
+                self._conventions.popitem(last=False)
+        return convention
+
+    def get_conventions_by_ids(self, convention_ids: list[str]) -> dict[str, CodeConvention]:
+        """Get the conventions with the given IDs, keyed by ID; unknown IDs are omitted."""
+        return self.backend.get_conventions_by_ids(convention_ids)
+
+    def get_conventions(
+        self,
+        language: ProgrammingLanguage | None = None,
+        category: ConventionCategory | None = None,
+        severity: ConventionSeverity | None = None,
+        limit: int | None = 100,
+        min_severity: ConventionSeverity | None = None,
+    ) -> list[CodeConvention]:
+        """Get conventions with optional filters; ``limit=None`` returns all.
+
+        ``min_severity`` keeps conventions at least as strict as the given level.
+        """
+        return self.backend.get_conventions(language, category, severity, limit, min_severity)
+
+    def update_convention(self, convention_id: str, updates: dict[str, Any]) -> bool:
+        """Update a convention."""
+        updated = self.backend.update_convention(convention_id, updates)
+        self._conventions.pop(convention_id, None)
+        return updated
+
+    def delete_convention(self, convention_id: str) -> bool:
+        """Delete a convention."""
+        deleted = self.backend.delete_convention(convention_id)
+        self._conventions.pop(convention_id, None)
+        return deleted
+
+    def save_analysis(self, analysis: RepositoryAnalysis) -> str:
+        """Save repository analysis."""
+        return self.backend.save_analysis(analysis)
+
+    def save_analyses(self, analyses: list[RepositoryAnalysis]) -> list[str]:
+        """Save several repository analyses together."""
+        return self.backend.save_analyses(analyses)
+
+    def get_analysis(self, analysis_id: str) -> RepositoryAnalysis | None:
+        """Get analysis by ID."""
+        return self.backend.get_analysis(analysis_id)
+
+    def get_repository_analyses(self, repository_url: str) -> list[RepositoryAnalysis]:
+        """Get all analyses for a repository."""
+        return self.backend.get_repository_analyses(repository_url)
+
+    def save_comparison(self, comparison: ComparisonResult) -> str:
+        """Save comparison result."""
+        return self.backend.save_comparison(comparison)
+
+    def save_comparisons(self, comparisons: list[ComparisonResult]) -> list[str]:
+        """Save several comparison results together."""
+        return self.backend.save_comparisons(comparisons)
+
+    def get_comparison(self, comparison_id: str) -> ComparisonResult | None:
+        """Get comparison by ID."""
+        return self.backend.get_comparison(comparison_id)
+
+
+@lru_cache(maxsize=1)
 def get_storage() -> ConventionStorage:
-    """Get the appropriate storage implementation based on settings."""
+    """Get the process-wide storage implementation selected by settings."""
     settings = get_settings()
 
     if settings.storage_type.lower() == "json":
@@ -0,0 +1,6 @@
+"""Tests for Coding Convention MCP Server."""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
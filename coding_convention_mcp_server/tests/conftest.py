@@ -0,0 +1,32 @@
+"""Test configuration for pytest."""
+
+import pytest
+
+
+@pytest.fixture
+def storage_dir(tmp_path, monkeypatch):
+    """Point settings, storage and the analysis cache at a temporary directory."""
+    from coding_convention_mcp_server import _cache, server
+    from coding_convention_mcp_server.config import get_settings
+    from coding_convention_mcp_server.storage import get_storage
+
+    monkeypatch.setenv("CODING_CONVENTION_STORAGE_PATH", str(tmp_path / "data"))
+    monkeypatch.setattr(_cache, "_connection", None)
+    monkeypatch.setattr(server, "_storage", None)
+    get_settings.cache_clear()
+    get_storage.cache_clear()
+    yield tmp_path / "data"
+    get_storage().close()
+    get_settings.cache_clear()
+    get_storage.cache_clear()
+
+
+@pytest.fixture
+def sample_repository(tmp_path):
+    """A one-file Python repository for analysis."""
+    repo = tmp_path / "repo"
+    repo.mkdir()
+    (repo / "app.py").write_text(
+        "import os\n\n\ndef current_dir():\n    return os.getcwd()\n", encoding="utf-8"
+    )
+    return repo
@@ -0,0 +1,124 @@
+"""Tests for analyzer module."""
+
+import shutil
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+
+from coding_convention_mcp_server import _cache, analyzer
+from coding_convention_mcp_server.analyzer import _PARALLEL_MIN_FILES, RepositoryAnalyzer
+from coding_convention_mcp_server.models import (
+    CodeConvention,
+    ConventionCategory,
+    ProgrammingLanguage,
+    legacy_convention_id,
+    make_convention_id,
+)
+
+SNAKE_CASE = "Function names should use snake_case"
+
+
+class TestLegacyConventionIds:
+    """Tests for conventions stored under MD5-derived IDs."""
+
+    def test_ids_differ(self):
+        """Test the legacy ID is a different 16 character hex string."""
+        args = (ProgrammingLanguage.PYTHON, ConventionCategory.NAMING, SNAKE_CASE)
+        assert len(legacy_convention_id(*args)) == 16
+        assert legacy_convention_id(*args) != make_convention_id(*args)
+
+    def test_analysis_reuses_legacy_convention(self, storage_dir, sample_repository):
+        """Test analysis updates a legacy-ID convention instead of duplicating it."""
+        analyzer = RepositoryAnalyzer()
+        legacy_id = legacy_convention_id(
+            ProgrammingLanguage.PYTHON, ConventionCategory.NAMING, SNAKE_CASE
+        )
+        now = datetime.now()
+        analyzer.storage.save_convention(
+            CodeConvention(
+                id=legacy_id,
+                language=ProgrammingLanguage.PYTHON,
+                category=ConventionCategory.NAMING,
+                description=SNAKE_CASE,
+                confidence=0.5,
+                created_at=now,
+                updated_at=now,
+            )
+        )
+
+        result = analyzer.analyze(str(sample_repository))
+
+        assert result["convention_ids"] == [legacy_id]
+        stored = analyzer.storage.get_conventions(limit=None)
+        assert [conv.id for conv in stored] == [legacy_id]
+        assert stored[0].confidence > 0.5
+
+
+class TestAnalysisCache:
+    """Tests for the per-file analysis cache."""
+
+    def test_reuses_results_for_moved_files(self, storage_dir, sample_repository, tmp_path):
+        """Test a copy of a repository elsewhere hits the cache and reports its own paths."""
+        RepositoryAnalyzer().analyze(str(sample_repository))
+        count = "SELECT COUNT(*) FROM file_conv"
+        cached_files = _cache._get_connection().execute(count).fetchone()[0]
+        clone = tmp_path / "clone"
+        shutil.copytree(sample_repository, clone)
+
+        result = RepositoryAnalyzer().analyze(str(clone))
+
+        assert _cache._get_connection().execute(count).fetchone()[0] == cached_files == 1
+        assert result["conventions"]
+        assert all(
+            conv.source_repository == str(clone / "app.py") for conv in result["conventions"]
+        )
+
+
+class TestParallelAnalysis:
+    """Tests for analyses that fan files out to a process pool."""
+
+    def test_pool_forked_while_cache_is_locked(self, storage_dir, tmp_path, monkeypatch):
+        """Test workers forked while another thread holds the cache lock do not hang."""
+        repo = tmp_path / "large"
+        repo.mkdir()
+        for i in range(_PARALLEL_MIN_FILES * 2):
+            (repo / f"mod{i}.py").write_text(f"def func_{i}():\n    return {i}\n")
+
+        held = threading.Event()
+        release = threading.Event()
+
+        def hold_cache_lock():
+            with _cache._lock:
+                held.set()
+                release.wait()
+
+        pools = []
+
+        class LockedPoolExecutor(ProcessPoolExecutor):
+            """Starts its workers while another thread holds the cache lock."""
+
+            def __init__(self, *args, **kwargs):
+                super().__init__(*args, **kwargs)
+                pools.append(self)
+                threading.Thread(target=hold_cache_lock, daemon=True).start()
+                held.wait()
+
+            def __exit__(self, *exc_info):
+                release.set()
+                return super().__exit__(*exc_info)
+
+        monkeypatch.setattr(analyzer, "ProcessPoolExecutor", LockedPoolExecutor)
+        results = []
+        worker = threading.Thread(
+            target=lambda: results.append(RepositoryAnalyzer().analyze(str(repo))),
+            daemon=True,
+        )
+        worker.start()
+        worker.join(timeout=60)
+
+        if worker.is_alive():
+            release.set()
+            for process in pools[0]._processes.values():
+                process.terminate()
+        assert pools, "analysis did not use the process pool"
+        assert results and results[0]["file_count"] == _PARALLEL_MIN_FILES * 2
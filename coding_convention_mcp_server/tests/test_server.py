@@ -0,0 +1,132 @@
+"""Tests for server module."""
+
+from datetime import datetime
+
+from coding_convention_mcp_server import server
+from coding_convention_mcp_server.models import (
+    CodeConvention,
+    ConventionCategory,
+    ProgrammingLanguage,
+    compile_pattern,
+    legacy_convention_id,
+    make_convention_id,
+)
+from coding_convention_mcp_server.server import (
+    _is_fusable,
+    _matching_patterns,
+    analyze_repository,
+    get_storage_instance,
+    track_coding_convention,
+)
+
+
+class TestMatchingPatterns:
+    """Tests for _matching_patterns function."""
+
+    def test_matches_each_pattern(self):
+        """Test patterns are reported when they match anywhere in the code."""
+        patterns = [r"def \w+", r"class \w+", r"import os"]
+        code = "import os\n\ndef main():\n    pass\n"
+
+        assert _matching_patterns(patterns, code) == {r"def \w+", r"import os"}
+
+    def test_fused_scan_matches_per_pattern_search(self):
+        """Test the fused scan finds exactly what searching each pattern finds."""
+        patterns = [
+            r"def \w+",
+            r"def",  # shadowed by the longer alternative above
+            r"class (?P<name>\w+)",
+            r"(\w+) = \1",  # backreference, scanned on its own
+            r"(?i)IMPORT",  # global flag, scanned on its own
+            r"FIXME",  # must stay case-sensitive next to the flagged pattern
+            r"^\s+return",
+            r"lambda",
+            r"[unclosed",
+            r"a)|(b",
+        ]
+        code = "import os\n\nclass Foo:\n    def bar(self):  # fixme\n        return x = x\n"
+
+        expected = {
+            pattern
+            for pattern in patterns
+            if compile_pattern(pattern) is not None and compile_pattern(pattern).search(code)
+        }
+        assert _matching_patterns(patterns, code) == expected
+
+    def test_malformed_pattern_is_not_fused(self):
+        """Test a malformed pattern that compiles once wrapped is left out."""
+        assert _is_fusable("a)|(b") is False
+        assert _matching_patterns(["a)|(b", "x"], "b x") == {"x"}
+
+
+class TestTrackCodingConvention:
+    """Tests for track_coding_convention tool."""
+
+    async def test_tracks_new_convention(self, storage_dir):
+        """Test a new convention is stored under its derived ID."""
+        result = await track_coding_convention("python", "naming", "Use snake_case")
+
+        convention_id = make_convention_id(
+            ProgrammingLanguage.PYTHON, ConventionCategory.NAMING, "Use snake_case"
+        )
+        assert result == f"Tracked new convention: {convention_id}"
+        assert get_storage_instance().get_convention(convention_id) is not None
+
+    async def test_updates_convention_stored_under_legacy_id(self, storage_dir):
+        """Test a convention saved with an MD5-derived ID is updated, not duplicated."""
+        legacy_id = legacy_convention_id(
+            ProgrammingLanguage.PYTHON, ConventionCategory.NAMING, "Use snake_case"
+        )
+        now = datetime.now()
+        get_storage_instance().save_convention(
+            CodeConvention(
+                id=legacy_id,
+                language=ProgrammingLanguage.PYTHON,
+                category=ConventionCategory.NAMING,
+                description="Use snake_case",
+                confidence=0.5,
+                created_at=now,
+                updated_at=now,
+            )
+        )
+
+        result = await track_coding_convention("python", "naming", "Use snake_case")
+
+        assert result == f"Updated existing convention: {legacy_id}"
+        stored = get_storage_instance().get_conventions(limit=None)
+        assert [conv.id for conv in stored] == [legacy_id]
+        assert stored[0].confidence == 0.6
+
+
+class TestAnalyzeRepository:
+    """Tests for analyze_repository tool."""
+
+    async def test_invalidates_cached_conventions(self, storage_dir, sample_repository):
+        """Test conventions updated by an analysis are not served stale from the cache."""
+        description = "Function names should use snake_case"
+        await track_coding_convention("python", "naming", description, confidence=0.5)
+        convention_id = make_convention_id(
+            ProgrammingLanguage.PYTHON, ConventionCategory.NAMING, description
+        )
+        storage = get_storage_instance()
+        assert storage.get_convention(convention_id).confidence == 0.5
+
+        await analyze_repository(str(sample_repository))
+
+        assert storage.get_convention(convention_id).confidence == 0.6
+
+    async def test_reuses_unchanged_analysis(self, storage_dir, sample_repository, monkeypatch):
+        """Test an unchanged repository is not reanalyzed and the cache stays bounded."""
+        monkeypatch.setattr(server, "_analysis_cache", server.OrderedDict())
+        monkeypatch.setattr(server, "_ANALYSIS_CACHE_SIZE", 1)
+        other = sample_repository.parent / "other"
+        other.mkdir()
+        (other / "main.py").write_text("x = 1\n", encoding="utf-8")
+
+        first = await analyze_repository(str(sample_repository))
+        assert await analyze_repository(str(sample_repository)) == first
+        assert len(server._analysis_cache) == 1
+
+        await analyze_repository(str(other))
+        assert len(server._analysis_cache) == 1
+        assert await analyze_repository(str(sample_repository)) != first
@@ -0,0 +1,150 @@
+"""Tests for storage module."""
+
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+
+import pytest
+
+from coding_convention_mcp_server import storage as storage_module
+from coding_convention_mcp_server.models import (
+    CodeConvention,
+    ConventionCategory,
+    ProgrammingLanguage,
+)
+from coding_convention_mcp_server.storage import JSONStorage, SQLiteStorage
+
+
+def make_convention(index: int, confidence: float = 1.0) -> CodeConvention:
+    """Build a distinct Python naming convention."""
+    now = datetime.now()
+    return CodeConvention(
+        id=f"conv{index:04d}",
+        language=ProgrammingLanguage.PYTHON,
+        category=ConventionCategory.NAMING,
+        description=f"Convention {index}",
+        confidence=confidence,
+        created_at=now,
+        updated_at=now,
+    )
+
+
+class TestJSONStorage:
+    """Tests for JSONStorage snapshot and log handling."""
+
+    def test_replays_log_after_reopen(self, tmp_path):
+        """Test saves, updates and deletes survive a reopen through the log."""
+        path = tmp_path / "conventions.json"
+        storage = JSONStorage(path)
+        for i in range(3):
+            storage.save_convention(make_convention(i))
+        storage.update_convention("conv0001", {"confidence": 0.25})
+        storage.delete_convention("conv0002")
+        storage.close()
+
+        assert not path.exists()
+        reopened = JSONStorage(path)
+        ids = {conv.id for conv in reopened.get_conventions(limit=None)}
+        assert ids == {"conv0000", "conv0001"}
+        assert reopened.get_convention("conv0001").confidence == 0.25
+        reopened.close()
+
+    def test_compaction_keeps_every_record(self, tmp_path):
+        """Test compact() folds the log into a snapshot without losing records."""
+        path = tmp_path / "conventions.json"
+        storage = JSONStorage(path)
+        with storage.write_batch():
+            for i in range(50):
+                storage.save_convention(make_convention(i))
+        storage.compact()
+        storage.close()
+
+        assert path.with_suffix(".jsonl").read_text(encoding="utf-8") == ""
+        reopened = JSONStorage(path)
+        assert len(reopened.get_conventions(limit=None)) == 50
+        reopened.close()
+
+    def test_compacts_long_log_on_open(self, tmp_path, monkeypatch):
+        """Test a log that outgrew its records is compacted when the store opens."""
+        monkeypatch.setattr(storage_module, "_COMPACT_MIN_ENTRIES", 10)
+        path = tmp_path / "conventions.json"
+        storage = JSONStorage(path)
+        storage.save_convention(make_convention(0))
+        storage.save_convention(make_convention(1))
+        for _ in range(4):
+            storage.update_convention("conv0000", {"confidence": 0.5})
+        storage.close()
+        assert not path.exists()
+        # Six log entries for two records: over the limit once it is lowered
+        monkeypatch.setattr(storage_module, "_COMPACT_MIN_ENTRIES", 2)
+
+        reopened = JSONStorage(path)
+        assert path.exists()
+        assert path.with_suffix(".jsonl").read_text(encoding="utf-8") == ""
+        assert {conv.id for conv in reopened.get_conventions(limit=None)} == {
+            "conv0000",
+            "conv0001",
+        }
+        reopened.close()
+
+
+class TestSQLiteStorage:
+    """Tests for SQLiteStorage write batches."""
+
+    def test_write_batch_commits_once(self, tmp_path):
+        """Test writes in a batch are visible after it exits."""
+        storage = SQLiteStorage(tmp_path / "conventions.db")
+        with storage.write_batch():
+            storage.save_conventions([make_convention(i) for i in range(3)])
+            storage.update_convention("conv0000", {"confidence": 0.5})
+        storage.close()
+
+        reopened = SQLiteStorage(tmp_path / "conventions.db")
+        assert len(reopened.get_conventions(limit=None)) == 3
+        assert reopened.get_convention("conv0000").confidence == 0.5
+        reopened.close()
+
+    def test_write_batch_rolls_back_on_error(self, tmp_path):
+        """Test a failing batch leaves none of its writes behind."""
+        storage = SQLiteStorage(tmp_path / "conventions.db")
+        storage.save_convention(make_convention(0))
+
+        with pytest.raises(RuntimeError):
+            with storage.write_batch():
+                storage.save_convention(make_convention(1))
+                with storage.write_batch():
+                    storage.update_convention("conv0000", {"confidence": 0.5})
+                raise RuntimeError("analysis failed")
+
+        assert [conv.id for conv in storage.get_conventions(limit=None)] == ["conv0000"]
+        assert storage.get_convention("conv0000").confidence == 1.0
+        # The connection is usable again after the rollback
+        storage.save_convention(make_convention(2))
+        assert storage.get_convention("conv0002") is not None
+        storage.close()
+
+    def test_returned_conventions_are_independent(self, tmp_path):
+        """Test mutating a read convention does not change later reads of the row."""
+        storage = SQLiteStorage(tmp_path / "conventions.db")
+        storage.save_convention(make_convention(0))
+
+        first = storage.get_convention("conv0000")
+        first.confidence = 0.1
+        first.metadata["changed"] = True
+
+        second = storage.get_convention("conv0000")
+        assert second.confidence == 1.0
+        assert "changed" not in second.metadata
+        storage.close()
+
+    def test_closes_connections_of_finished_threads(self, tmp_path):
+        """Test per-thread connections are released once their threads exit."""
+        storage = SQLiteStorage(tmp_path / "conventions.db")
+        storage.save_convention(make_convention(0))
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            results = list(executor.map(lambda _: storage.get_convention("conv0000"), range(20)))
+
+        assert all(result is not None for result in results)
+        # Only the main thread's connection remains
+        assert len(storage._connections) == 1
+        storage.close()
@@ -2,6 +2,7 @@
 """Script to manually set Telegram bot commands."""
 
 import asyncio
+import re
 import sys
 import json
 from pathlib import Path
@@ -15,6 +16,9 @@ from telegram_mcp_server.commands import get_bot_commands
 from telegram_mcp_server.config import get_settings
 import httpx
 
+# Telegram allows 1-32 characters and requires a leading letter
+_CMD_RE = re.compile(r"[a-z][a-z0-9_]{0,31}")
+
 async def main():
     """Set bot commands."""
     settings = get_settings()
@@ -33,13 +37,11 @@ async def main():
         desc = cmd['description']
         # Check command name format (Telegram: lowercase English letters, digits, underscore)
         valid = True
-        for char in cmd_name:
-            if not (char.islower() and char.isalpha()) and not char.isdigit() and char != '_':
-                print(f"  ❌ Command '{cmd_name}' contains invalid character: '{char}'")
-                valid = False
-                break
-        if not cmd_name[0].isalpha():
-            print(f"  ❌ Command '{cmd_name}' doesn't start with a letter")
+        if not _CMD_RE.fullmatch(cmd_name):
+            print(
+                f"  ❌ Command '{cmd_name}' must be 1-32 lowercase letters, digits or "
+                "underscores, starting with a letter"
+            )
             valid = False
         if len(desc) > 256:
             print(f"  ❌ Command '{cmd_name}' description too long: {len(desc)} chars")
@@ -48,27 +50,20 @@ async def main():
             print(f"  ✓ {cmd_name}: {desc[:50]}...")
     
     try:
-        # Try to set commands directly to see error
+        # Goes through the client's own connection pool, which the checks below reuse
         print("\nAttempting to set commands...")
-        import httpx
-        async with httpx.AsyncClient(timeout=30.0) as http_client:
-            url = f"https://api.telegram.org/bot{settings.bot_token}/setMyCommands"
-            response = await http_client.post(url, json={"commands": commands})
-            print(f"Response status: {response.status_code}")
-            if response.status_code != 200:
-                print(f"Response body: {response.text}")
-                try:
-                    error_data = response.json()
-                    print(f"Error details: {json.dumps(error_data, indent=2)}")
-                except:
-                    pass
-            response.raise_for_status()
-            print("✅ Commands set successfully via direct API call!")
+        await client.set_my_commands(commands)
+        print("✅ Commands set successfully!")
             
     except httpx.HTTPStatusError as e:
         print(f"❌ HTTP error: {e}")
-        if e.response:
-            print(f"Response: {e.response.text}")
+        print(f"Response status: {e.response.status_code}")
+        print(f"Response body: {e.response.text}")
+        try:
+            error_data = e.response.json()
+            print(f"Error details: {json.dumps(error_data, indent=2)}")
+        except ValueError:
+            pass
         return 1
     except Exception as e:
         print(f"❌ Error: {e}")
@@ -12,10 +12,15 @@ Usage:
 
 import argparse
 import asyncio
+import contextlib
 import json
 import logging
 import os
+import re
 import signal
+import tempfile
+import threading
+from collections import OrderedDict
 from datetime import datetime
 from pathlib import Path
 from typing import Any
@@ -31,6 +36,12 @@ QUEUE_CACHE_TTL_SECONDS = 0.5  # Cache queue reads for 500ms
 STATE_SAVE_DEBOUNCE_SECONDS = 1.0  # Debounce state saves by 1 second
 TYPING_POLL_INTERVAL_SECONDS = 2.0  # Typing indicator interval
 PERMISSION_POLL_INTERVAL_SECONDS = 0.5  # Poll for pending requests during waits
+TELEGRAM_KEEPALIVE_SECONDS = 60.0  # Reuse the api.telegram.org connection between replies
+TELEGRAM_MAX_MESSAGE_LENGTH = 4000  # Stay under Telegram's 4096 character limit
+REPLY_SEPARATOR = "\n---\n"  # Between command replies coalesced into one message
+FORWARDED_IDS_LIMIT = 10_000  # Remember this many processed message IDs
+IDLE_POLL_BACKOFF = 1.5  # Poll interval growth per idle poll
+IDLE_POLL_MAX_SECONDS = 5.0  # Poll interval ceiling while the queue stays idle
 
 # Configure logging
 logging.basicConfig(
@@ -40,41 +51,127 @@ logging.basicConfig(
 logger = logging.getLogger("telegram_opencode_bridge")
 
 
+# Code spans and blocks; Telegram does not parse Markdown inside them
+_MARKDOWN_CODE_RE = re.compile(r"```.*?```|`[^`]*`", re.DOTALL)
+
+
+def _looks_safe_markdown(text: str) -> bool:
+    """Cheaply check whether Telegram's legacy Markdown parser will accept text.
+
+    Outside code spans, an odd number of * or _ (or a stray backtick) leaves an
+    entity unclosed and the API rejects the message; such text is sent as
+    plain text straight away instead of failing once first.
+    """
+    rest = _MARKDOWN_CODE_RE.sub("", text)
+    return "`" not in rest and rest.count("*") % 2 == 0 and rest.count("_") % 2 == 0
+
+
+def _split_message(text: str, limit: int = TELEGRAM_MAX_MESSAGE_LENGTH) -> list[str]:
+    """Split text into chunks of at most limit characters.
+
+    Breaks at the last paragraph break in the second half of a chunk, else the
+    last line break, else the last space, and only mid-word as a last resort.
+    Whitespace-only pieces are dropped, since Telegram rejects empty messages.
+    """
+    chunks: list[str] = []
+    while len(text) > limit:
+        for sep, start in (("\n\n", limit // 2), ("\n", 1), (" ", 1)):
+            cut = text.rfind(sep, start, limit)
+            if cut != -1:
+                # Drop the separator itself, keep any indentation after it
+                head, text = text[:cut], text[cut + len(sep):]
+                if sep == " ":
+                    # Drop the whole run of spaces, not just its last one
+                    head, text = head.rstrip(" "), text.lstrip(" ")
+                break
+        else:
+            head, text = text[:limit], text[limit:]
+        if head.strip():
+            chunks.append(head)
+    if text.strip() or not chunks:
+        chunks.append(text)
+    return chunks
+
+
+class RecentIds(OrderedDict[int, None]):
+    """Set of the most recently added IDs, bounded to a fixed size.
+
+    Queued messages are cleared after a few minutes, so only recent IDs can
+    ever show up again; older ones are evicted in insertion order. Built on
+    OrderedDict so membership tests stay in C.
+    """
+
+    def __init__(self, ids: Any = (), maxlen: int = FORWARDED_IDS_LIMIT):
+        super().__init__()
+        self.maxlen = maxlen
+        for msg_id in ids:
+            self.add(msg_id)
+
+    def add(self, msg_id: int) -> None:
+        self[msg_id] = None
+        if len(self) > self.maxlen:
+            self.popitem(last=False)
+
+
+def _atomic_write_text(path: Path, payload: str) -> os.stat_result:
+    """Write payload to a unique temp file beside path, then rename it into place.
+
+    Returns the temp file's stat, taken before the rename; the renamed file
+    keeps it, so there is no window where another writer's file is stat'ed.
+    """
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f"{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(payload)
+        stat = os.stat(tmp_name)
+        os.replace(tmp_name, path)
+    except BaseException:
+        with contextlib.suppress(FileNotFoundError):
+            os.unlink(tmp_name)
+        raise
+    return stat
+
+
 class TelegramClient:
     """Simple Telegram client for sending replies."""
 
     def __init__(self, bot_token: str):
         self.bot_token = bot_token
         self.base_url = f"https://api.telegram.org/bot{bot_token}"
-        self.client = httpx.AsyncClient(timeout=10.0, limits=httpx.Limits(max_keepalive_connections=5, max_connections=10))
+        self._send_url = f"{self.base_url}/sendMessage"
+        self.client = httpx.AsyncClient(
+            timeout=10.0,
+            limits=httpx.Limits(
+                max_keepalive_connections=5,
+                max_connections=10,
+                keepalive_expiry=TELEGRAM_KEEPALIVE_SECONDS,
+            ),
+        )
 
     async def close(self):
         await self.client.aclose()
 
     async def send_message(self, chat_id: str | int, text: str) -> dict[str, Any]:
-        """Send a message to a Telegram chat."""
-        # Telegram has a 4096 character limit per message
-        MAX_LENGTH = 4000
-        if len(text) > MAX_LENGTH:
-            text = text[:MAX_LENGTH] + "\n\n... (truncated)"
+        """Send a message to a Telegram chat.
 
-        response = await self.client.post(
-            f"{self.base_url}/sendMessage",
-            json={
-                "chat_id": chat_id,
-                "text": text,
-                "parse_mode": "Markdown",
-            },
-        )
-        if response.status_code != 200:
+        Text over Telegram's length limit is sent as several messages, in order;
+        the response for the last one is returned.
+        """
+        for chunk in _split_message(text):
+            result = await self._send_one(chat_id, chunk)
+        return result
+
+    async def _send_one(self, chat_id: str | int, text: str) -> dict[str, Any]:
+        """Send a single message that fits within Telegram's length limit."""
+        payload: dict[str, Any] = {"chat_id": chat_id, "text": text}
+        markdown = _looks_safe_markdown(text)
+        if markdown:
+            payload["parse_mode"] = "Markdown"
+        response = await self.client.post(self._send_url, json=payload)
+        if markdown and response.status_code != 200:
             # Try without markdown if it fails
-            response = await self.client.post(
-                f"{self.base_url}/sendMessage",
-                json={
-                    "chat_id": chat_id,
-                    "text": text,
-                },
-            )
+            del payload["parse_mode"]
+            response = await self.client.post(self._send_url, json=payload)
         response.raise_for_status()
         return response.json()
 
@@ -149,25 +246,19 @@ class TelegramClient:
         if len(text) > MAX_LENGTH:
             text = text[:MAX_LENGTH] + "\n\n... (truncated)"
 
-        response = await self.client.post(
-            f"{self.base_url}/sendMessage",
-            json={
-                "chat_id": chat_id,
-                "text": text,
-                "parse_mode": "Markdown",
-                "reply_markup": {"inline_keyboard": inline_keyboard},
-            },
-        )
-        if response.status_code != 200:
+        payload: dict[str, Any] = {
+            "chat_id": chat_id,
+            "text": text,
+            "reply_markup": {"inline_keyboard": inline_keyboard},
+        }
+        markdown = _looks_safe_markdown(text)
+        if markdown:
+            payload["parse_mode"] = "Markdown"
+        response = await self.client.post(self._send_url, json=payload)
+        if markdown and response.status_code != 200:
             # Try without markdown if it fails
-            response = await self.client.post(
-                f"{self.base_url}/sendMessage",
-                json={
-                    "chat_id": chat_id,
-                    "text": text,
-                    "reply_markup": {"inline_keyboard": inline_keyboard},
-                },
-            )
+            del payload["parse_mode"]
+            response = await self.client.post(self._send_url, json=payload)
         response.raise_for_status()
         return response.json()
 
@@ -223,8 +314,10 @@ class TelegramClient:
             "chat_id": chat_id,
             "message_id": message_id,
             "text": text,
-            "parse_mode": "Markdown",
         }
+        markdown = _looks_safe_markdown(text)
+        if markdown:
+            params["parse_mode"] = "Markdown"
         if inline_keyboard is not None:
             params["reply_markup"] = {"inline_keyboard": inline_keyboard}
 
@@ -232,7 +325,7 @@ class TelegramClient:
             f"{self.base_url}/editMessageText",
             json=params,
         )
-        if response.status_code != 200:
+        if markdown and response.status_code != 200:
             # Try without markdown
             params["parse_mode"] = None
             response = await self.client.post(
@@ -259,6 +352,8 @@ class TelegramOpenCodeBridge:
     ):
         self.opencode = OpenCodeClient(opencode_url)
         self.poll_interval = poll_interval
+        # Current delay between polls; backs off while idle, resets on activity
+        self._idle_interval = poll_interval
         self.reply_to_telegram = reply_to_telegram
         self.running = False
         self.session_id: str | None = None
@@ -296,7 +391,7 @@ class TelegramOpenCodeBridge:
         self.bridge_state_file = self.queue_dir / "bridge_state.json"
 
         # Track which messages we've already forwarded
-        self.forwarded_ids: set[int] = set()
+        self.forwarded_ids = RecentIds()
         
         # Track pending questions awaiting Telegram response
         # Format: {telegram_msg_id: {"request_id": str, "session_id": str, "questions": list, "options": list}}
@@ -315,12 +410,23 @@ class TelegramOpenCodeBridge:
         # In-memory queue for faster processing (loaded from file on startup)
         self._in_memory_queue: list[dict[str, Any]] = []
         self._last_queue_read_time: datetime | None = None
-        self._queue_file_mtime: float = 0.0  # Track file modification time to avoid unnecessary reads
+        # (st_mtime_ns, st_size) of the queue file as last read, to skip unchanged files
+        self._queue_file_sig: tuple[int, int] | None = None
+        # Last queue snapshot found to hold nothing new, to skip rescanning it
+        self._scanned_queue: list[dict[str, Any]] | None = None
 
         # Debounced state saving with coalescing
         self._state_dirty = False
         self._state_save_task: asyncio.Task | None = None
         self._last_state_save_time: datetime | None = None
+        # Snapshots are numbered so a write still running in a worker thread
+        # never replaces a newer one (e.g. the final save at shutdown)
+        self._state_seq = 0
+        self._state_written_seq = 0
+        self._state_write_lock = threading.Lock()
+
+        # Plain command replies held back within a poll cycle: [(chat_id, text)]
+        self._pending_replies: list[tuple[int, str]] = []
 
         # Session validation cache to avoid repeated API calls
         self._session_validated: bool = False
@@ -337,7 +443,7 @@ class TelegramOpenCodeBridge:
         try:
             with open(self.bridge_state_file, "r", encoding="utf-8") as f:
                 data = json.load(f)
-                self.forwarded_ids = set(data.get("forwarded_ids", []))
+                self.forwarded_ids = RecentIds(data.get("forwarded_ids", []))
                 # Load session info
                 self.session_id = data.get("session_id")
                 session_model = data.get("session_model")
@@ -370,7 +476,13 @@ class TelegramOpenCodeBridge:
 
     def _save_state(self) -> None:
         """Save bridge state to file (forwarded IDs and session info)."""
-        self.queue_dir.mkdir(parents=True, exist_ok=True)
+        self._write_state_file(*self._serialize_state())
+
+    def _serialize_state(self) -> tuple[str, int]:
+        """Snapshot bridge state as JSON (on the event loop, while nothing mutates it).
+
+        Returns the JSON and the snapshot's sequence number.
+        """
         sessions_serializable = {k: list(v) for k, v in self.sessions.items()}
         session_model_list = list(self.session_model) if self.session_model else None
         pending_q_serializable = {str(k): v for k, v in self.pending_questions.items()}
@@ -388,8 +500,17 @@ class TelegramOpenCodeBridge:
             "model_cache": model_cache_serializable,
             "last_updated": datetime.now().isoformat(),
         }
-        with open(self.bridge_state_file, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2)
+        self._state_seq += 1
+        return json.dumps(data, separators=(",", ":")), self._state_seq
+
+    def _write_state_file(self, payload: str, seq: int) -> None:
+        """Atomically replace the state file with payload, unless a newer snapshot is saved."""
+        with self._state_write_lock:
+            if seq < self._state_written_seq:
+                return
+            self.queue_dir.mkdir(parents=True, exist_ok=True)
+            _atomic_write_text(self.bridge_state_file, payload)
+            self._state_written_seq = seq
 
     async def _schedule_save_state(self) -> None:
         """Schedule a state save with debouncing and coalescing.
@@ -406,9 +527,11 @@ class TelegramOpenCodeBridge:
         Uses configurable debounce time to batch multiple state changes.
         """
         await asyncio.sleep(STATE_SAVE_DEBOUNCE_SECONDS)
-        if self._state_dirty:
-            self._save_state()
+        # Changes made while a write is in flight mark state dirty again; loop
+        # so they are not left waiting for the next scheduled save
+        while self._state_dirty:
             self._state_dirty = False
+            await asyncio.to_thread(self._write_state_file, *self._serialize_state())
             self._last_state_save_time = datetime.now()
 
     def _set_session_model(self, provider_id: str, model_id: str) -> None:
@@ -451,11 +574,12 @@ class TelegramOpenCodeBridge:
         
         return truncated + "..."
 
-    def _read_queue(self) -> list[dict[str, Any]]:
+    async def _read_queue(self) -> list[dict[str, Any]]:
         """Read messages from queue file with intelligent caching.
         
         Uses file modification time to avoid unnecessary reads when the file
         hasn't changed, and caches in memory with a short TTL for rapid access.
+        File access runs in a worker thread so a slow disk does not stall the loop.
         """
         now = datetime.now()
         
@@ -465,31 +589,57 @@ class TelegramOpenCodeBridge:
             and (now - self._last_queue_read_time).total_seconds() < QUEUE_CACHE_TTL_SECONDS):
             return self._in_memory_queue
 
-        if not self.queue_file.exists():
+        try:
+            stat = await asyncio.to_thread(self.queue_file.stat)
+        except FileNotFoundError:
             self._in_memory_queue = []
+            self._queue_file_sig = None
             self._last_queue_read_time = now
             return []
+        except OSError:
+            return self._in_memory_queue
+
+        # Skip the parse while the file is unchanged, including when it is empty,
+        # so an idle bridge only stats the file each poll
+        sig = (stat.st_mtime_ns, stat.st_size)
+        if sig == self._queue_file_sig:
+            self._last_queue_read_time = now
+            return self._in_memory_queue
 
         try:
-            # Check file modification time - avoid read if unchanged
-            current_mtime = self.queue_file.stat().st_mtime
-            if current_mtime == self._queue_file_mtime and self._in_memory_queue:
-                self._last_queue_read_time = now
-                return self._in_memory_queue
-            
-            with open(self.queue_file, "r", encoding="utf-8") as f:
-                self._in_memory_queue = json.load(f)
-                self._last_queue_read_time = now
-                self._queue_file_mtime = current_mtime
-                return self._in_memory_queue
+            # Parse the raw bytes directly rather than through a text-mode decoder
+            self._in_memory_queue = json.loads(await asyncio.to_thread(self.queue_file.read_bytes))
+            self._last_queue_read_time = now
+            self._queue_file_sig = sig
+            return self._in_memory_queue
         except (json.JSONDecodeError, FileNotFoundError, OSError):
             return self._in_memory_queue if self._in_memory_queue else []
 
-    def _remove_from_queue(self, message_ids: set[int]) -> None:
+    async def _write_queue(self, messages: list[dict[str, Any]]) -> None:
+        """Replace the queue file with messages.
+
+        Written compactly to a temp file and renamed into place, so the poller
+        and MCP server never read a half-written queue.
+        """
+        payload = json.dumps(messages, ensure_ascii=False, separators=(",", ":"))
+        # Record the file we wrote so the next read does not re-parse it
+        self._queue_file_sig = await asyncio.to_thread(self._replace_queue_file, payload)
+
+    def _replace_queue_file(self, payload: str) -> tuple[int, int]:
+        """Atomically replace the queue file; returns its new stat signature."""
+        stat = _atomic_write_text(self.queue_file, payload)
+        return (stat.st_mtime_ns, stat.st_size)
+
+    async def _remove_from_queue(self, message_ids: set[int]) -> None:
         """Remove processed messages from queue.
         
         Updates both in-memory cache and file atomically.
         """
+        # Pick up anything the poller appended since our last read, so the
+        # rewrite below does not drop it (only re-parses if the file changed)
+        self._last_queue_read_time = None
+        await self._read_queue()
+
         # Update in-memory cache first
         self._in_memory_queue = [
             msg for msg in self._in_memory_queue 
@@ -498,13 +648,11 @@ class TelegramOpenCodeBridge:
         
         # Write to file
         try:
-            with open(self.queue_file, "w", encoding="utf-8") as f:
-                json.dump(self._in_memory_queue, f, indent=2, ensure_ascii=False)
-            self._queue_file_mtime = self.queue_file.stat().st_mtime
+            await self._write_queue(self._in_memory_queue)
         except OSError as e:
             logger.warning(f"Failed to write queue file: {e}")
 
-    def _clear_queue(self) -> int:
+    async def _clear_queue(self) -> int:
         """Clear all messages from the queue.
         
         Returns:
@@ -514,15 +662,13 @@ class TelegramOpenCodeBridge:
         if count > 0:
             self._in_memory_queue = []
             try:
-                with open(self.queue_file, "w", encoding="utf-8") as f:
-                    json.dump([], f)
-                self._queue_file_mtime = self.queue_file.stat().st_mtime
+                await self._write_queue([])
             except OSError as e:
                 logger.warning(f"Failed to clear queue file: {e}")
             logger.info(f"Cleared {count} messages from queue")
         return count
 
-    def _clear_old_messages_from_queue(self, max_age_seconds: int = 300) -> int:
+    async def _clear_old_messages_from_queue(self, max_age_seconds: int = 300) -> int:
         """Remove messages older than max_age_seconds from the queue.
         
         Args:
@@ -570,30 +716,38 @@ class TelegramOpenCodeBridge:
         if removed_count > 0:
             self._in_memory_queue = remaining
             try:
-                with open(self.queue_file, "w", encoding="utf-8") as f:
-                    json.dump(remaining, f, indent=2, ensure_ascii=False)
-                self._queue_file_mtime = self.queue_file.stat().st_mtime
+                await self._write_queue(remaining)
             except OSError as e:
                 logger.warning(f"Failed to write queue file during cleanup: {e}")
             logger.info(f"Removed {removed_count} old messages from queue (older than {max_age_seconds}s)")
         
         return removed_count
 
-    async def process_queue(self) -> None:
-        """Process any new messages in the queue."""
-        queue = self._read_queue()
+    async def process_queue(self) -> bool:
+        """Process any new messages in the queue.
 
-        if not queue:
-            return
+        Returns:
+            True if there were new messages to process.
+        """
+        queue = await self._read_queue()
+
+        # _read_queue hands back the same list while the file is unchanged. A
+        # snapshot is only recorded below once every ID in it is known, i.e. all
+        # its messages were handled, so it stays skipped even after some of
+        # those IDs are evicted from forwarded_ids
+        if not queue or queue is self._scanned_queue:
+            return False
 
         # Filter to messages we haven't forwarded yet
+        forwarded = self.forwarded_ids
         new_messages = [
             msg for msg in queue
-            if msg.get("message_id") not in self.forwarded_ids
+            if msg.get("message_id") not in forwarded
         ]
 
         if not new_messages:
-            return
+            self._scanned_queue = queue
+            return False
 
         # Process each message
         processed_ids: set[int] = set()
@@ -605,6 +759,7 @@ class TelegramOpenCodeBridge:
             
             # Handle callback queries (button clicks) first
             if msg_type == "callback_query":
+                await self._flush_replies()
                 await self._handle_callback_query(msg)
                 if msg_id is not None:
                     self.forwarded_ids.add(msg_id)
@@ -638,13 +793,14 @@ class TelegramOpenCodeBridge:
                     # Check if response is a CommandResponse with keyboard
                     if isinstance(response, CommandResponse):
                         if response.keyboard:
+                            await self._flush_replies()
                             await self.telegram.send_message_with_keyboard(
                                 chat_id, response.text, response.keyboard
                             )
                         else:
-                            await self.telegram.send_message(chat_id, response.text)
+                            self._pending_replies.append((chat_id, response.text))
                     else:
-                        await self.telegram.send_message(chat_id, str(response))
+                        self._pending_replies.append((chat_id, str(response)))
                 # Update session_id in case it was changed by command
                 self.session_id = self.command_handler.current_session_id
                 self.forwarded_ids.add(msg_id)
@@ -652,6 +808,9 @@ class TelegramOpenCodeBridge:
                 asyncio.create_task(self._schedule_save_state())
                 continue
 
+            # Anything past this point may take a while, so deliver buffered replies first
+            await self._flush_replies()
+
             # Check if this is a response to a pending question
             if chat_id and self.pending_questions:
                 is_question_response = await self._check_for_question_response(text, chat_id)
@@ -796,18 +955,6 @@ class TelegramOpenCodeBridge:
                     )
                     logger.info(f"OpenCode response received for message {msg_id}")
 
-                    # Update session title after first message if not already titled
-                    if session_id and session_id not in self.sessions_titled:
-                        try:
-                            title = self._generate_session_title(text)
-                            await self.opencode.update_session(session_id, title=title)
-                            self.sessions_titled.add(session_id)
-                            asyncio.create_task(self._schedule_save_state())
-                            logger.info(f"Updated session {session_id[:8]}... title to: {title}")
-                        except Exception as e:
-                            logger.warning(f"Failed to update session title: {e}")
-                            # Don't fail the whole message - title update is optional
-
                     # Note: Pending questions/permissions are now ONLY handled during
                     # the typing loop in _poll_and_forward_pending(). This prevents
                     # duplicate messages being sent to Telegram.
@@ -818,7 +965,12 @@ class TelegramOpenCodeBridge:
                         logger.warning(f"Empty response from OpenCode for message {msg_id}, sending default message")
 
                     logger.info(f"Sending reply to Telegram: {response_text[:50]}...")
-                    await self.telegram.send_message(chat_id, response_text)
+                    reply = self.telegram.send_message(chat_id, response_text)
+                    if session_id not in self.sessions_titled:
+                        # Title the session after its first message, alongside the reply
+                        await asyncio.gather(reply, self._title_session(session_id, text))
+                    else:
+                        await reply
                     logger.info(f"Reply sent to Telegram for message {msg_id}")
                     # Persist this session as the last interacted one
                     asyncio.create_task(self._schedule_save_state())
@@ -881,10 +1033,71 @@ class TelegramOpenCodeBridge:
                 self.forwarded_ids.add(msg_id)
                 processed_ids.add(msg_id)
 
-        # Save state and clean up queue
+        await self._flush_replies()
+
+        # Clean up queue; state changes above already scheduled a debounced save
         if processed_ids:
-            self._save_state()
-            self._remove_from_queue(processed_ids)
+            await self._schedule_save_state()
+            await self._remove_from_queue(processed_ids)
+        return True
+
+    def next_poll_delay(self, active: bool) -> float:
+        """Return how long to sleep before the next poll.
+
+        Polls at poll_interval while messages are arriving and backs off
+        gradually, up to IDLE_POLL_MAX_SECONDS, while the queue stays idle.
+        """
+        if active:
+            self._idle_interval = self.poll_interval
+        else:
+            self._idle_interval = min(
+                self._idle_interval * IDLE_POLL_BACKOFF,
+                max(self.poll_interval, IDLE_POLL_MAX_SECONDS),
+            )
+        return self._idle_interval
+
+    async def _flush_replies(self) -> None:
+        """Send buffered command replies, one message per run of replies to a chat.
+
+        Consecutive replies to the same chat are joined with a separator as long
+        as the result fits in a single Telegram message, so a burst of commands
+        costs one sendMessage call instead of one per command.
+        """
+        if not self._pending_replies:
+            return
+
+        pending, self._pending_replies = self._pending_replies, []
+        groups: list[tuple[int, list[str]]] = []
+        size = 0
+        for chat_id, text in pending:
+            if (
+                groups
+                and groups[-1][0] == chat_id
+                and size + len(REPLY_SEPARATOR) + len(text) <= TELEGRAM_MAX_MESSAGE_LENGTH
+            ):
+                groups[-1][1].append(text)
+                size += len(REPLY_SEPARATOR) + len(text)
+            else:
+                groups.append((chat_id, [text]))
+                size = len(text)
+
+        for chat_id, texts in groups:
+            try:
+                await self.telegram.send_message(chat_id, REPLY_SEPARATOR.join(texts))
+            except Exception as e:
+                logger.error(f"Failed to send command reply to Telegram: {e}")
+
+    async def _title_session(self, session_id: str, text: str) -> None:
+        """Set the session title from its first message; failures are only logged."""
+        try:
+            title = self._generate_session_title(text)
+            await self.opencode.update_session(session_id, title=title)
+            self.sessions_titled.add(session_id)
+            asyncio.create_task(self._schedule_save_state())
+            logger.info(f"Updated session {session_id[:8]}... title to: {title}")
+        except Exception as e:
+            logger.warning(f"Failed to update session title: {e}")
+            # Don't fail the whole message - title update is optional
 
     async def _send_with_typing(
         self,
@@ -1074,7 +1287,7 @@ class TelegramOpenCodeBridge:
                         f"✅ Switched to session `{short_id}`"
                     )
             
-            self._save_state()
+            await self._schedule_save_state()
             logger.info(f"Session switched to {short_id} via callback")
             return
         
@@ -1440,7 +1653,7 @@ class TelegramOpenCodeBridge:
             return
             
         # Read the queue for new messages/callbacks
-        queue = self._read_queue()
+        queue = await self._read_queue()
         if not queue:
             return
         
@@ -1492,7 +1705,7 @@ class TelegramOpenCodeBridge:
         
         # Remove processed items from queue
         if processed_ids:
-            self._remove_from_queue(processed_ids)
+            await self._remove_from_queue(processed_ids)
 
     async def _format_question_for_telegram(self, question_request: dict[str, Any]) -> tuple[str, list[list[dict[str, str]]]]:
         """Format an OpenCode QuestionRequest for Telegram display.
@@ -1832,12 +2045,17 @@ class TelegramOpenCodeBridge:
         self.running = True
 
         # Handle graceful shutdown
-        def signal_handler(signum, frame):
+        def signal_handler(*_args: Any) -> None:
             logger.info("Received shutdown signal")
             self.running = False
 
-        signal.signal(signal.SIGINT, signal_handler)
-        signal.signal(signal.SIGTERM, signal_handler)
+        # Let the event loop dispatch signals; fall back where it can't (Windows)
+        loop = asyncio.get_running_loop()
+        for signum in (signal.SIGINT, signal.SIGTERM):
+            try:
+                loop.add_signal_handler(signum, signal_handler)
+            except NotImplementedError:
+                signal.signal(signum, signal_handler)
 
         logger.info("Starting Telegram-OpenCode Bridge")
         logger.info(f"OpenCode URL: {self.opencode.base_url}")
@@ -1847,7 +2065,7 @@ class TelegramOpenCodeBridge:
         logger.info(f"Default Provider: {self.default_provider_id}, Default Model: {self.default_model_id}")
 
         # Clear the message queue on startup (fresh start for new OpenCode session)
-        self._clear_queue()
+        await self._clear_queue()
         
         # Also clear forwarded_ids since we're starting fresh
         old_forwarded_count = len(self.forwarded_ids)
@@ -1882,15 +2100,15 @@ class TelegramOpenCodeBridge:
         
         try:
             while self.running:
-                await self.process_queue()
+                active = await self.process_queue()
                 
                 # Periodically clean old messages from queue
                 iteration_count += 1
                 if iteration_count >= cleanup_interval:
-                    self._clear_old_messages_from_queue(max_age_seconds=300)  # 5 minutes
+                    await self._clear_old_messages_from_queue(max_age_seconds=300)  # 5 minutes
                     iteration_count = 0
                 
-                await asyncio.sleep(self.poll_interval)
+                await asyncio.sleep(self.next_poll_delay(active))
         except asyncio.CancelledError:
             logger.info("Bridge cancelled")
         finally:
@@ -1898,6 +2116,11 @@ class TelegramOpenCodeBridge:
             await self.opencode.close()
             if self.telegram:
                 await self.telegram.close()
+            # The final save below covers anything a pending debounced save would write
+            if self._state_save_task is not None and not self._state_save_task.done():
+                self._state_save_task.cancel()
+                with contextlib.suppress(asyncio.CancelledError):
+                    await self._state_save_task
             self._save_state()
 
 
@@ -2007,7 +2230,13 @@ Environment variables:
     if args.verbose:
         logging.getLogger().setLevel(logging.DEBUG)
 
-    asyncio.run(async_main(args))
+    # uvloop is an optional speedup (pip install -e ".[speedups]")
+    try:
+        import uvloop
+    except ImportError:
+        asyncio.run(async_main(args))
+    else:
+        uvloop.run(async_main(args))
 
 
 if __name__ == "__main__":
@@ -39,6 +39,51 @@ class CommandHandler:
         ("zhipuai", "glm-4.7"),
     ]
 
+    # Command name -> handler method name; resolved per call with getattr
+    COMMAND_HANDLERS = {
+        "help": "cmd_help",
+        "commands": "cmd_commands",
+        "health": "cmd_health",
+        "projects": "cmd_projects",
+        "project": "cmd_project",
+        "directory": "cmd_directory",
+        "open": "cmd_open",
+        "files": "cmd_files",
+        "read": "cmd_read",
+        "find": "cmd_find",
+        "findfile": "cmd_findfile",
+        "find-symbol": "cmd_find_symbol",
+        "find_symbol": "cmd_find_symbol",
+        "sessions": "cmd_sessions",
+        "session": "cmd_session",
+        "status": "cmd_status",
+        "prompt": "cmd_prompt",
+        "shell": "cmd_shell",
+        "diff": "cmd_diff",
+        "todo": "cmd_todo",
+        "fork": "cmd_fork",
+        "abort": "cmd_abort",
+        "delete": "cmd_delete",
+        "share": "cmd_share",
+        "unshare": "cmd_unshare",
+        "revert": "cmd_revert",
+        "unrevert": "cmd_unrevert",
+        "summarize": "cmd_summarize",
+        "config": "cmd_config",
+        "models": "cmd_models",
+        "agents": "cmd_agents",
+        "login": "cmd_login",
+        "vcs": "cmd_vcs",
+        "lsp": "cmd_lsp",
+        "formatter": "cmd_formatter",
+        "mcp": "cmd_mcp",
+        "dispose": "cmd_dispose",
+        "info": "cmd_info",
+        "messages": "cmd_messages",
+        "init": "cmd_init",
+        "pending": "cmd_pending",
+    }
+
     def __init__(
         self,
         opencode: OpenCodeClient,
@@ -182,57 +227,13 @@ class CommandHandler:
             # Not a command, return None to indicate regular prompt
             return None
 
-        # Map commands to handler methods
-        handlers = {
-            "help": self.cmd_help,
-            "commands": self.cmd_commands,
-            "health": self.cmd_health,
-            "projects": self.cmd_projects,
-            "project": self.cmd_project,
-            "directory": self.cmd_directory,
-            "open": self.cmd_open,
-            "files": self.cmd_files,
-            "read": self.cmd_read,
-            "find": self.cmd_find,
-            "findfile": self.cmd_findfile,
-            "find-symbol": self.cmd_find_symbol,
-            "find_symbol": self.cmd_find_symbol,
-            "sessions": self.cmd_sessions,
-            "session": self.cmd_session,
-            "status": self.cmd_status,
-            "prompt": self.cmd_prompt,
-            "shell": self.cmd_shell,
-            "diff": self.cmd_diff,
-            "todo": self.cmd_todo,
-            "fork": self.cmd_fork,
-            "abort": self.cmd_abort,
-            "delete": self.cmd_delete,
-            "share": self.cmd_share,
-            "unshare": self.cmd_unshare,
-            "revert": self.cmd_revert,
-            "unrevert": self.cmd_unrevert,
-            "summarize": self.cmd_summarize,
-            "config": self.cmd_config,
-            "models": self.cmd_models,
-            "agents": self.cmd_agents,
-            "login": self.cmd_login,
-            "vcs": self.cmd_vcs,
-            "lsp": self.cmd_lsp,
-            "formatter": self.cmd_formatter,
-            "mcp": self.cmd_mcp,
-            "dispose": self.cmd_dispose,
-            "info": self.cmd_info,
-            "messages": self.cmd_messages,
-            "init": self.cmd_init,
-            "pending": self.cmd_pending,
-        }
-
-        handler = handlers.get(command)
-        if not handler:
+
+        handler_name = self.COMMAND_HANDLERS.get(command)
+        if not handler_name:
             return f"❌ Unknown command: /{command}\n\nUse /help to see available commands."
 
         try:
-            return await handler(args)
+            return await getattr(self, handler_name)(args)
         except Exception as e:
             logger.error(f"Error handling command /{command}: {e}")
             return f"❌ Error executing /{command}: {str(e)[:200]}"
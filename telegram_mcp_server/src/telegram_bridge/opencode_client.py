@@ -3,22 +3,119 @@
 import asyncio
 import json
 import logging
+import time
 from typing import Any, Optional
 
 import httpx
 
 logger = logging.getLogger(__name__)
 
+# How long a /session listing is reused; bursts of messages share one lookup
+SESSION_LIST_TTL_SECONDS = 1.0
+
+# httpx clients shared by every OpenCodeClient for the same server, with the
+# number of open OpenCodeClients using each: {(loop, base_url): (client, refcount)}.
+# httpx connections belong to the event loop that opened them, so clients are
+# only shared within one loop; loop None holds clients built outside any loop,
+# which move to the running loop on first use.
+_CLIENT_POOL: dict[
+    tuple[Optional[asyncio.AbstractEventLoop], str], tuple[httpx.AsyncClient, int]
+] = {}
+
+# aclose() tasks of released clients, kept referenced until they finish
+_CLOSING_TASKS: set[asyncio.Task] = set()
+
+
+def _running_loop() -> Optional[asyncio.AbstractEventLoop]:
+    """Return the running event loop, or None outside of one."""
+    try:
+        return asyncio.get_running_loop()
+    except RuntimeError:
+        return None
+
+
+def _acquire_client(loop: Optional[asyncio.AbstractEventLoop], base_url: str) -> httpx.AsyncClient:
+    """Return the pooled httpx client for loop and base_url, creating it if needed."""
+    key = (loop, base_url)
+    client, refs = _CLIENT_POOL.get(key, (None, 0))
+    if client is None or client.is_closed:
+        client = httpx.AsyncClient(timeout=30.0, limits=httpx.Limits(max_keepalive_connections=5, max_connections=10))
+        refs = 0
+    _CLIENT_POOL[key] = (client, refs + 1)
+    return client
+
+
+def _release_client(
+    loop: Optional[asyncio.AbstractEventLoop], base_url: str, client: httpx.AsyncClient
+) -> bool:
+    """Drop one reference to a pooled client; True once nothing uses it any more."""
+    key = (loop, base_url)
+    pooled, refs = _CLIENT_POOL.get(key, (None, 0))
+    if pooled is not client:
+        return True
+    if refs > 1:
+        _CLIENT_POOL[key] = (pooled, refs - 1)
+        return False
+    del _CLIENT_POOL[key]
+    return True
+
+
+def _close_released_client(
+    loop: Optional[asyncio.AbstractEventLoop], client: httpx.AsyncClient
+) -> None:
+    """Close a released client from sync code, on the loop that owns its connections.
+
+    Clients built outside a loop never opened a connection. A client whose loop
+    has stopped or closed cannot be closed any more; its sockets go when it is
+    garbage collected.
+    """
+    if loop is None or loop.is_closed():
+        return
+    if loop is _running_loop():
+        task = loop.create_task(client.aclose())
+        _CLOSING_TASKS.add(task)
+        task.add_done_callback(_CLOSING_TASKS.discard)
+    elif loop.is_running():
+        asyncio.run_coroutine_threadsafe(client.aclose(), loop)
+
 
 class OpenCodeClient:
     """Comprehensive client for OpenCode's HTTP API."""
 
     def __init__(self, base_url: str = "http://localhost:4096"):
         self.base_url = base_url.rstrip("/")
-        self.client = httpx.AsyncClient(timeout=30.0, limits=httpx.Limits(max_keepalive_connections=5, max_connections=10))
+        self._session_url = f"{self.base_url}/session"
+        self._session_status_url = f"{self.base_url}/session/status"
+        self._loop = _running_loop()
+        self._client = _acquire_client(self._loop, self.base_url)
+        self._closed = False
+        # (monotonic fetch time, sessions) of the last /session listing
+        self._sessions_cache: tuple[float, list[dict[str, Any]]] | None = None
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """The pooled httpx client for the running event loop."""
+        loop = _running_loop()
+        if loop is not None and loop is not self._loop:
+            # e.g. first use after being built outside a loop, or a later
+            # asyncio.run(): the old client's connections cannot be reused here
+            if _release_client(self._loop, self.base_url, self._client):
+                _close_released_client(self._loop, self._client)
+            self._loop = loop
+            self._client = _acquire_client(loop, self.base_url)
+        return self._client
 
     async def close(self):
-        await self.client.aclose()
+        """Release the pooled connection, closing it once no client uses it."""
+        if self._closed:
+            return
+        self._closed = True
+        if not _release_client(self._loop, self.base_url, self._client):
+            return
+        if self._loop in (None, _running_loop()):
+            await self._client.aclose()
+        else:
+            _close_released_client(self._loop, self._client)
 
     async def health_check(self) -> dict[str, Any]:
         """Check server health and version."""
@@ -169,10 +266,15 @@ class OpenCodeClient:
 
     # Session APIs
     async def list_sessions(self) -> list[dict[str, Any]]:
-        """List all sessions."""
-        response = await self.client.get(f"{self.base_url}/session")
+        """List all sessions (reused for SESSION_LIST_TTL_SECONDS)."""
+        now = time.monotonic()
+        if self._sessions_cache and now - self._sessions_cache[0] < SESSION_LIST_TTL_SECONDS:
+            return self._sessions_cache[1]
+        response = await self.client.get(self._session_url)
         response.raise_for_status()
-        return response.json()
+        sessions = response.json()
+        self._sessions_cache = (now, sessions)
+        return sessions
 
     async def create_session(self, parent_id: Optional[str] = None, title: Optional[str] = None) -> dict[str, Any]:
         """Create a new session."""
@@ -181,13 +283,14 @@ class OpenCodeClient:
             body["parentID"] = parent_id
         if title:
             body["title"] = title
-        response = await self.client.post(f"{self.base_url}/session", json=body)
+        response = await self.client.post(self._session_url, json=body)
         response.raise_for_status()
+        self._sessions_cache = None
         return response.json()
 
     async def get_session_status(self) -> dict[str, Any]:
         """Get session status for all sessions."""
-        response = await self.client.get(f"{self.base_url}/session/status")
+        response = await self.client.get(self._session_status_url)
         response.raise_for_status()
         return response.json()
 
@@ -201,6 +304,7 @@ class OpenCodeClient:
         """Delete a session and all its data."""
         response = await self.client.delete(f"{self.base_url}/session/{session_id}")
         response.raise_for_status()
+        self._sessions_cache = None
         return True
 
     async def update_session(self, session_id: str, title: Optional[str] = None) -> dict[str, Any]:
@@ -210,6 +314,7 @@ class OpenCodeClient:
             body["title"] = title
         response = await self.client.patch(f"{self.base_url}/session/{session_id}", json=body)
         response.raise_for_status()
+        self._sessions_cache = None
         return response.json()
 
     async def get_session_children(self, session_id: str) -> list[dict[str, Any]]:
@@ -240,6 +345,7 @@ class OpenCodeClient:
             body["messageID"] = message_id
         response = await self.client.post(f"{self.base_url}/session/{session_id}/fork", json=body)
         response.raise_for_status()
+        self._sessions_cache = None
         return response.json()
 
     async def abort_session(self, session_id: str) -> bool:
@@ -571,7 +677,7 @@ class OpenCodeClient:
     async def is_server_running(self) -> bool:
         """Check if OpenCode server is running."""
         try:
-            response = await self.client.get(f"{self.base_url}/session")
+            response = await self.client.get(self._session_url)
             return response.status_code == 200
         except Exception:
             return False
@@ -626,8 +732,10 @@ class OpenCodeClient:
     async def get_or_create_telegram_session(self) -> str | None:
         """Get or create a dedicated session for Telegram messages."""
         try:
-            sessions = await self.list_sessions()
-            status = await self.get_session_status()
+            sessions, status = await asyncio.gather(
+                self.list_sessions(),
+                self.get_session_status(),
+            )
 
             # Look for an idle main session
             for session in sessions:
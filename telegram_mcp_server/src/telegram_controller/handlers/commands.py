@@ -19,6 +19,9 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger("telegram_controller.commands")
 
+# `--type TYPE` option of /open
+_TYPE_OPTION_RE = re.compile(r'--type\s+(\w+)')
+
 
 @dataclass
 class CommandResponse:
@@ -165,10 +168,10 @@ Or use `/open <path>` to connect the thread to a new project.
         path_str = args
         
         # Check for --type argument
-        type_match = re.search(r'--type\s+(\w+)', args)
+        type_match = _TYPE_OPTION_RE.search(args)
         if type_match:
             instance_type = type_match.group(1).lower()
-            path_str = re.sub(r'--type\s+\w+', '', args).strip()
+            path_str = _TYPE_OPTION_RE.sub('', args).strip()
         
         # Parse path
         path_parts = path_str.split()
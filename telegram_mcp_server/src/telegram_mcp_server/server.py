@@ -1058,11 +1058,12 @@ def run_bridge_service(
         
         try:
             while not _shutdown_event.is_set():
+                active = True
                 try:
-                    await bridge.process_queue()
+                    active = await bridge.process_queue()
                 except Exception as e:
                     logger.error(f"Bridge process error: {e}")
-                await asyncio.sleep(bridge.poll_interval)
+                await asyncio.sleep(bridge.next_poll_delay(active))
         except Exception as e:
             logger.error(f"Bridge service error: {e}")
         finally:
@@ -13,6 +13,9 @@ RETRYABLE_STATUS_CODES = {429, 500, 502, 503, 504}
 MAX_RETRIES = 3
 INITIAL_RETRY_DELAY = 0.1
 MAX_RETRY_DELAY = 5.0
+# httpx drops idle connections after 5s by default; keep them across quiet spells
+# so sends between long polls do not pay for a fresh TLS handshake
+KEEPALIVE_EXPIRY = 60.0
 
 
 @dataclass
@@ -52,7 +55,12 @@ class TelegramClient:
         self._max_retries = max_retries
         self._retry_delay = retry_delay
         # Use 60s timeout to support long polling (30s) with margin
-        self._client = httpx.AsyncClient(timeout=60.0, limits=httpx.Limits(max_keepalive_connections=5, max_connections=10))
+        self._client = httpx.AsyncClient(
+            timeout=60.0,
+            limits=httpx.Limits(
+                max_keepalive_connections=5, max_connections=10, keepalive_expiry=KEEPALIVE_EXPIRY
+            ),
+        )
         self._bot_user_id: int | None = None
 
     async def close(self) -> None:
@@ -6,6 +6,9 @@ from typing import Any, Callable, List, Optional, Tuple, Union
 
 from .errors import ErrorCategory, log_and_format_error
 
+# Telegram usernames: 5-32 chars, letter first, then alphanumerics/underscore
+_USERNAME_RE = re.compile(r"[a-zA-Z][a-zA-Z0-9_]{4,31}")
+
 
 class ValidationError(Exception):
     """Raised when input validation fails."""
@@ -55,7 +58,7 @@ def validate_single_id(
 
         # Check if it's a valid username (5+ chars, alphanumeric + underscore)
         username = value.lstrip("@")
-        if re.match(r"^[a-zA-Z][a-zA-Z0-9_]{4,31}$", username):
+        if _USERNAME_RE.fullmatch(username):
             return f"@{username}" if not value.startswith("@") else value, None
 
         return None, f"Invalid {param_name}: Must be an integer ID or valid username"
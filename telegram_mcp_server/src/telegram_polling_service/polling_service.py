@@ -11,6 +11,7 @@ import logging
 import os
 import signal
 import sys
+import tempfile
 from datetime import datetime
 from pathlib import Path
 from typing import Any
@@ -52,18 +53,26 @@ class TelegramPollingService:
         self.last_offset = self._load_offset()
 
     def _write_queue(self, messages: list[dict[str, Any]]) -> None:
-        """Write messages to queue file."""
-        loop = asyncio.get_event_loop()
-        with open(self.queue_file, "w", encoding="utf-8") as f:
-            json.dump(messages, f, indent=2, ensure_ascii=False)
+        """Write messages to queue file (atomically, so readers never see a partial file)."""
+        # A unique temp file per write, so concurrent writers never share one
+        fd, tmp_name = tempfile.mkstemp(
+            dir=self.queue_file.parent, prefix=f"{self.queue_file.name}.", suffix=".tmp"
+        )
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(messages, f, ensure_ascii=False, separators=(",", ":"))
+            os.replace(tmp_name, self.queue_file)
+        except BaseException:
+            if os.path.exists(tmp_name):
+                os.unlink(tmp_name)
+            raise
 
     def _read_queue(self) -> list[dict[str, Any]]:
         """Read messages from queue file."""
         if not self.queue_file.exists():
             return []
         try:
-            with open(self.queue_file, "r", encoding="utf-8") as f:
-                return json.load(f)
+            return json.loads(self.queue_file.read_bytes())
         except (json.JSONDecodeError, FileNotFoundError):
             return []
 
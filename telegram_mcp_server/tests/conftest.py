@@ -24,3 +24,11 @@ def sample_message_data():
         "text": "Hello, world!",
         "date": 1234567890,
     }
+
+
+@pytest.fixture
+def bridge(tmp_path):
+    """Bridge without a bot token, keeping its queue and state in a temporary directory."""
+    from telegram_bridge.bridge_service import TelegramOpenCodeBridge
+
+    return TelegramOpenCodeBridge(queue_dir=str(tmp_path), reply_to_telegram=False)
@@ -0,0 +1,264 @@
+"""Tests for bridge_service helpers."""
+
+import json
+
+from telegram_bridge.bridge_service import (
+    IDLE_POLL_MAX_SECONDS,
+    REPLY_SEPARATOR,
+    TELEGRAM_MAX_MESSAGE_LENGTH,
+    RecentIds,
+    _looks_safe_markdown,
+    _split_message,
+)
+
+
+class TestSplitMessage:
+    """Tests for _split_message function."""
+
+    def test_short_text_is_one_chunk(self):
+        """Test text within the limit is returned unchanged."""
+        assert _split_message("hello", 10) == ["hello"]
+        assert _split_message("", 10) == [""]
+
+    def test_prefers_paragraph_break(self):
+        """Test a paragraph break in the second half of a chunk is used."""
+        text = "a" * 6 + "\n\n" + "b" * 6
+        assert _split_message(text, 10) == ["a" * 6, "b" * 6]
+
+    def test_falls_back_to_line_break_then_space(self):
+        """Test line breaks win over spaces, and spaces over cutting words."""
+        assert _split_message("aaa\nbb cc dddd", 10) == ["aaa", "bb cc dddd"]
+        assert _split_message("aaaa bbbb cccc", 10) == ["aaaa bbbb", "cccc"]
+
+    def test_cuts_mid_word_as_last_resort(self):
+        """Test a run without separators is cut at the limit."""
+        assert _split_message("x" * 25, 10) == ["x" * 10, "x" * 10, "x" * 5]
+
+    def test_keeps_indentation_after_line_break(self):
+        """Test leading spaces on the next line are kept."""
+        assert _split_message("aaaaaa\n    bbbb", 10) == ["aaaaaa", "    bbbb"]
+
+    def test_drops_run_of_spaces_at_break(self):
+        """Test a run of spaces does not start the next chunk."""
+        text = "a" * 3999 + " " + " " * 10 + "b"
+        assert _split_message(text, TELEGRAM_MAX_MESSAGE_LENGTH) == ["a" * 3999, "b"]
+
+    def test_drops_whitespace_only_pieces(self):
+        """Test blank lines around a break never become a chunk of their own."""
+        text = "x" * 10 + "\n" * 5 + "y" * 10
+        chunks = _split_message(text, 12)
+        assert chunks == ["x" * 10, "y" * 10]
+
+    def test_chunks_fit_limit(self):
+        """Test every chunk of a long mixed text fits the limit."""
+        text = ("word " * 50 + "\n") * 100
+        chunks = _split_message(text, 300)
+        assert all(0 < len(chunk) <= 300 for chunk in chunks)
+        assert all(chunk.strip() for chunk in chunks)
+
+
+class TestReadQueue:
+    """Tests for TelegramOpenCodeBridge._read_queue."""
+
+    async def test_unchanged_file_is_not_reparsed(self, bridge):
+        """Test an unchanged queue file, even an empty one, is only stat'ed."""
+        bridge.queue_file.write_text("[]", encoding="utf-8")
+        first = await bridge._read_queue()
+
+        assert first == []
+        assert await bridge._read_queue() is first
+
+    async def test_changed_file_is_reparsed(self, bridge):
+        """Test a rewritten queue file is read again."""
+        bridge.queue_file.write_text("[]", encoding="utf-8")
+        await bridge._read_queue()
+        messages = [{"message_id": 1, "text": "hi"}]
+        bridge.queue_file.write_text(json.dumps(messages), encoding="utf-8")
+
+        assert await bridge._read_queue() == messages
+
+
+class FakeTelegram:
+    """Records messages instead of sending them."""
+
+    def __init__(self):
+        self.sent: list[tuple[int, str]] = []
+
+    async def send_message(self, chat_id: int, text: str) -> None:
+        self.sent.append((chat_id, text))
+
+
+class TestFlushReplies:
+    """Tests for TelegramOpenCodeBridge._flush_replies."""
+
+    async def test_joins_consecutive_replies_per_chat(self, bridge):
+        """Test runs of replies to one chat are sent as one message."""
+        bridge.telegram = FakeTelegram()
+        bridge._pending_replies = [(1, "a"), (1, "b"), (2, "c"), (1, "d")]
+
+        await bridge._flush_replies()
+
+        assert bridge.telegram.sent == [
+            (1, f"a{REPLY_SEPARATOR}b"),
+            (2, "c"),
+            (1, "d"),
+        ]
+        assert bridge._pending_replies == []
+
+    async def test_splits_groups_at_message_limit(self, bridge):
+        """Test a group is closed before it would exceed one message."""
+        bridge.telegram = FakeTelegram()
+        long_reply = "x" * (TELEGRAM_MAX_MESSAGE_LENGTH - 10)
+        bridge._pending_replies = [(1, long_reply), (1, "short reply")]
+
+        await bridge._flush_replies()
+
+        assert bridge.telegram.sent == [(1, long_reply), (1, "short reply")]
+
+
+class TestRemoveFromQueue:
+    """Tests for TelegramOpenCodeBridge._remove_from_queue."""
+
+    async def test_keeps_messages_appended_since_last_read(self, bridge):
+        """Test messages the poller appended after the last read survive the rewrite."""
+        first, second, third = ({"message_id": i, "text": f"m{i}"} for i in (1, 2, 3))
+        bridge.queue_file.write_text(json.dumps([first, second]), encoding="utf-8")
+        await bridge._read_queue()
+        # The poller appends while the bridge still holds its cached copy
+        bridge.queue_file.write_text(json.dumps([first, second, third]), encoding="utf-8")
+
+        await bridge._remove_from_queue({1})
+
+        assert json.loads(bridge.queue_file.read_text(encoding="utf-8")) == [second, third]
+        assert await bridge._read_queue() == [second, third]
+
+    async def test_leaves_no_temp_files(self, bridge):
+        """Test rewriting the queue leaves only the queue file behind."""
+        bridge.queue_file.write_text(json.dumps([{"message_id": 1}]), encoding="utf-8")
+
+        await bridge._remove_from_queue({1})
+
+        assert [path.name for path in bridge.queue_dir.iterdir()] == ["message_inbox.json"]
+
+
+class TestRecentIds:
+    """Tests for RecentIds class."""
+
+    def test_membership(self):
+        """Test added IDs are members."""
+        ids = RecentIds([1, 2])
+        ids.add(3)
+        assert 1 in ids and 3 in ids
+        assert 4 not in ids
+
+    def test_evicts_oldest(self):
+        """Test the oldest IDs are evicted beyond maxlen."""
+        ids = RecentIds(range(5), maxlen=3)
+        assert list(ids) == [2, 3, 4]
+
+    def test_readding_keeps_size(self):
+        """Test adding a known ID does not grow the set."""
+        ids = RecentIds([1, 2, 3], maxlen=3)
+        ids.add(2)
+        assert len(ids) == 3
+        assert 1 in ids
+
+
+class TestStateFile:
+    """Tests for saving bridge state."""
+
+    def test_older_snapshot_never_replaces_newer(self, bridge):
+        """Test a snapshot written late, e.g. by a slow worker thread, is dropped."""
+        bridge.session_id = "old"
+        old_snapshot = bridge._serialize_state()
+        bridge.session_id = "new"
+        bridge._save_state()
+
+        bridge._write_state_file(*old_snapshot)
+
+        state = json.loads(bridge.bridge_state_file.read_text(encoding="utf-8"))
+        assert state["session_id"] == "new"
+
+    async def test_debounced_save_writes_latest_state(self, bridge, monkeypatch):
+        """Test bursts of changes are saved once, with the latest values."""
+        monkeypatch.setattr("telegram_bridge.bridge_service.STATE_SAVE_DEBOUNCE_SECONDS", 0)
+        bridge.session_id = "first"
+        await bridge._schedule_save_state()
+        bridge.session_id = "second"
+        await bridge._schedule_save_state()
+
+        await bridge._state_save_task
+
+        state = json.loads(bridge.bridge_state_file.read_text(encoding="utf-8"))
+        assert state["session_id"] == "second"
+        assert [path.name for path in bridge.queue_dir.iterdir()] == ["bridge_state.json"]
+
+
+class TestProcessQueue:
+    """Tests for TelegramOpenCodeBridge.process_queue."""
+
+    async def test_skips_snapshot_with_nothing_new(self, bridge):
+        """Test a scanned snapshot stays skipped, even once its IDs are evicted."""
+        bridge.queue_file.write_text(json.dumps([{"message_id": 1}]), encoding="utf-8")
+        bridge.forwarded_ids.add(1)
+
+        assert await bridge.process_queue() is False
+        scanned = bridge._scanned_queue
+        assert scanned is not None
+
+        bridge.forwarded_ids.clear()
+        assert await bridge.process_queue() is False
+        assert bridge._scanned_queue is scanned
+
+    async def test_rescans_changed_file(self, bridge):
+        """Test a rewritten queue file is scanned again."""
+        bridge.queue_file.write_text(json.dumps([{"message_id": 1}]), encoding="utf-8")
+        bridge.forwarded_ids.add(1)
+        await bridge.process_queue()
+        scanned = bridge._scanned_queue
+
+        bridge.forwarded_ids.add(2)
+        messages = [{"message_id": 1}, {"message_id": 2}]
+        bridge.queue_file.write_text(json.dumps(messages), encoding="utf-8")
+        bridge._last_queue_read_time = None
+
+        assert await bridge.process_queue() is False
+        assert bridge._scanned_queue is not scanned
+        assert bridge._scanned_queue == messages
+
+
+class TestNextPollDelay:
+    """Tests for TelegramOpenCodeBridge.next_poll_delay."""
+
+    def test_backs_off_while_idle(self, bridge):
+        """Test the delay grows while idle, up to the ceiling."""
+        delays = [bridge.next_poll_delay(False) for _ in range(20)]
+        assert delays == sorted(delays)
+        assert delays[0] > bridge.poll_interval
+        assert delays[-1] == IDLE_POLL_MAX_SECONDS
+
+    def test_resets_when_active(self, bridge):
+        """Test activity drops the delay back to the poll interval."""
+        for _ in range(5):
+            bridge.next_poll_delay(False)
+        assert bridge.next_poll_delay(True) == bridge.poll_interval
+
+
+class TestLooksSafeMarkdown:
+    """Tests for _looks_safe_markdown function."""
+
+    def test_balanced_entities(self):
+        """Test balanced bold, italic and code are accepted."""
+        assert _looks_safe_markdown("*bold* and _italic_ and `code`")
+        assert _looks_safe_markdown("plain text")
+
+    def test_unbalanced_entities(self):
+        """Test an odd number of markers or a stray backtick is rejected."""
+        assert not _looks_safe_markdown("snake_case name")
+        assert not _looks_safe_markdown("2 * 3")
+        assert not _looks_safe_markdown("a ` b")
+
+    def test_markers_inside_code_are_ignored(self):
+        """Test markers inside code spans and blocks do not count."""
+        assert _looks_safe_markdown("`snake_case`")
+        assert _looks_safe_markdown("```\nx = a * b\n```")
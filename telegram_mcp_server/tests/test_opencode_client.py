@@ -0,0 +1,102 @@
+"""Tests for the OpenCode client's shared connection pool."""
+
+import asyncio
+import threading
+
+import pytest
+
+from telegram_bridge import opencode_client
+from telegram_bridge.opencode_client import OpenCodeClient
+
+BASE_URL = "http://localhost:4096"
+
+
+@pytest.fixture(autouse=True)
+def empty_pool(monkeypatch):
+    """Give each test its own client pool."""
+    monkeypatch.setattr(opencode_client, "_CLIENT_POOL", {})
+
+
+class TestClientPool:
+    """Tests for pooled httpx clients."""
+
+    def test_shared_within_one_loop(self):
+        """Test clients for the same server on one loop share an httpx client."""
+
+        async def main():
+            first = OpenCodeClient(BASE_URL)
+            second = OpenCodeClient(BASE_URL + "/")
+            other = OpenCodeClient("http://localhost:5000")
+            assert first.client is second.client
+            assert other.client is not first.client
+            for client in (first, second, other):
+                await client.close()
+
+        asyncio.run(main())
+
+    def test_close_is_refcounted(self):
+        """Test the shared client is only closed when its last user closes."""
+
+        async def main():
+            first = OpenCodeClient(BASE_URL)
+            second = OpenCodeClient(BASE_URL)
+            shared = first.client
+
+            await first.close()
+            await first.close()  # closing twice must not drop a second reference
+            assert not shared.is_closed
+            assert second.client is shared
+
+            await second.close()
+            assert shared.is_closed
+            assert opencode_client._CLIENT_POOL == {}
+
+        asyncio.run(main())
+
+    def test_fresh_client_after_second_run(self):
+        """Test a client built outside a loop gets a new httpx client per asyncio.run()."""
+        client = OpenCodeClient(BASE_URL)
+
+        async def current():
+            return client.client
+
+        first = asyncio.run(current())
+        second = asyncio.run(current())
+
+        assert second is not first
+        assert not second.is_closed
+        assert list(opencode_client._CLIENT_POOL.values()) == [(second, 1)]
+
+        async def use_and_close():
+            third = client.client
+            await client.close()
+            return third
+
+        third = asyncio.run(use_and_close())
+        assert third is not second
+        assert third.is_closed
+        assert opencode_client._CLIENT_POOL == {}
+
+    def test_released_client_closed_on_its_own_loop(self):
+        """Test moving to another loop closes the old client on the loop that owns it."""
+        other_loop = asyncio.new_event_loop()
+        thread = threading.Thread(target=other_loop.run_forever, daemon=True)
+        thread.start()
+        try:
+            client = OpenCodeClient(BASE_URL)
+
+            async def current():
+                return client.client
+
+            old = asyncio.run_coroutine_threadsafe(current(), other_loop).result(5)
+            new = asyncio.run(current())
+            # The old client's aclose() was handed to its still-running loop
+            asyncio.run_coroutine_threadsafe(asyncio.sleep(0.1), other_loop).result(5)
+
+            assert new is not old
+            assert old.is_closed
+            asyncio.run(client.close())
+        finally:
+            other_loop.call_soon_threadsafe(other_loop.stop)
+            thread.join(5)
+            other_loop.close()